@@ -0,0 +1,64 @@
+"""Scoring time and peak memory of the transformation models.
+
+The "before" numbers reproduce the previous scoring code which called
+`predict_proba` once per response group, the "after" numbers use `predict`
+with and without `chunk_size`.
+"""
+import time
+import tracemalloc
+import numpy as np
+from sklearn.linear_model import LogisticRegression
+from pyuplift.datasets import make_linear_regression
+from pyuplift.transformation import Kane, Reflective
+
+
+def measure(func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 2 ** 20
+
+
+def kane_before(model, X):
+    p_tr = model.model.predict_proba(X)[:, 0]
+    p_cn = model.model.predict_proba(X)[:, 1]
+    p_tn = model.model.predict_proba(X)[:, 2]
+    p_cr = model.model.predict_proba(X)[:, 3]
+    return (p_tr + p_cn) - (p_tn + p_cr)
+
+
+def reflective_before(model, X):
+    p_tr = model.model.predict_proba(X)[:, 0]
+    p_cn = model.model.predict_proba(X)[:, 1]
+    p_tn = model.model.predict_proba(X)[:, 2]
+    p_cr = model.model.predict_proba(X)[:, 3]
+    return (model.p_tlr * p_tr + model.p_cln * p_cn) - (model.p_tln * p_tn + model.p_clr * p_cr)
+
+
+def main(train_size=100000, test_size=2000000, chunk_size=100000):
+    df = make_linear_regression(train_size + test_size)
+    X = df.drop(['y', 't'], axis=1).values
+    y, t = df['y'].values, df['t'].values
+    X_train, X_test = X[:train_size], X[train_size:]
+
+    for name, model, before in [
+        ('Kane', Kane(LogisticRegression()), kane_before),
+        ('Reflective', Reflective(LogisticRegression()), reflective_before),
+    ]:
+        model.fit(X_train, y[:train_size], t[:train_size])
+        out = np.empty(test_size)
+        runs = [
+            ('before', lambda: before(model, X_test)),
+            ('after', lambda: model.predict(X_test)),
+            ('after, chunked', lambda: model.predict(X_test, chunk_size=chunk_size, out=out)),
+        ]
+        for label, func in runs:
+            elapsed, peak = measure(func)
+            print('{:<12}{:<16}{:>8.3f} s{:>10.1f} MiB'.format(name, label, elapsed, peak))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,29 @@
+"""Wall-clock training and scoring time of TwoModel with sequential and parallel sub-models."""
+import time
+from sklearn.ensemble import RandomForestRegressor
+from pyuplift.datasets import make_linear_regression
+from pyuplift.variable_selection import TwoModel
+
+
+def main(size=200000, n_estimators=30):
+    df = make_linear_regression(size)
+    X, y, t = df.drop(['y', 't'], axis=1).values, df['y'].values, df['t'].values
+
+    for n_jobs, prefer in [(None, 'threads'), (2, 'threads'), (2, 'processes')]:
+        model = TwoModel(
+            RandomForestRegressor(n_estimators=n_estimators, max_depth=12, random_state=0),
+            RandomForestRegressor(n_estimators=n_estimators, max_depth=12, random_state=0),
+            n_jobs=n_jobs,
+            prefer=prefer
+        )
+        start = time.perf_counter()
+        model.fit(X, y, t)
+        fit_time = time.perf_counter() - start
+        start = time.perf_counter()
+        model.predict(X)
+        predict_time = time.perf_counter() - start
+        print('n_jobs={!s:<6}{:<11}fit {:>7.2f} s   predict {:>6.2f} s'.format(n_jobs, prefer, fit_time, predict_time))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""Training time and peak memory of UpliftGradientBoosting against TwoModel with two HistGradientBoostingRegressor.
+
+Every model is trained in a fresh process, the peak memory is the maximum resident set size of this process.
+Run with `criteo` as an argument to use a sample of the Criteo dataset instead of synthetic data,
+the optional second argument is the number of rows.
+"""
+import sys
+import time
+import resource
+import multiprocessing
+import numpy as np
+from sklearn.ensemble import HistGradientBoostingRegressor
+from pyuplift.datasets import load_criteo_uplift_prediction
+from pyuplift.tree import UpliftGradientBoosting
+from pyuplift.variable_selection import TwoModel
+
+
+def make_data(n_samples, n_features=12, random_state=0):
+    rng = np.random.RandomState(random_state)
+    X = rng.normal(size=(n_samples, n_features)).astype(np.float32)
+    t = rng.randint(0, 2, n_samples)
+    y = (rng.uniform(size=n_samples) < 0.05 + 0.02 * t * (X[:, 0] > 0)).astype(int)
+    return X, y, t
+
+
+def load_criteo(n_samples):
+    dataset = load_criteo_uplift_prediction()
+    rows = np.random.RandomState(0).choice(dataset['target'].shape[0], n_samples, replace=False)
+    return dataset['data'][rows].astype(np.float32), dataset['target_visit'][rows], dataset['treatment'][rows]
+
+
+def make_model(label, max_iter):
+    if label == 'boosting':
+        return UpliftGradientBoosting(max_iter=max_iter, max_depth=5, n_jobs=-1)
+    return TwoModel(
+        HistGradientBoostingRegressor(max_iter=max_iter, max_depth=5, early_stopping=False),
+        HistGradientBoostingRegressor(max_iter=max_iter, max_depth=5, early_stopping=False)
+    )
+
+
+def run(label, name, n_samples, max_iter, queue):
+    X, y, t = load_criteo(n_samples) if name == 'criteo' else make_data(n_samples)
+    start_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    model = make_model(label, max_iter)
+    start = time.perf_counter()
+    model.fit(X, y, t)
+    elapsed = time.perf_counter() - start
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    queue.put((elapsed, (peak_rss - start_rss) / 2 ** 10))
+
+
+def main(name='synthetic', n_samples=1000000, max_iter=100):
+    context = multiprocessing.get_context('spawn')
+    for label in ['boosting', 'TwoModel']:
+        queue = context.Queue()
+        process = context.Process(target=run, args=(label, name, n_samples, max_iter, queue))
+        process.start()
+        elapsed, peak = queue.get()
+        process.join()
+        print('{:<10}fit {:>7.2f} s   peak memory over the data {:>8.1f} MiB'.format(label, elapsed, peak))
+
+
+if __name__ == '__main__':
+    main(
+        sys.argv[1] if len(sys.argv) > 1 else 'synthetic',
+        int(sys.argv[2]) if len(sys.argv) > 2 else 1000000
+    )
@@ -0,0 +1,62 @@
+"""Training time and peak memory of UpliftRandomForestClassifier against TwoModel with two sklearn forests.
+
+The peak memory is traced in the main process only. The forest passes the binned features to the
+worker processes as a memory-mapped file, so the workers do not hold copies of X.
+Run with `criteo` as an argument to use a sample of the Criteo dataset instead of synthetic data,
+the optional second argument is the number of rows.
+"""
+import sys
+import time
+import tracemalloc
+import numpy as np
+from sklearn.ensemble import RandomForestRegressor
+from pyuplift.datasets import load_criteo_uplift_prediction
+from pyuplift.tree import UpliftRandomForestClassifier
+from pyuplift.variable_selection import TwoModel
+
+
+def make_data(n_samples, n_features=12, random_state=0):
+    rng = np.random.RandomState(random_state)
+    X = rng.normal(size=(n_samples, n_features))
+    t = rng.randint(0, 2, n_samples)
+    y = (rng.uniform(size=n_samples) < 0.05 + 0.02 * t * (X[:, 0] > 0)).astype(int)
+    return X, y, t
+
+
+def load_criteo(n_samples):
+    dataset = load_criteo_uplift_prediction()
+    rows = np.random.RandomState(0).choice(dataset['target'].shape[0], n_samples, replace=False)
+    return dataset['data'][rows].astype(np.float64), dataset['target_visit'][rows], dataset['treatment'][rows]
+
+
+def measure(func):
+    tracemalloc.start()
+    start = time.perf_counter()
+    func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / 2 ** 20
+
+
+def main(name='synthetic', n_samples=1000000, n_estimators=20, max_depth=8, n_jobs=-1):
+    X, y, t = load_criteo(n_samples) if name == 'criteo' else make_data(n_samples)
+    models = [
+        ('forest', UpliftRandomForestClassifier(n_estimators, max_depth=max_depth, n_jobs=n_jobs, random_state=0)),
+        ('TwoModel', TwoModel(
+            RandomForestRegressor(n_estimators, max_depth=max_depth, min_samples_leaf=100, n_jobs=n_jobs),
+            RandomForestRegressor(n_estimators, max_depth=max_depth, min_samples_leaf=100, n_jobs=n_jobs)
+        )),
+    ]
+    for label, model in models:
+        fit_time, fit_peak = measure(lambda: model.fit(X, y, t))
+        predict_time, predict_peak = measure(lambda: model.predict(X))
+        print('{:<10}fit {:>7.2f} s {:>8.1f} MiB   predict {:>6.2f} s {:>8.1f} MiB'.format(
+            label, fit_time, fit_peak, predict_time, predict_peak))
+
+
+if __name__ == '__main__':
+    main(
+        sys.argv[1] if len(sys.argv) > 1 else 'synthetic',
+        int(sys.argv[2]) if len(sys.argv) > 2 else 1000000
+    )
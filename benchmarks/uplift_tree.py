@@ -0,0 +1,61 @@
+"""Training and scoring time of UpliftTreeClassifier on the Hillstrom and Criteo datasets.
+
+The datasets are downloaded on the first run. The target is `visit`, every e-mail of
+the Hillstrom dataset is a treatment. TwoModel with two sklearn decision trees
+of the same depth is the reference. Run with `criteo` as an argument to use the Criteo
+dataset, the optional second argument is the number of rows sampled from it.
+"""
+import sys
+import time
+import numpy as np
+from sklearn.tree import DecisionTreeRegressor
+from pyuplift.datasets import load_criteo_uplift_prediction, load_hillstrom_email_marketing
+from pyuplift.metrics import get_average_effect
+from pyuplift.model_selection import train_test_split
+from pyuplift.tree import UpliftTreeClassifier
+from pyuplift.variable_selection import TwoModel
+
+
+def load(name, n_samples=None):
+    if name == 'hillstrom':
+        dataset = load_hillstrom_email_marketing()
+    else:
+        dataset = load_criteo_uplift_prediction()
+    X = dataset['data'].astype(np.float64)
+    y, t = dataset['target_visit'], (dataset['treatment'] != 0).astype(int)
+    if n_samples is not None and n_samples < y.shape[0]:
+        rows = np.random.RandomState(0).choice(y.shape[0], n_samples, replace=False)
+        X, y, t = X[rows], y[rows], t[rows]
+    return X, y, t
+
+
+def main(name='hillstrom', n_samples=None, max_depth=6):
+    X, y, t = load(name, n_samples)
+    X_train, X_test, y_train, y_test, t_train, t_test = train_test_split(X, y, t, random_state=0)
+    print('{}: {} train rows, {} test rows'.format(name, y_train.shape[0], y_test.shape[0]))
+
+    models = [
+        ('tree, ' + criterion, UpliftTreeClassifier(criterion=criterion, max_depth=max_depth, random_state=0))
+        for criterion in ['kl', 'ed', 'chi']
+    ]
+    models.append(('TwoModel', TwoModel(
+        DecisionTreeRegressor(max_depth=max_depth, min_samples_leaf=100),
+        DecisionTreeRegressor(max_depth=max_depth, min_samples_leaf=100)
+    )))
+    for label, model in models:
+        start = time.perf_counter()
+        model.fit(X_train, y_train, t_train)
+        fit_time = time.perf_counter() - start
+        start = time.perf_counter()
+        uplift = model.predict(X_test)
+        predict_time = time.perf_counter() - start
+        effect = get_average_effect(y_test, t_test, uplift)
+        print('{:<12}fit {:>7.2f} s   predict {:>6.2f} s   average effect {:.5f}'.format(
+            label, fit_time, predict_time, effect))
+
+
+if __name__ == '__main__':
+    main(
+        sys.argv[1] if len(sys.argv) > 1 else 'hillstrom',
+        int(sys.argv[2]) if len(sys.argv) > 2 else 1000000
+    )
@@ -1,3 +1,6 @@
+import inspect
+
+
 class BaseModel:
     """Base class for uplift models.
 
@@ -36,3 +39,33 @@ class BaseModel:
             The predicted treatment effects.
         """
         pass
+
+    def get_params(self, deep=True):
+        """Get the parameters of the model, i.e. the arguments of its constructor.
+
+        Parameters
+        ----------
+        deep : boolean, optional (default=True)
+            Also return the parameters of the inner models as `<argument>__<parameter>`.
+        Returns
+        -------
+        params : dict
+            The values of the arguments of the constructor.
+        """
+        params = {}
+        for name in inspect.signature(type(self).__init__).parameters:
+            if name == 'self':
+                continue
+            value = getattr(self, name)
+            params[name] = value
+            if deep and hasattr(value, 'get_params') and not isinstance(value, type):
+                for key, inner_value in value.get_params(deep=True).items():
+                    params[name + '__' + key] = inner_value
+        return params
+
+    def _check_partial_fit(self, model, name='Model'):
+        """Raise ValueError if `model` can not be trained incrementally."""
+        try:
+            model.__getattribute__('partial_fit')
+        except AttributeError:
+            raise ValueError(name + ' should contains partial_fit method.')
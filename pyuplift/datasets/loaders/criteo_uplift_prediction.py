@@ -1,7 +1,14 @@
 import os
+from contextlib import ExitStack
 import numpy as np
 import pandas as pd
-from pyuplift.utils import download_file, retrieve_from_gz
+from pyuplift.utils import NpyWriter, download_file, iter_gz_csv_chunks
+from .manifest import _get_sha256
+from .sampling import _check_sampling_params, _sample_rows
+
+TARGETS = ('visit', 'conversion', 'exposure')
+# The number of rows parsed at once while the cache is built
+CHUNK_SIZE = 1000000
 
 
 def download_criteo_uplift_prediction(
@@ -10,6 +17,9 @@ def download_criteo_uplift_prediction(
 ):
     """Downloading the Criteo Uplift Prediction dataset.
 
+    The archive is parsed while it is decompressed and converted into the binary cache which is loaded by
+    `load_criteo_uplift_prediction`, the CSV file is never written to disk.
+
     ****************
     Data description
     ****************
@@ -58,18 +68,33 @@ def download_criteo_uplift_prediction(
         os.makedirs(data_home)
 
     archive_path = dataset_path.replace('.csv', '.gz')
-    if not os.path.exists(dataset_path):
+    cache_paths = __get_cache_paths(data_home)
+    if not all(os.path.exists(path) for path in cache_paths.values()):
         if not os.path.exists(archive_path):
-            download_file(url, archive_path)
-        retrieve_from_gz(archive_path, dataset_path)
+            download_file(url, archive_path, sha256=_get_sha256(url))
+        __build_cache(archive_path, cache_paths)
 
 
 def load_criteo_uplift_prediction(
     data_home=None,
-    download_if_missing=True
+    download_if_missing=True,
+    targets=TARGETS,
+    n_samples=None,
+    fraction=None,
+    random_state=None
 ):
     """Loading the Criteo Uplift Prediction dataset from the local file.
 
+    The first loading converts the CSV file into the binary cache of `.npy` files in `data_home`:
+    float32 features and int8 treatment and targets. The next loadings map the cache into memory,
+    so the arrays are read from disk only when they are used, and the targets which are not in `targets`
+    are never read.
+
+    If `n_samples` or `fraction` is set, a random subset of the rows is selected from the cache,
+    stratified by the treatment and by `dataset.target`. Only the treatment and the target are read in full,
+    block by block, the other arrays are read only at the selected rows.
+    Every non-empty stratum keeps at least one row, so `n_samples` should not be less than the number of strata.
+
     ****************
     Data description
     ****************
@@ -109,6 +134,14 @@ def load_criteo_uplift_prediction(
         By default the dataset will be stored in the data folder in the same folder.
     download_if_missing : bool, optional (default=True)
         Download the dataset if it is not downloaded.
+    targets : tuple of str, optional (default=('visit', 'conversion', 'exposure'))
+        The targets which will be loaded, the first one is `dataset.target`.
+    n_samples : int, optional (default=None)
+        The number of randomly selected rows. None means all rows.
+    fraction : float, optional (default=None)
+        The share of randomly selected rows. None means all rows.
+    random_state : int, optional (default=None)
+        The seed used by the random number generator of the sampling.
 
     Returns
     -------
@@ -117,7 +150,7 @@ def load_criteo_uplift_prediction(
     dataset.description : str
         Description of the Criteo Uplift Prediction dataset.
 
-    dataset.data : ndarray, shape (25309483, 11)
+    dataset.data : read-only memory-mapped ndarray of float32, shape (25309483, 11)
         Each row corresponding to the 11 feature values in order.
 
     dataset.feature_names : list, size 11
@@ -128,6 +161,8 @@ def load_criteo_uplift_prediction(
 
     dataset.target : numpy array of shape (25309483,)
         Each value corresponds to one of the outcomes. By default, it's `visit` outcome (look at `target_visit` below).
+        The treatment and the targets are read-only memory-mapped arrays of int8.
+        Only the targets from `targets` are returned.
 
     dataset.target_visit : numpy array of shape (25309483,)
         Each value corresponds to whether a visit occurred for this user (binary, label).
@@ -137,11 +172,26 @@ def load_criteo_uplift_prediction(
 
     dataset.target_conversion : numpy array of shape (25309483,)
         Each value corresponds to whether a conversion occurred for this user (binary, label).
+
+    dataset.sample_weight : numpy array of shape (n_samples,)
+        Only if `n_samples` or `fraction` is set. The size of the stratum of every selected row divided by
+        the number of its selected rows, the weighted sums over the subset are unbiased estimates
+        of the sums over the dataset. The arrays of the subset are loaded in memory.
     """
 
+    _check_sampling_params(n_samples, fraction)
+    if isinstance(targets, str):
+        targets = (targets,)
+    if len(targets) == 0 or any(target not in TARGETS for target in targets):
+        raise ValueError('Targets should be a non-empty subset of {}.'.format(TARGETS))
+
     data_home, dataset_path = __get_data_home_dataset_file_paths(data_home)
-    if not os.path.exists(dataset_path):
-        if download_if_missing:
+    cache_paths = __get_cache_paths(data_home)
+    if not all(os.path.exists(path) for path in cache_paths.values()):
+        archive_path = dataset_path.replace('.csv', '.gz')
+        if os.path.exists(dataset_path):
+            __build_cache(dataset_path, cache_paths)
+        elif os.path.exists(archive_path) or download_if_missing:
             download_criteo_uplift_prediction(data_home)
         else:
             raise FileNotFoundError(
@@ -149,27 +199,61 @@ def load_criteo_uplift_prediction(
                 'Use `download_criteo_uplift_prediction` function to download the dataset.'
             )
 
-    df = pd.read_csv(dataset_path)
     description = 'This dataset is constructed by assembling data resulting from several incrementality tests, ' \
                   'a particular randomized trial procedure where a random part of the population' \
                   'is prevented from being targeted by advertising. It consists of 25M rows, ' \
                   'each one representing a user with 11 features, a treatment indicator and ' \
                   '2 labels (visits and conversions).'
 
-    drop_names = ['exposure', 'visit', 'conversion', 'treatment']
     dataset = {
         'description': description,
-        'data': df.drop(drop_names, axis=1).values,
-        'feature_names': np.array([name for name in df.columns if name not in drop_names]),
-        'treatment': df['treatment'].values,
-        'target': df['visit'].values,
-        'target_visit': df['visit'].values,
-        'target_exposure': df['exposure'].values,
-        'target_conversion': df['conversion'].values,
+        'data': np.load(cache_paths['data'], mmap_mode='r'),
+        'feature_names': np.load(cache_paths['feature_names']),
+        'treatment': np.load(cache_paths['treatment'], mmap_mode='r'),
     }
+    for target in targets:
+        dataset['target_' + target] = np.load(cache_paths[target], mmap_mode='r')
+    dataset['target'] = dataset['target_' + targets[0]]
+
+    if n_samples is not None or fraction is not None:
+        treatment, target = dataset['treatment'], dataset['target']
+        indices, dataset['sample_weight'] = _sample_rows(
+            lambda: ((treatment[i:i + CHUNK_SIZE], target[i:i + CHUNK_SIZE]) for i in range(0, treatment.shape[0], CHUNK_SIZE)),
+            treatment.shape[0], n_samples, fraction, random_state
+        )
+        for name in ['data', 'treatment'] + ['target_' + target for target in targets]:
+            dataset[name] = dataset[name][indices]
+        dataset['target'] = dataset['target_' + targets[0]]
     return dataset
 
 
+def __build_cache(dataset_path, cache_paths):
+    """Convert the CSV file or its gz archive into the `.npy` files of the features, of the treatment and of every target."""
+    columns = pd.read_csv(dataset_path, nrows=0).columns
+    label_names = ('treatment',) + TARGETS
+    feature_names = [name for name in columns if name not in label_names]
+    dtype = {name: np.float32 for name in feature_names}
+    dtype.update({name: np.int8 for name in label_names})
+
+    with ExitStack() as stack:
+        data_writer = stack.enter_context(NpyWriter(cache_paths['data'], np.float32, len(feature_names)))
+        label_writers = {name: stack.enter_context(NpyWriter(cache_paths[name], np.int8)) for name in label_names}
+        if dataset_path.endswith('.gz'):
+            chunks = iter_gz_csv_chunks(dataset_path, chunk_size=CHUNK_SIZE, dtype=dtype)
+        else:
+            chunks = pd.read_csv(dataset_path, dtype=dtype, chunksize=CHUNK_SIZE)
+        for df in chunks:
+            data_writer.write(df[feature_names].values)
+            for name, writer in label_writers.items():
+                writer.write(df[name].values)
+    np.save(cache_paths['feature_names'], np.array(feature_names))
+
+
+def __get_cache_paths(data_home_path):
+    names = ('data', 'feature_names', 'treatment') + TARGETS
+    return {name: os.path.join(data_home_path, 'criteo_uplift_prediction_{}.npy'.format(name)) for name in names}
+
+
 def __get_data_home_dataset_file_paths(data_home_path):
     if data_home_path is None:
         data_home_path = os.path.join(os.sep.join(__file__.split(os.sep)[:-1]), 'data')
@@ -2,6 +2,8 @@ import os
 import numpy as np
 import pandas as pd
 from pyuplift.utils import download_file
+from .manifest import _get_sha256
+from .sampling import _check_sampling_params, _sample_rows
 
 
 def download_hillstrom_email_marketing(
@@ -56,13 +58,16 @@ def download_hillstrom_email_marketing(
         os.makedirs(data_home)
 
     if not os.path.exists(dataset_path):
-        download_file(url, dataset_path)
+        download_file(url, dataset_path, sha256=_get_sha256(url))
 
 
 def load_hillstrom_email_marketing(
     data_home=None,
     load_raw_data=False,
-    download_if_missing=True
+    download_if_missing=True,
+    n_samples=None,
+    fraction=None,
+    random_state=None
 ):
     """Loading the Hillstrom Email Marketing dataset from the local file.
 
@@ -79,6 +84,10 @@ def load_hillstrom_email_marketing(
     During a period of two weeks following the e-mail campaign, results were tracked.
     Your job is to tell the world if the Mens or Womens e-mail campaign was successful.
 
+    If `n_samples` or `fraction` is set, a random subset of the rows is selected,
+    stratified by the treatment and by whether the spend is not zero.
+    Every non-empty stratum keeps at least one row, so `n_samples` should not be less than the number of strata.
+
     +--------------------------+------------+
     |Features                  |          8 |
     +--------------------------+------------+
@@ -105,6 +114,12 @@ def load_hillstrom_email_marketing(
         By default the dataset will be stored in the data folder in the same folder.
     download_if_missing : bool, optional (default=True)
         Download the dataset if it is not downloaded.
+    n_samples : int, optional (default=None)
+        The number of randomly selected rows. None means all rows.
+    fraction : float, optional (default=None)
+        The share of randomly selected rows. None means all rows.
+    random_state : int, optional (default=None)
+        The seed used by the random number generator of the sampling.
 
     Returns
     -------
@@ -133,8 +148,14 @@ def load_hillstrom_email_marketing(
 
     dataset.target_conversion : numpy array of shape (64000,)
         Each value corresponds to whether they purchased at the site (“conversion”) during a two-week outcome period.
+
+    dataset.sample_weight : numpy array of shape (n_samples,)
+        Only if `n_samples` or `fraction` is set. The size of the stratum of every selected row divided by
+        the number of its selected rows, the weighted sums over the subset are unbiased estimates
+        of the sums over the dataset.
     """
 
+    _check_sampling_params(n_samples, fraction)
     data_home, dataset_path = __get_data_home_dataset_file_paths(data_home)
     if not os.path.exists(dataset_path):
         if download_if_missing:
@@ -148,6 +169,11 @@ def load_hillstrom_email_marketing(
     df = pd.read_csv(dataset_path)
     if not load_raw_data:
         df = __encode_data(df)
+    if n_samples is not None or fraction is not None:
+        indices, sample_weight = _sample_rows(
+            lambda: [(df['segment'].values, df['spend'].values)], df.shape[0], n_samples, fraction, random_state
+        )
+        df = df.iloc[indices]
 
     description = 'This dataset contains 64,000 customers who last purchased within twelve months. ' \
                   'The customers were involved in an e-mail test. ' \
@@ -168,6 +194,8 @@ def load_hillstrom_email_marketing(
         'target_visit': df['visit'].values,
         'target_conversion': df['conversion'].values,
     }
+    if n_samples is not None or fraction is not None:
+        data['sample_weight'] = sample_weight
     return data
 
 
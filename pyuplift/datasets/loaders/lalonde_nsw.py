@@ -2,6 +2,7 @@ import os
 import numpy as np
 import pandas as pd
 from sklearn.utils import shuffle
+from .sampling import _check_sampling_params, _sample_rows
 
 
 column_names = ['treat', 'age', 'educ', 'black', 'hisp', 'married', 'nodegr', 're75', 're78']
@@ -104,7 +105,10 @@ def download_lalonde_nsw(
 
 def load_lalonde_nsw(
     data_home=None,
-    download_if_missing=True
+    download_if_missing=True,
+    n_samples=None,
+    fraction=None,
+    random_state=None
 ):
     """Loading the Lalonde NSW dataset from the local file.
 
@@ -124,6 +128,10 @@ def load_lalonde_nsw(
 
     More information about dataset you can find `here <https://users.nber.org/~rdehejia/nswdata.html>`_.
 
+    If `n_samples` or `fraction` is set, a random subset of the rows is selected,
+    stratified by the treatment and by whether the earnings in 1978 are not zero.
+    Every non-empty stratum keeps at least one row, so `n_samples` should not be less than the number of strata.
+
     Parameters
     ----------
     data_home : str, optional (default=None)
@@ -131,6 +139,12 @@ def load_lalonde_nsw(
         By default the dataset will be stored in the data folder in the same folder.
     download_if_missing : bool, optional (default=True)
         Download the dataset if it is not downloaded.
+    n_samples : int, optional (default=None)
+        The number of randomly selected rows. None means all rows.
+    fraction : float, optional (default=None)
+        The share of randomly selected rows. None means all rows.
+    random_state : int, optional (default=None)
+        The seed used by the random number generator of the sampling.
 
     Returns
     -------
@@ -150,8 +164,14 @@ def load_lalonde_nsw(
 
     dataset.target : numpy array of shape (722,)
         Each value corresponds to one of the outcomes. By default, it's `re78` outcome.
+
+    dataset.sample_weight : numpy array of shape (n_samples,)
+        Only if `n_samples` or `fraction` is set. The size of the stratum of every selected row divided by
+        the number of its selected rows, the weighted sums over the subset are unbiased estimates
+        of the sums over the dataset.
     """
 
+    _check_sampling_params(n_samples, fraction)
     data_home, dataset_path = __get_data_home_dataset_file_paths(data_home)
     if not os.path.exists(dataset_path):
         if download_if_missing:
@@ -163,6 +183,11 @@ def load_lalonde_nsw(
             )
 
     df = pd.read_csv(dataset_path)
+    if n_samples is not None or fraction is not None:
+        indices, sample_weight = _sample_rows(
+            lambda: [(df['treat'].values, df['re78'].values)], df.shape[0], n_samples, fraction, random_state
+        )
+        df = df.iloc[indices]
     description = 'The dataset contains the treated and control units from the male sub-sample ' \
                   'from the National Supported Work Demonstration as used by Lalonde in his paper.'
 
@@ -174,6 +199,8 @@ def load_lalonde_nsw(
         'treatment': df['treat'].values,
         'target': df['re78'].values,
     }
+    if n_samples is not None or fraction is not None:
+        dataset['sample_weight'] = sample_weight
     return dataset
 
 
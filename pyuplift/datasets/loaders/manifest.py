@@ -0,0 +1,16 @@
+import warnings
+
+# SHA-256 checksums of the files which are downloaded by the loaders, the keys are the default URLs.
+# None means the checksum is not published yet and the file is not verified.
+SHA256 = {
+    'https://s3.us-east-2.amazonaws.com/criteo-uplift-dataset/criteo-uplift.csv.gz': None,
+    'http://www.minethatdata.com/Kevin_Hillstrom_MineThatData_E-MailAnalytics_DataMiningChallenge_2008.03.20.csv': None,
+}
+
+
+def _get_sha256(url):
+    """The checksum of the file at `url`, warns if no checksum is configured and the file is not verified."""
+    sha256 = SHA256.get(url)
+    if sha256 is None:
+        warnings.warn('No SHA-256 checksum is configured for {}, the downloaded file is not verified.'.format(url))
+    return sha256
@@ -0,0 +1,64 @@
+import numpy as np
+from pyuplift.utils.strata import allocate_strata, get_strata
+
+
+def _check_sampling_params(n_samples, fraction):
+    if n_samples is not None and fraction is not None:
+        raise ValueError('Only one of `n_samples` and `fraction` should be set.')
+    if n_samples is not None and n_samples < 1:
+        raise ValueError('The number of samples should be positive integer number.')
+    if fraction is not None and not (0 < fraction <= 1):
+        raise ValueError('Fraction should be float number in (0, 1].')
+
+
+def _sample_rows(get_chunks, n_rows, n_samples=None, fraction=None, random_state=None):
+    """Random rows stratified by the treatment and by whether the target is not zero.
+
+    `get_chunks()` returns an iterator over consecutive blocks of (treatment, target) of all `n_rows` rows,
+    it is called twice: the first pass counts the rows of every stratum in every block, the second pass selects
+    the rows, so only the labels of one block and the selected indices are kept in memory.
+    The sample size of every stratum is proportional to its size and is at least one row, so ValueError is raised
+    if `n_samples` is less than the number of the non-empty strata. The numbers of the selected rows of a stratum
+    in the blocks are drawn from the multivariate hypergeometric distribution, so every subset of a stratum
+    of this size is equally likely.
+
+    Returns the sorted indices of the rows and their weights: the size of the stratum divided by its sample size.
+    """
+
+    if fraction is not None:
+        n_samples = int(round(fraction * n_rows))
+    if not (0 < n_samples <= n_rows):
+        raise ValueError('The number of samples should be between 1 and the number of rows ({}).'.format(n_rows))
+
+    treatments = {}
+    chunk_counts = [np.bincount(cells) for cells in __iter_cells(get_chunks, treatments)]
+    n_cells = 2 * len(treatments)
+    chunk_counts = np.array([np.pad(counts, (0, n_cells - counts.shape[0])) for counts in chunk_counts])
+    counts = chunk_counts.sum(axis=0)
+
+    # Every stratum gets at least one row, so that its weight is defined
+    sizes = allocate_strata(counts, n_samples, at_least_one=True)
+
+    rng = np.random.default_rng(random_state)
+    chunk_sizes = np.zeros(chunk_counts.shape, dtype=np.int64)
+    for cell in np.flatnonzero(sizes):
+        chunk_sizes[:, cell] = rng.multivariate_hypergeometric(chunk_counts[:, cell], sizes[cell])
+
+    indices, weights = [], []
+    offset = 0
+    for cells, cell_sizes in zip(__iter_cells(get_chunks, treatments), chunk_sizes):
+        for cell in np.flatnonzero(cell_sizes):
+            rows = rng.choice(np.flatnonzero(cells == cell), cell_sizes[cell], replace=False)
+            indices.append(offset + rows)
+            weights.append(np.full(rows.shape[0], counts[cell] / sizes[cell]))
+        offset += cells.shape[0]
+
+    indices, weights = np.concatenate(indices), np.concatenate(weights)
+    order = np.argsort(indices)
+    return indices[order], weights[order]
+
+
+def __iter_cells(get_chunks, treatments):
+    """Integer stratum of every row of every block, the codes of the treatments are shared by the blocks."""
+    for treatment, target in get_chunks():
+        yield get_strata(target, treatment, treatments)
@@ -1 +1,5 @@
 from .average_effect import get_average_effect
+from .curves import uplift_curve, qini_curve, auuc, qini_coefficient
+from .bootstrap import bootstrap_metric
+from .streaming import UpliftHistogram
+from .report import evaluate_models
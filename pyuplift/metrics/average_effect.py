@@ -1,10 +1,13 @@
-import pandas as pd
-from statistics import mean
+import numpy as np
 
 
 def get_average_effect(y_test, t_test, y_pred, test_share=0.3):
     """Estimating an average effect of the test set.
 
+    The samples with the highest predicted uplift are selected without sorting the whole test set.
+    Ties are resolved in favour of the samples which come first in the test set, missing predictions are ranked last.
+    The samples with treatment 1 are treated, all the other samples are control.
+
     +-----------------+----------------------------------------------------------------------------------+
     | **Parameters:** | | **y_test**: numpy array                                                        |
     |                 | |   Actual y values.                                                             |
@@ -20,24 +23,30 @@ def get_average_effect(y_test, t_test, y_pred, test_share=0.3):
     +-----------------+----------------------------------------------------------------------------------+
     """
 
-    df = pd.DataFrame(data={
-        'effect': y_pred,
-        'y': y_test,
-        't': t_test
-    })
-    df = df.sort_values(by='effect', ascending=False)
-    test_size = int(test_share * df.shape[0])
-    idx, s1, s0 = 0, [], []
-    for _, row in df.iterrows():
-        idx += 1
-        if idx > test_size:
-            break
-        if row['t'] == 1:
-            s1.append(row['y'])
-        else:
-            s0.append(row['y'])
-    if len(s0) == 0:
-        s0.append(0)
-    if len(s1) == 0:
-        s1.append(0)
-    return mean(s1) - mean(s0)
+    y_test, t_test, y_pred = np.asarray(y_test), np.asarray(t_test), np.asarray(y_pred, dtype=np.float64)
+    test_size = int(test_share * y_pred.shape[0])
+    top = __select_top(y_pred, test_size)
+    y_top, treated = y_test[top], t_test[top] == 1
+    s1 = y_top[treated].mean() if treated.any() else 0
+    s0 = y_top[~treated].mean() if not treated.all() else 0
+    return float(s1 - s0)
+
+
+def __select_top(scores, k):
+    """Indices of the `k` highest scores: ties by the lower index, NaN after all numbers."""
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+    if k >= scores.shape[0]:
+        return np.arange(scores.shape[0])
+
+    is_nan = np.isnan(scores)
+    numbers = np.flatnonzero(~is_nan)
+    if k >= numbers.shape[0]:
+        return np.concatenate([numbers, np.flatnonzero(is_nan)[:k - numbers.shape[0]]])
+
+    values = scores[numbers]
+    # The k-th highest value splits the numbers into the selected, the tied and the rest
+    kth = -np.partition(-values, k - 1)[k - 1]
+    greater = numbers[values > kth]
+    tied = numbers[values == kth]
+    return np.concatenate([greater, tied[:k - greater.shape[0]]])
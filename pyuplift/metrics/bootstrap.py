@@ -0,0 +1,175 @@
+import numpy as np
+from joblib import Parallel, delayed
+from .average_effect import get_average_effect
+from .curves import auuc, qini_coefficient
+from .cumulative import get_area, get_qini_values, get_ranking, get_uplift_values
+
+# The maximum number of cells of a batch of bootstrap weights
+MAX_BATCH_CELLS = 2 ** 22
+
+
+def bootstrap_metric(
+    metric,
+    y_test,
+    t_test,
+    y_pred,
+    n_resamples=1000,
+    confidence_level=0.95,
+    method='multinomial',
+    metric_params=None,
+    batch_size=None,
+    n_jobs=None,
+    random_state=None
+):
+    """Estimating a bootstrap confidence interval of an uplift metric.
+
+    A resample is a vector of weights of the samples: the counts of a classic bootstrap ('multinomial')
+    or independent Poisson(1) counts ('poisson'). The resamples are generated in batches, the batches are
+    scored in parallel. `get_average_effect`, `auuc` and `qini_coefficient` are scored without re-indexing:
+    the samples are sorted once and every resample of a batch is a row of a weight matrix.
+    Other metrics are called on every resample.
+
+    +-----------------+----------------------------------------------------------------------------------+
+    | **Parameters:** | | **metric**: callable                                                           |
+    |                 | |   The metric `metric(y_test, t_test, y_pred, **metric_params)`.                |
+    |                 | | **y_test**: numpy array                                                        |
+    |                 | |   Actual y values.                                                             |
+    |                 | | **t_test**: numpy array                                                        |
+    |                 | |   Actual treatment values.                                                     |
+    |                 | | **y_pred**: numpy array                                                        |
+    |                 | |   Predicted y values by uplift model.                                          |
+    |                 | | **n_resamples**: int                                                           |
+    |                 | |   The number of bootstrap resamples.                                           |
+    |                 | | **confidence_level**: float                                                    |
+    |                 | |   The confidence level of the percentile interval.                             |
+    |                 | | **method**: string                                                             |
+    |                 | |   'multinomial' or 'poisson'.                                                  |
+    |                 | | **metric_params**: dict or None                                                |
+    |                 | |   Keyword arguments of the metric, e.g. {'test_share': 0.1}.                   |
+    |                 | | **batch_size**: int or None                                                    |
+    |                 | |   The number of resamples in a batch. None means about 4M weights per batch.  |
+    |                 | | **n_jobs**: int or None                                                        |
+    |                 | |   The number of processes. None means 1, -1 means using all processors.        |
+    |                 | | **random_state**: int or None                                                  |
+    |                 | |   The seed used by the random number generator.                                |
+    +-----------------+----------------------------------------------------------------------------------+
+    | **Returns:**    | | **result**: dict                                                             |
+    |                 | |   `estimate` (the metric on the test set), `low` and `high` (the bounds of the |
+    |                 | |   interval), `std` (the standard error) and `scores` (the metric on every      |
+    |                 | |   resample).                                                                   |
+    +-----------------+----------------------------------------------------------------------------------+
+    """
+
+    if n_resamples < 1:
+        raise ValueError('The number of resamples should be positive integer number.')
+    if not (0 < confidence_level < 1):
+        raise ValueError('Confidence level should be float number between 0 and 1.')
+    if method not in ('multinomial', 'poisson'):
+        raise ValueError("Method should be 'multinomial' or 'poisson'.")
+    if metric_params is None:
+        metric_params = {}
+
+    y_test, t_test, y_pred = np.asarray(y_test), np.asarray(t_test), np.asarray(y_pred)
+    n_samples = y_test.shape[0]
+    if batch_size is None:
+        batch_size = max(1, MAX_BATCH_CELLS // max(n_samples, 1))
+    batch_size = min(batch_size, n_resamples)
+    sizes = [batch_size] * (n_resamples // batch_size)
+    if n_resamples % batch_size:
+        sizes.append(n_resamples % batch_size)
+    seeds = np.random.RandomState(random_state).randint(np.iinfo(np.int32).max, size=len(sizes))
+
+    if metric in WEIGHTED_METRICS:
+        order, ends = get_ranking(y_pred)
+        y_sorted, treated = y_test[order].astype(np.float64), t_test[order] == 1
+        jobs = (
+            delayed(_score_weighted_batch)(WEIGHTED_METRICS[metric], y_sorted, treated, ends, order, size, method, seed, metric_params)
+            for size, seed in zip(sizes, seeds)
+        )
+    else:
+        jobs = (
+            delayed(_score_resampled_batch)(metric, y_test, t_test, y_pred, size, method, seed, metric_params)
+            for size, seed in zip(sizes, seeds)
+        )
+    scores = np.concatenate(Parallel(n_jobs=n_jobs)(jobs))
+
+    alpha = (1 - confidence_level) / 2
+    low, high = np.percentile(scores, [100 * alpha, 100 * (1 - alpha)])
+    return {
+        'estimate': metric(y_test, t_test, y_pred, **metric_params),
+        'low': low,
+        'high': high,
+        'std': scores.std(ddof=1) if n_resamples > 1 else 0.,
+        'scores': scores,
+    }
+
+
+def _get_weights(n_samples, size, method, seed):
+    """Bootstrap weights with shape = [size, n_samples]."""
+    rng = np.random.RandomState(seed)
+    if method == 'poisson':
+        return rng.poisson(1., size=(size, n_samples))
+    indices = rng.randint(0, n_samples, size=(size, n_samples))
+    indices += np.arange(size)[:, np.newaxis] * n_samples
+    return np.bincount(indices.ravel(), minlength=size * n_samples).reshape(size, n_samples)
+
+
+def _score_resampled_batch(metric, y_test, t_test, y_pred, size, method, seed, metric_params):
+    weights = _get_weights(y_test.shape[0], size, method, seed)
+    scores = np.empty(size)
+    for i in range(size):
+        indices = np.repeat(np.arange(y_test.shape[0]), weights[i])
+        scores[i] = metric(y_test[indices], t_test[indices], y_pred[indices], **metric_params)
+    return scores
+
+
+def _score_weighted_batch(kernel, y_sorted, treated, ends, order, size, method, seed, metric_params):
+    weights = _get_weights(y_sorted.shape[0], size, method, seed)[:, order].astype(np.float64)
+    return kernel(weights, y_sorted, treated, ends, **metric_params)
+
+
+def _weighted_average_effect(weights, y_sorted, treated, ends, test_share=0.3):
+    # The top weight is cut at the k-th sample, the tied samples are in the test set order
+    test_size = np.floor(test_share * weights.sum(axis=1))
+    selected = np.clip(test_size[:, np.newaxis] - (np.cumsum(weights, axis=1) - weights), 0, weights)
+    n = selected.sum(axis=1)
+    n_t = selected @ treated.astype(np.float64)
+    y_all = selected @ y_sorted
+    y_t = selected @ (y_sorted * treated)
+    s1 = np.divide(y_t, n_t, out=np.zeros(n.shape), where=n_t > 0)
+    s0 = np.divide(y_all - y_t, n - n_t, out=np.zeros(n.shape), where=n - n_t > 0)
+    return s1 - s0
+
+
+def _weighted_cumulative_counts(weights, y_sorted, treated, ends):
+    def cumulative(values):
+        sums = np.cumsum(values, axis=1)[:, ends]
+        return np.hstack([np.zeros((sums.shape[0], 1)), sums])
+
+    n = cumulative(weights)
+    n_t = cumulative(weights * treated)
+    y_all = cumulative(weights * y_sorted)
+    y_t = cumulative(weights * (y_sorted * treated))
+    return n, n_t, n - n_t, y_t, y_all - y_t
+
+
+def _weighted_auuc(weights, y_sorted, treated, ends):
+    n, n_t, n_c, y_t, y_c = _weighted_cumulative_counts(weights, y_sorted, treated, ends)
+    total = n[:, -1]
+    area = get_area(n, get_uplift_values(n, n_t, n_c, y_t, y_c))
+    return np.divide(area, total ** 2, out=np.zeros(total.shape), where=total > 0)
+
+
+def _weighted_qini_coefficient(weights, y_sorted, treated, ends):
+    n, n_t, n_c, y_t, y_c = _weighted_cumulative_counts(weights, y_sorted, treated, ends)
+    total = n[:, -1]
+    curve = get_qini_values(n_t, n_c, y_t, y_c)
+    area = get_area(n, curve) - curve[:, -1] * total / 2
+    return np.divide(area, total ** 2, out=np.zeros(total.shape), where=total > 0)
+
+
+WEIGHTED_METRICS = {
+    get_average_effect: _weighted_average_effect,
+    auuc: _weighted_auuc,
+    qini_coefficient: _weighted_qini_coefficient,
+}
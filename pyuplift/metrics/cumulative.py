@@ -0,0 +1,91 @@
+import numpy as np
+import pandas as pd
+
+
+def get_cumulative_counts(y_test, t_test, y_pred):
+    """Cumulative treatment/control counts and responses of the samples ranked by the predicted uplift.
+
+    The samples are sorted once by the descending prediction (ties in the test set order, missing predictions last).
+    The sums are taken at the boundaries between distinct predictions, so tied samples are never split.
+    The samples with treatment 1 are treated, all the other samples are control.
+
+    +-----------------+----------------------------------------------------------------------------------+
+    | **Parameters:** | | **y_test**: numpy array                                                        |
+    |                 | |   Actual y values.                                                             |
+    |                 | | **t_test**: numpy array                                                        |
+    |                 | |   Actual treatment values.                                                     |
+    |                 | | **y_pred**: numpy array                                                        |
+    |                 | |   Predicted y values by uplift model.                                          |
+    +-----------------+----------------------------------------------------------------------------------+
+    | **Returns:**    | | **(n, n_t, n_c, y_t, y_c)**: tuple of numpy arrays                             |
+    |                 | |   Numbers of the top samples, of the treated and of the control ones           |
+    |                 | |   among them, sums of y of the treated and of the control ones.                |
+    |                 | |   The first element of every array corresponds to zero samples.                |
+    +-----------------+----------------------------------------------------------------------------------+
+    """
+
+    y_test, t_test = np.asarray(y_test), np.asarray(t_test)
+    order, ends = get_ranking(y_pred)
+    treated = t_test[order] == 1
+    y_sorted = y_test[order].astype(np.float64)
+
+    n_t = np.cumsum(treated)[ends]
+    y_t = np.cumsum(np.where(treated, y_sorted, 0))[ends]
+    y_c = np.cumsum(np.where(treated, 0, y_sorted))[ends]
+    n = ends + 1
+    n_c = n - n_t
+    return tuple(np.concatenate([[0], values]) for values in (n, n_t, n_c, y_t, y_c))
+
+
+def get_ranking(y_pred):
+    """Order of the samples by the descending prediction and positions of the last sample of every group of ties.
+
+    Ties keep the test set order, missing predictions are ranked last and tied with each other.
+    """
+    y_pred = np.asarray(y_pred, dtype=np.float64)
+    order = np.argsort(-y_pred, kind='stable')
+    scores = y_pred[order]
+    is_nan = np.isnan(scores)
+    same = (scores[1:] == scores[:-1]) | (is_nan[1:] & is_nan[:-1])
+    ends = np.append(np.flatnonzero(~same), scores.shape[0] - 1) if scores.shape[0] > 0 else np.empty(0, np.intp)
+    return order, ends
+
+
+def downsample(x, curve, n_points=None):
+    """Keep `n_points` points of the curve evenly spaced by index, including the first and the last ones."""
+    if n_points is None or n_points >= x.shape[0]:
+        return x, curve
+    if n_points < 2:
+        raise ValueError('The number of points should be integer number greater than 1.')
+    indices = np.unique(np.linspace(0, x.shape[0] - 1, n_points).round().astype(np.intp))
+    return x[indices], curve[indices]
+
+
+def get_uplift_values(n, n_t, n_c, y_t, y_c):
+    """Values of the uplift curve from the cumulative counts, works with arrays of any shape."""
+    mean_t = np.divide(y_t, n_t, out=np.zeros(np.shape(y_t)), where=n_t > 0)
+    mean_c = np.divide(y_c, n_c, out=np.zeros(np.shape(y_c)), where=n_c > 0)
+    return (mean_t - mean_c) * n
+
+
+def get_qini_values(n_t, n_c, y_t, y_c):
+    """Values of the Qini curve from the cumulative counts, works with arrays of any shape."""
+    return y_t - np.divide(y_c * n_t, n_c, out=np.zeros(np.shape(y_c)), where=n_c > 0)
+
+
+def get_area(x, curve):
+    """Area under the curve by the trapezoidal rule along the last axis."""
+    return np.sum((curve[..., 1:] + curve[..., :-1]) * np.diff(x), axis=-1) / 2
+
+
+def get_group_table(n_t, n_c, y_t, y_c):
+    """The table of the uplift of groups from their counts and sums of y."""
+    mean_t = np.divide(y_t, n_t, out=np.zeros(len(n_t)), where=np.asarray(n_t) > 0)
+    mean_c = np.divide(y_c, n_c, out=np.zeros(len(n_c)), where=np.asarray(n_c) > 0)
+    return pd.DataFrame({
+        'n_treated': n_t,
+        'n_control': n_c,
+        'mean_treated': mean_t,
+        'mean_control': mean_c,
+        'uplift': mean_t - mean_c,
+    })
@@ -0,0 +1,103 @@
+from .cumulative import downsample, get_area, get_cumulative_counts, get_qini_values, get_uplift_values
+
+
+def uplift_curve(y_test, t_test, y_pred, n_points=None):
+    """Computing the uplift curve of the test set.
+
+    The value of the curve at `n` top samples is the difference between the mean y of the treated
+    and of the control samples among them multiplied by `n`.
+
+    +-----------------+----------------------------------------------------------------------------------+
+    | **Parameters:** | | **y_test**: numpy array                                                        |
+    |                 | |   Actual y values.                                                             |
+    |                 | | **t_test**: numpy array                                                        |
+    |                 | |   Actual treatment values.                                                     |
+    |                 | | **y_pred**: numpy array                                                        |
+    |                 | |   Predicted y values by uplift model.                                          |
+    |                 | | **n_points**: int or None                                                      |
+    |                 | |   The number of points of the returned curve. None means all points.           |
+    +-----------------+----------------------------------------------------------------------------------+
+    | **Returns:**    | | **(n, curve)**: tuple of numpy arrays                                          |
+    |                 | |   Numbers of the top samples and values of the curve.                          |
+    +-----------------+----------------------------------------------------------------------------------+
+    """
+
+    n, n_t, n_c, y_t, y_c = get_cumulative_counts(y_test, t_test, y_pred)
+    return downsample(n, get_uplift_values(n, n_t, n_c, y_t, y_c), n_points)
+
+
+def qini_curve(y_test, t_test, y_pred, n_points=None):
+    """Computing the Qini curve of the test set.
+
+    The value of the curve at `n` top samples is the sum of y of the treated samples among them
+    minus the sum of y of the control samples scaled to the number of the treated ones.
+
+    +-----------------+----------------------------------------------------------------------------------+
+    | **Parameters:** | | **y_test**: numpy array                                                        |
+    |                 | |   Actual y values.                                                             |
+    |                 | | **t_test**: numpy array                                                        |
+    |                 | |   Actual treatment values.                                                     |
+    |                 | | **y_pred**: numpy array                                                        |
+    |                 | |   Predicted y values by uplift model.                                          |
+    |                 | | **n_points**: int or None                                                      |
+    |                 | |   The number of points of the returned curve. None means all points.           |
+    +-----------------+----------------------------------------------------------------------------------+
+    | **Returns:**    | | **(n, curve)**: tuple of numpy arrays                                          |
+    |                 | |   Numbers of the top samples and values of the curve.                          |
+    +-----------------+----------------------------------------------------------------------------------+
+    """
+
+    n, n_t, n_c, y_t, y_c = get_cumulative_counts(y_test, t_test, y_pred)
+    return downsample(n, get_qini_values(n_t, n_c, y_t, y_c), n_points)
+
+
+def auuc(y_test, t_test, y_pred):
+    """Computing the area under the uplift curve of the test set.
+
+    Both axes are divided by the number of samples, so a random model scores half of the average effect.
+
+    +-----------------+----------------------------------------------------------------------------------+
+    | **Parameters:** | | **y_test**: numpy array                                                        |
+    |                 | |   Actual y values.                                                             |
+    |                 | | **t_test**: numpy array                                                        |
+    |                 | |   Actual treatment values.                                                     |
+    |                 | | **y_pred**: numpy array                                                        |
+    |                 | |   Predicted y values by uplift model.                                          |
+    +-----------------+----------------------------------------------------------------------------------+
+    | **Returns:**    | | **auuc**: float                                                                |
+    |                 | |   Area under the uplift curve.                                                 |
+    +-----------------+----------------------------------------------------------------------------------+
+    """
+
+    n, n_t, n_c, y_t, y_c = get_cumulative_counts(y_test, t_test, y_pred)
+    if n[-1] == 0:
+        return 0.
+    return float(get_area(n, get_uplift_values(n, n_t, n_c, y_t, y_c)) / n[-1] ** 2)
+
+
+def qini_coefficient(y_test, t_test, y_pred):
+    """Computing the Qini coefficient of the test set.
+
+    The coefficient is the area between the Qini curve and the straight line of a random model,
+    both axes are divided by the number of samples.
+
+    +-----------------+----------------------------------------------------------------------------------+
+    | **Parameters:** | | **y_test**: numpy array                                                        |
+    |                 | |   Actual y values.                                                             |
+    |                 | | **t_test**: numpy array                                                        |
+    |                 | |   Actual treatment values.                                                     |
+    |                 | | **y_pred**: numpy array                                                        |
+    |                 | |   Predicted y values by uplift model.                                          |
+    +-----------------+----------------------------------------------------------------------------------+
+    | **Returns:**    | | **qini coefficient**: float                                                    |
+    |                 | |   Area between the Qini curve and the random model.                            |
+    +-----------------+----------------------------------------------------------------------------------+
+    """
+
+    n, n_t, n_c, y_t, y_c = get_cumulative_counts(y_test, t_test, y_pred)
+    if n[-1] == 0:
+        return 0.
+    curve = get_qini_values(n_t, n_c, y_t, y_c)
+    random_area = curve[-1] * n[-1] / 2
+    return float((get_area(n, curve) - random_area) / n[-1] ** 2)
+
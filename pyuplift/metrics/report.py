@@ -0,0 +1,83 @@
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from .cumulative import get_area, get_group_table, get_qini_values, get_ranking, get_uplift_values
+
+
+def evaluate_models(y_test, t_test, predictions, test_shares=(0.1, 0.3, 0.5), n_groups=10, return_tables=False, n_jobs=None):
+    """Computing the uplift metrics of several models on the same test set.
+
+    The outcome and the treatment are prepared once, the predictions of every model are sorted once
+    and all the metrics are taken from the same cumulative sums. The models are evaluated in parallel.
+    The metrics are equal to `get_average_effect`, `auuc` and `qini_coefficient`.
+
+    +-----------------+----------------------------------------------------------------------------------+
+    | **Parameters:** | | **y_test**: numpy array                                                        |
+    |                 | |   Actual y values.                                                             |
+    |                 | | **t_test**: numpy array                                                        |
+    |                 | |   Actual treatment values.                                                     |
+    |                 | | **predictions**: dict                                                          |
+    |                 | |   Predicted y values by uplift models, e.g. {'model name': y_pred}.            |
+    |                 | | **test_shares**: tuple of floats                                               |
+    |                 | |   Shares of the test data for estimating an average effect.                    |
+    |                 | | **n_groups**: int                                                              |
+    |                 | |   The number of groups of equal size in the uplift tables.                     |
+    |                 | | **return_tables**: bool                                                        |
+    |                 | |   Whether to return the uplift table of every model.                           |
+    |                 | | **n_jobs**: int or None                                                        |
+    |                 | |   The number of processes. None means 1, -1 means using all processors.        |
+    +-----------------+----------------------------------------------------------------------------------+
+    | **Returns:**    | | **report**: pandas.DataFrame                                                   |
+    |                 | |   The metrics of every model: `average_effect@<test_share>`, `auuc` and        |
+    |                 | |   `qini_coefficient`, indexed by the model names.                              |
+    |                 | | **tables**: dict of pandas.DataFrame                                           |
+    |                 | |   The uplift of every group of the ranked test set, the first group has the    |
+    |                 | |   highest predictions. Only if `return_tables` is True.                        |
+    +-----------------+----------------------------------------------------------------------------------+
+    """
+
+    if n_groups < 1:
+        raise ValueError('The number of groups should be positive integer number.')
+    y_test = np.asarray(y_test, dtype=np.float64)
+    treated = np.asarray(t_test) == 1
+    names = list(predictions)
+    results = Parallel(n_jobs=n_jobs)(
+        delayed(_evaluate_model)(y_test, treated, predictions[name], test_shares, n_groups) for name in names
+    )
+    report = pd.DataFrame([row for row, _ in results], index=pd.Index(names, name='model'))
+    if return_tables:
+        return report, {name: table for name, (_, table) in zip(names, results)}
+    return report
+
+
+def _evaluate_model(y_test, treated, y_pred, test_shares, n_groups):
+    order, ends = get_ranking(y_pred)
+    t_sorted, y_sorted = treated[order], y_test[order]
+    # Cumulative sums after every sample of the ranked test set, the first element corresponds to zero samples
+    n = np.arange(y_sorted.shape[0] + 1)
+    n_t = np.concatenate([[0], np.cumsum(t_sorted)])
+    y_t = np.concatenate([[0], np.cumsum(np.where(t_sorted, y_sorted, 0))])
+    y_c = np.concatenate([[0], np.cumsum(np.where(t_sorted, 0, y_sorted))])
+    n_c = n - n_t
+
+    row = {}
+    for test_share in test_shares:
+        k = int(test_share * n[-1])
+        s1 = y_t[k] / n_t[k] if n_t[k] > 0 else 0
+        s0 = y_c[k] / n_c[k] if n_c[k] > 0 else 0
+        row['average_effect@{}'.format(test_share)] = float(s1 - s0)
+
+    # The curves are taken at the boundaries between distinct predictions
+    ties = np.concatenate([[0], ends + 1])
+    total = n[-1]
+    uplift_values = get_uplift_values(n[ties], n_t[ties], n_c[ties], y_t[ties], y_c[ties])
+    qini_values = get_qini_values(n_t[ties], n_c[ties], y_t[ties], y_c[ties])
+    if total > 0:
+        row['auuc'] = float(get_area(n[ties], uplift_values) / total ** 2)
+        row['qini_coefficient'] = float((get_area(n[ties], qini_values) - qini_values[-1] * total / 2) / total ** 2)
+    else:
+        row['auuc'] = row['qini_coefficient'] = 0.
+
+    cuts = np.arange(n_groups + 1) * total // n_groups
+    table = get_group_table(np.diff(n_t[cuts]), np.diff(n_c[cuts]), np.diff(y_t[cuts]), np.diff(y_c[cuts]))
+    return row, table
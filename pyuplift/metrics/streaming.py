@@ -0,0 +1,205 @@
+import numpy as np
+from .cumulative import get_area, get_group_table, get_qini_values
+
+
+class UpliftHistogram:
+    """The class which accumulates the uplift metrics of the test set by blocks in bounded memory.
+
+    The predictions are counted in fixed bins: every bin keeps the numbers of the treated and of the control samples
+    and the sums of their y. A prediction `x` falls into the bin `b` if `edges[b] <= x < edges[b + 1]`,
+    missing predictions are counted in an extra bin which is ranked last.
+    Histograms with the same bin edges can be filled in parallel and merged.
+    The samples with treatment 1 are treated, all the other samples are control.
+
+    The order of the samples inside a bin is unknown, so a cut of the ranked test set which falls inside a bin
+    takes the same share of every group of this bin. Only the samples of this bin can be ranked wrongly:
+    the error of a metric is bounded by the effect of moving :code:`get_boundary_size(test_share)` samples.
+    The Qini curve is exact at the bin edges, the Qini coefficient is approximated by straight lines between them.
+
+    +----------------+-----------------------------------------------------------------------------------+
+    | **Parameters** | | **bin_edges : numpy array or None, optional (default=None)**                    |
+    |                | |   Increasing edges of the bins. Predictions below the first edge or above      |
+    |                | |   the last one fall into the first or the last bin.                             |
+    |                | | **n_bins : int, optional (default=1000)**                                       |
+    |                | |   The number of equal bins between `score_range` if `bin_edges` is None.        |
+    |                | | **score_range : tuple of floats, optional (default=(-1, 1))**                   |
+    |                | |   The range of the equal bins if `bin_edges` is None.                           |
+    +----------------+-----------------------------------------------------------------------------------+
+
+    *******
+    Methods
+    *******
+    +--------------------------------------------------------------------+-----------------------------------------------------+
+    | :ref:`update(self, y_test, t_test, y_pred) <histogram_update>`     | Count a block of the test set.                      |
+    +--------------------------------------------------------------------+-----------------------------------------------------+
+    | :ref:`merge(self, other) <histogram_merge>`                        | Add the counts of another histogram.                |
+    +--------------------------------------------------------------------+-----------------------------------------------------+
+    | :ref:`get_average_effect(self, test_share=0.3) <histogram_effect>` | Estimating an average effect of the test set.       |
+    +--------------------------------------------------------------------+-----------------------------------------------------+
+    | :ref:`get_boundary_size(self, test_share=0.3) <histogram_bound>`   | The number of samples which may be ranked wrongly.  |
+    +--------------------------------------------------------------------+-----------------------------------------------------+
+    | :ref:`qini_curve(self) <histogram_qini_curve>`                     | Computing the Qini curve at the bin edges.          |
+    +--------------------------------------------------------------------+-----------------------------------------------------+
+    | :ref:`qini_coefficient(self) <histogram_qini_coefficient>`         | Computing the Qini coefficient of the test set.     |
+    +--------------------------------------------------------------------+-----------------------------------------------------+
+    | :ref:`get_decile_table(self, n_groups=10) <histogram_deciles>`     | Computing the uplift of every group of the samples. |
+    +--------------------------------------------------------------------+-----------------------------------------------------+
+    """
+
+    def __init__(self, bin_edges=None, n_bins=1000, score_range=(-1, 1)):
+        if bin_edges is None:
+            if n_bins < 1:
+                raise ValueError('The number of bins should be positive integer number.')
+            bin_edges = np.linspace(score_range[0], score_range[1], n_bins + 1)
+        bin_edges = np.asarray(bin_edges, dtype=np.float64)
+        if bin_edges.ndim != 1 or bin_edges.shape[0] < 2 or np.any(np.diff(bin_edges) <= 0):
+            raise ValueError('Bin edges should be increasing array of at least two numbers.')
+        self.bin_edges = bin_edges
+        # The last bin counts missing predictions
+        size = bin_edges.shape[0]
+        self.n_treated = np.zeros(size, dtype=np.int64)
+        self.n_control = np.zeros(size, dtype=np.int64)
+        self.y_treated = np.zeros(size)
+        self.y_control = np.zeros(size)
+
+    def update(self, y_test, t_test, y_pred):
+        """Count a block of the test set.
+
+        +------------------+---------------------------------------------------------------------------------+
+        | **Parameters**   | | **y_test: numpy array with shape = [n_samples,]**                             |
+        |                  | |   Actual y values.                                                            |
+        |                  | | **t_test: numpy array with shape = [n_samples,]**                             |
+        |                  | |   Actual treatment values.                                                    |
+        |                  | | **y_pred: numpy array with shape = [n_samples,]**                             |
+        |                  | |   Predicted y values by uplift model.                                         |
+        +------------------+---------------------------------------------------------------------------------+
+        | **Returns**      | **self : object**                                                               |
+        +------------------+---------------------------------------------------------------------------------+
+        """
+
+        y_test, y_pred = np.asarray(y_test, dtype=np.float64), np.asarray(y_pred, dtype=np.float64)
+        treated = np.asarray(t_test) == 1
+        size = self.bin_edges.shape[0]
+        bins = np.clip(np.searchsorted(self.bin_edges, y_pred, side='right') - 1, 0, size - 2)
+        bins[np.isnan(y_pred)] = size - 1
+
+        self.n_treated += np.bincount(bins[treated], minlength=size)
+        self.n_control += np.bincount(bins[~treated], minlength=size)
+        self.y_treated += np.bincount(bins[treated], weights=y_test[treated], minlength=size)
+        self.y_control += np.bincount(bins[~treated], weights=y_test[~treated], minlength=size)
+        return self
+
+    def merge(self, other):
+        """Add the counts of another histogram with the same bin edges, e.g. from another process.
+
+        +------------------+---------------------------------------------------------------------------------+
+        | **Parameters**   | | **other: UpliftHistogram**                                                    |
+        |                  | |   The histogram with the same bin edges.                                      |
+        +------------------+---------------------------------------------------------------------------------+
+        | **Returns**      | **self : object**                                                               |
+        +------------------+---------------------------------------------------------------------------------+
+        """
+
+        if not np.array_equal(self.bin_edges, other.bin_edges):
+            raise ValueError('Histograms with different bin edges can not be merged.')
+        self.n_treated += other.n_treated
+        self.n_control += other.n_control
+        self.y_treated += other.y_treated
+        self.y_control += other.y_control
+        return self
+
+    def get_average_effect(self, test_share=0.3):
+        """Estimating an average effect of the top `test_share` of the test set.
+
+        +------------------+---------------------------------------------------------------------------------+
+        | **Parameters**   | | **test_share: float, optional (default=0.3)**                                 |
+        |                  | |   Share of the test data which will be taken for estimating an average effect.|
+        +------------------+---------------------------------------------------------------------------------+
+        | **Returns**      | | **average effect: float**                                                     |
+        |                  | |   Approximate average effect on the test set.                                 |
+        +------------------+---------------------------------------------------------------------------------+
+        """
+
+        n_t, n_c, y_t, y_c = self.__get_top(int(test_share * self.__get_size()))
+        s1 = y_t / n_t if n_t > 0 else 0
+        s0 = y_c / n_c if n_c > 0 else 0
+        return float(s1 - s0)
+
+    def get_boundary_size(self, test_share=0.3):
+        """The number of samples of the bin which contains the cut of the top `test_share` of the test set.
+
+        +------------------+---------------------------------------------------------------------------------+
+        | **Parameters**   | | **test_share: float, optional (default=0.3)**                                 |
+        |                  | |   Share of the test data.                                                     |
+        +------------------+---------------------------------------------------------------------------------+
+        | **Returns**      | | **size: int**                                                                 |
+        |                  | |   Zero if the cut falls on a bin edge.                                        |
+        +------------------+---------------------------------------------------------------------------------+
+        """
+
+        n = self.__get_cumulative()[0]
+        k = int(test_share * n[-1])
+        position = np.searchsorted(n, k, side='left')
+        if position >= n.shape[0] or n[position] == k:
+            return 0
+        return int(n[position] - n[position - 1])
+
+    def qini_curve(self):
+        """Computing the Qini curve of the test set at the bin edges.
+
+        +------------------+---------------------------------------------------------------------------------+
+        | **Returns**      | | **(n, curve): tuple of numpy arrays**                                         |
+        |                  | |   Numbers of the top samples and values of the curve.                         |
+        +------------------+---------------------------------------------------------------------------------+
+        """
+
+        n, n_t, n_c, y_t, y_c = self.__get_cumulative()
+        return n, get_qini_values(n_t, n_c, y_t, y_c)
+
+    def qini_coefficient(self):
+        """Computing the Qini coefficient of the test set, see `pyuplift.metrics.qini_coefficient`.
+
+        +------------------+---------------------------------------------------------------------------------+
+        | **Returns**      | | **qini coefficient: float**                                                   |
+        |                  | |   Approximate area between the Qini curve and the random model.               |
+        +------------------+---------------------------------------------------------------------------------+
+        """
+
+        n, curve = self.qini_curve()
+        if n[-1] == 0:
+            return 0.
+        return float((get_area(n, curve) - curve[-1] * n[-1] / 2) / n[-1] ** 2)
+
+    def get_decile_table(self, n_groups=10):
+        """Computing the uplift of every group of the test set ranked by the predictions.
+
+        +------------------+---------------------------------------------------------------------------------+
+        | **Parameters**   | | **n_groups: int, optional (default=10)**                                      |
+        |                  | |   The number of groups of equal size.                                         |
+        +------------------+---------------------------------------------------------------------------------+
+        | **Returns**      | | **table: pandas.DataFrame**                                                   |
+        |                  | |   The numbers of the treated and of the control samples, their mean y and     |
+        |                  | |   the uplift of every group, the first group has the highest predictions.     |
+        +------------------+---------------------------------------------------------------------------------+
+        """
+
+        if n_groups < 1:
+            raise ValueError('The number of groups should be positive integer number.')
+        cuts = np.array([self.__get_top(k) for k in np.linspace(0, self.__get_size(), n_groups + 1)])
+        n_t, n_c, y_t, y_c = np.diff(cuts, axis=0).T
+        return get_group_table(n_t, n_c, y_t, y_c)
+
+    def __get_size(self):
+        return int(self.n_treated.sum() + self.n_control.sum())
+
+    def __get_cumulative(self):
+        # Bins from the highest predictions to the lowest ones, then the missing predictions
+        order = np.append(np.arange(self.bin_edges.shape[0] - 2, -1, -1), self.bin_edges.shape[0] - 1)
+        n_t, n_c = np.cumsum(self.n_treated[order]), np.cumsum(self.n_control[order])
+        y_t, y_c = np.cumsum(self.y_treated[order]), np.cumsum(self.y_control[order])
+        return tuple(np.concatenate([[0], values]) for values in (n_t + n_c, n_t, n_c, y_t, y_c))
+
+    def __get_top(self, k):
+        n, n_t, n_c, y_t, y_c = self.__get_cumulative()
+        return tuple(float(np.interp(k, n, values)) for values in (n_t, n_c, y_t, y_c))
+
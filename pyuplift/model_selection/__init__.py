@@ -1,3 +1,10 @@
 from .splitters.train_test_split import train_test_split
+from .splitters.uplift_stratified_kfold import UpliftStratifiedKFold
 
 from .model_validation.treatment_cross_validation import treatment_cross_val_score
+from .model_validation.cross_val_predict import cross_val_predict_uplift
+
+from .search.grid_search import UpliftGridSearchCV
+from .search.halving_search import UpliftHalvingSearchCV
+
+from .cache import ModelSelectionCache
@@ -0,0 +1,157 @@
+import os
+import tempfile
+import joblib
+
+
+class ModelSelectionCache:
+    """The class which stores the fold indices and the fitted models of the model selection on disk.
+
+    A value is stored in a file named by the hash of its key, e.g. the hash of the data, of the model
+    with its parameters and of the seed. A hit updates the modification time of the file, the files which
+    were not used for the longest time are removed when the size of the directory exceeds `max_bytes`.
+    The cache can be shared by the processes of the parallel jobs and by different sessions.
+
+    +----------------+-----------------------------------------------------------------------------------+
+    | **Parameters** | | **directory : string**                                                          |
+    |                | |   The directory of the cache, it is created if it does not exist.              |
+    |                | | **max_bytes : int or None, optional (default=None)**                            |
+    |                | |   The maximum size of the cache. None means no limit.                           |
+    +----------------+-----------------------------------------------------------------------------------+
+
+    *******
+    Methods
+    *******
+    +-----------------------------------------------------+------------------------------------------------------+
+    | :ref:`get_key(self, *values) <cache_get_key>`       | The hash of the values.                              |
+    +-----------------------------------------------------+------------------------------------------------------+
+    | :ref:`get(self, key, default=None) <cache_get>`     | Load the value of the key.                           |
+    +-----------------------------------------------------+------------------------------------------------------+
+    | :ref:`set(self, key, value) <cache_set>`            | Store the value of the key.                          |
+    +-----------------------------------------------------+------------------------------------------------------+
+    | :ref:`get_size(self) <cache_get_size>`              | The number of bytes of the stored values.            |
+    +-----------------------------------------------------+------------------------------------------------------+
+    | :ref:`clear(self) <cache_clear>`                    | Remove all the stored values.                        |
+    +-----------------------------------------------------+------------------------------------------------------+
+    """
+
+    SUFFIX = '.pkl'
+
+    def __init__(self, directory, max_bytes=None):
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError('The maximum size of the cache should be positive integer number.')
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+
+    def get_key(self, *values):
+        """The hash of the values.
+
+        +------------------+---------------------------------------------------------------------------------+
+        | **Parameters**   | | **values: objects**                                                           |
+        |                  | |   Arrays, models, numbers or strings which identify a value.                  |
+        +------------------+---------------------------------------------------------------------------------+
+        | **Returns**      | | **key: string**                                                               |
+        +------------------+---------------------------------------------------------------------------------+
+        """
+        return joblib.hash(values)
+
+    def get(self, key, default=None):
+        """Load the value of the key.
+
+        +------------------+---------------------------------------------------------------------------------+
+        | **Parameters**   | | **key: string**                                                               |
+        |                  | |   The key returned by `get_key`.                                              |
+        |                  | | **default: object, optional (default=None)**                                  |
+        |                  | |   The value returned if the key is not in the cache.                          |
+        +------------------+---------------------------------------------------------------------------------+
+        | **Returns**      | | **value: object**                                                             |
+        +------------------+---------------------------------------------------------------------------------+
+        """
+        path = self.__get_path(key)
+        try:
+            value = joblib.load(path)
+            os.utime(path)
+        except (OSError, EOFError):
+            # Missing files and files removed by another process are misses
+            return default
+        return value
+
+    def set(self, key, value):
+        """Store the value of the key and remove the least recently used values above `max_bytes`.
+
+        +------------------+---------------------------------------------------------------------------------+
+        | **Parameters**   | | **key: string**                                                               |
+        |                  | |   The key returned by `get_key`.                                              |
+        |                  | | **value: object**                                                             |
+        |                  | |   The value which can be pickled.                                             |
+        +------------------+---------------------------------------------------------------------------------+
+        """
+        # The value is written to a temporary file and renamed, so readers never see a partial file
+        descriptor, temp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        os.close(descriptor)
+        try:
+            joblib.dump(value, temp_path)
+            os.replace(temp_path, self.__get_path(key))
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+        if self.max_bytes is not None:
+            self.__evict(keep=self.__get_path(key))
+
+    def get_size(self):
+        """The number of bytes of the stored values.
+
+        +------------------+---------------------------------------------------------------------------------+
+        | **Returns**      | **size : int**                                                                  |
+        +------------------+---------------------------------------------------------------------------------+
+        """
+        return sum(size for _, _, size in self.__get_files())
+
+    def clear(self):
+        """Remove all the stored values."""
+        for path, _, _ in self.__get_files():
+            self.__remove(path)
+
+    def __get_path(self, key):
+        return os.path.join(self.directory, key + self.SUFFIX)
+
+    def __get_files(self):
+        """Paths, modification times and sizes of the stored values."""
+        files = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(self.SUFFIX):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                files.append((entry.path, stat.st_mtime, stat.st_size))
+        return files
+
+    def __evict(self, keep):
+        files = sorted(self.__get_files(), key=lambda file: file[1])
+        size = sum(file_size for _, _, file_size in files)
+        for path, _, file_size in files:
+            if size <= self.max_bytes:
+                break
+            if path != keep:
+                self.__remove(path)
+                size -= file_size
+
+    @staticmethod
+    def __remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def _memoize(cache, key_values, function, *args, **kwargs):
+    """The value of the function from the cache, it is computed and stored on a miss."""
+    if cache is None:
+        return function(*args, **kwargs)
+    key = cache.get_key(*key_values)
+    value = cache.get(key)
+    if value is None:
+        value = function(*args, **kwargs)
+        cache.set(key, value)
+    return value
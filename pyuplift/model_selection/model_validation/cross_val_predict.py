@@ -0,0 +1,64 @@
+import numpy as np
+from joblib import Parallel, delayed
+
+from pyuplift.model_selection import UpliftStratifiedKFold
+from ..cache import _memoize
+from .treatment_cross_validation import _fit_model
+
+
+def cross_val_predict_uplift(X, y, t, model, cv=5, n_jobs=None, prefer='processes', cache=None):
+    """Predict an uplift of every sample by the model which was fitted on the other folds.
+
+    Every fold fits its own copy of the model, the folds are fitted in parallel.
+
+    +------------------+-----------------------------------------------------------------------------------------+
+    | **Parameters**   | | **X: numpy ndarray with shape = [n_samples, n_features]**                             |
+    |                  | |   Matrix of features.                                                                 |
+    |                  | | **y: numpy array with shape = [n_samples,]**                                          |
+    |                  | |   Array of target of feature.                                                         |
+    |                  | | **t: numpy array with shape = [n_samples,]**                                          |
+    |                  | |   Array of treatments.                                                                |
+    |                  | | **model: object**                                                                     |
+    |                  | |   The uplift model.                                                                   |
+    |                  | | **cv: int or object, optional (default=5)**                                           |
+    |                  | |   The number of folds of `UpliftStratifiedKFold` or a splitter with the method        |
+    |                  | |   `split(X, y, t)` which yields the indices of the train and of the test samples.     |
+    |                  | | **n_jobs: int or None, optional (default=None)**                                      |
+    |                  | |   The number of jobs to run in parallel. None means 1, -1 means using all processors. |
+    |                  | | **prefer: string, optional (default='processes')**                                    |
+    |                  | |   Run the jobs in a pool of 'threads' or 'processes'.                                 |
+    |                  | | **cache: ModelSelectionCache or None, optional (default=None)**                       |
+    |                  | |   The cache of the folds of deterministic splitters and of the fitted models.         |
+    +------------------+-----------------------------------------------------------------------------------------+
+    | **Return**       | | **predictions: numpy array with shape = [n_samples,]**                                |
+    |                  | |   Out-of-fold uplift of every sample, NaN for the samples of no test fold.            |
+    +------------------+-----------------------------------------------------------------------------------------+
+    """
+
+    if prefer not in ('threads', 'processes'):
+        raise ValueError("Prefer should be 'threads' or 'processes'.")
+    if isinstance(cv, int):
+        cv = UpliftStratifiedKFold(cv)
+
+    data_key = cache.get_key(X, y, t) if cache is not None else None
+    splits = _get_splits(cv, X, y, t, cache, data_key)
+    blocks = Parallel(n_jobs=n_jobs, prefer=prefer)(
+        delayed(_fit_and_predict)(X, y, t, model, train_index, test_index, cache, data_key)
+        for train_index, test_index in splits
+    )
+    predictions = np.full(len(y), np.nan)
+    for (_, test_index), block in zip(splits, blocks):
+        predictions[test_index] = np.ravel(block)
+    return predictions
+
+
+def _fit_and_predict(X, y, t, model, train_index, test_index, cache=None, data_key=None):
+    model, _ = _fit_model(X, y, t, model, train_index, cache, data_key)
+    return model.predict(X[test_index])
+
+
+def _get_splits(cv, X, y, t, cache=None, data_key=None):
+    """The list of the folds of the splitter, the folds of a splitter without randomness are cached."""
+    if getattr(cv, 'shuffle', False) and getattr(cv, 'random_state', None) is None:
+        cache = None
+    return _memoize(cache, ('split', data_key, cv), lambda: list(cv.split(X, y, t)))
@@ -1,12 +1,31 @@
+import copy
+import time
 import numpy as np
+from joblib import Parallel, delayed
 
 from pyuplift.metrics import get_average_effect
 from pyuplift.model_selection import train_test_split
+from ..cache import _memoize
 
 
-def treatment_cross_val_score(X, y, t, model, cv=5, train_share=0.7, seeds=None):
+def treatment_cross_val_score(
+    X,
+    y,
+    t,
+    model,
+    cv=5,
+    train_share=0.7,
+    seeds=None,
+    n_jobs=None,
+    prefer='processes',
+    return_times=False,
+    cache=None
+):
     """Evaluate a scores by cross-validation.
 
+    Every run fits its own copy of the model, so the runs can be evaluated in parallel and `model` stays unfitted.
+    The workers get the indices of the splits, large arrays are passed to the processes as memory maps.
+
     +------------------+-----------------------------------------------------------------------------------------+
     | **Parameters**   | | **X: numpy ndarray with shape = [n_samples, n_features]**                             |
     |                  | |   Matrix of features.                                                                 |
@@ -14,13 +33,29 @@ def treatment_cross_val_score(X, y, t, model, cv=5, train_share=0.7, seeds=None)
     |                  | |   Array of target of feature.                                                         |
     |                  | | **t: numpy array with shape = [n_samples,]**                                          |
     |                  | |   Array of treatments.                                                                |
+    |                  | | **model: object**                                                                     |
+    |                  | |   The uplift model which will be evaluated.                                           |
+    |                  | | **cv: int, optional (default=5)**                                                     |
+    |                  | |   The number of runs of the cross validation.                                         |
     |                  | | **train_share: float, optional (default=0.7)**                                        |
     |                  | |   train_share represents the proportion of the dataset to include in the train split. |
-    |                  | | **random_state: int, optional (default=777)**                                         |
-    |                  | |   random_state is the seed used by the random number generator.                       |
+    |                  | | **seeds: list of ints or None, optional (default=None)**                              |
+    |                  | |   The seeds of the splits of every run.                                               |
+    |                  | | **n_jobs: int or None, optional (default=None)**                                      |
+    |                  | |   The number of jobs to run in parallel. None means 1, -1 means using all processors. |
+    |                  | | **prefer: string, optional (default='processes')**                                    |
+    |                  | |   Run the jobs in a pool of 'threads' or 'processes'.                                 |
+    |                  | | **return_times: bool, optional (default=False)**                                      |
+    |                  | |   Whether to return the fit and the score times of every run.                         |
+    |                  | | **cache: ModelSelectionCache or None, optional (default=None)**                       |
+    |                  | |   The cache of the splits with seeds and of the fitted models.                        |
     +------------------+-----------------------------------------------------------------------------------------+
     | **Return**       | | **scores: numpy array of floats**                                                     |
     |                  | |   Array of scores of the estimator for each run of the cross validation.              |
+    |                  | | **fit_times: numpy array of floats**                                                  |
+    |                  | |   Seconds of fitting of every run, only if `return_times` is True.                    |
+    |                  | | **score_times: numpy array of floats**                                                |
+    |                  | |   Seconds of predicting and scoring of every run, only if `return_times` is True.     |
     +------------------+-----------------------------------------------------------------------------------------+
     """
 
@@ -33,11 +68,49 @@ def treatment_cross_val_score(X, y, t, model, cv=5, train_share=0.7, seeds=None)
         raise ValueError("The length of seed's array should be equals to cv.")
     elif not (0 < train_share <= 1):
         raise ValueError('Train share should be float number between 0 and 1.')
+    elif prefer not in ('threads', 'processes'):
+        raise ValueError("Prefer should be 'threads' or 'processes'.")
+
+    data_key = cache.get_key(X, y, t) if cache is not None else None
+    splits = [
+        _memoize(
+            cache if seed is not None else None, ('train_test_split', data_key, train_share, seed),
+            train_test_split, X, y, t, train_share, seed, return_indices=True
+        )
+        for seed in seeds
+    ]
+    results = Parallel(n_jobs=n_jobs, prefer=prefer)(
+        delayed(_fit_and_score)(X, y, t, model, train_index, test_index, cache=cache, data_key=data_key)
+        for train_index, test_index in splits
+    )
+    scores, fit_times, score_times = (np.array(values) for values in zip(*results))
+    if return_times:
+        return scores, fit_times, score_times
+    return scores
+
+
+def _fit_and_score(X, y, t, model, train_index, test_index, scoring=get_average_effect, cache=None, data_key=None):
+    """Fit a copy of the model on the train indices and score it on the test indices."""
+    model, fit_time = _fit_model(X, y, t, model, train_index, cache, data_key)
+    start = time.perf_counter()
+    score = scoring(y[test_index], t[test_index], model.predict(X[test_index]))
+    return score, fit_time, time.perf_counter() - start
 
-    scores = []
-    for seed in seeds:
-        X_train, X_test, y_train, y_test, t_train, t_test = train_test_split(X, y, t, train_share, seed)
-        model.fit(X_train, y_train, t_train)
-        score = get_average_effect(y_test, t_test, model.predict(X_test))
-        scores.append(score)
-    return np.array(scores)
+
+def _fit_model(X, y, t, model, train_index, cache=None, data_key=None):
+    """Fit a copy of the model on the train indices, returns the model and the seconds of fitting.
+
+    A model from the cache is returned with zero seconds, `data_key` identifies X, y and t in the cache.
+    """
+    if cache is not None:
+        key = cache.get_key('fit', data_key, model, train_index)
+        fitted = cache.get(key)
+        if fitted is not None:
+            return fitted, 0.
+    fitted = copy.deepcopy(model)
+    start = time.perf_counter()
+    fitted.fit(X[train_index], y[train_index], t[train_index])
+    fit_time = time.perf_counter() - start
+    if cache is not None:
+        cache.set(key, fitted)
+    return fitted, fit_time
@@ -0,0 +1,101 @@
+import copy
+import numpy as np
+from joblib import Parallel, delayed
+from pyuplift.metrics import get_average_effect
+from pyuplift.model_selection import UpliftStratifiedKFold
+from ..cache import _memoize
+from ..model_validation.cross_val_predict import _get_splits
+from ..model_validation.treatment_cross_validation import _fit_and_score
+
+
+class BaseSearchCV:
+    """Base class for searches of the parameters of uplift models.
+
+    Note: This class should not be used directly. Use derived classes instead.
+    """
+
+    def __init__(self, model, param_grid, scoring=None, cv=5, refit=True, n_jobs=None, prefer='processes', cache=None):
+        try:
+            model.__getattribute__('get_params')
+        except AttributeError:
+            raise ValueError('Model should contains get_params method.')
+        if prefer not in ('threads', 'processes'):
+            raise ValueError("Prefer should be 'threads' or 'processes'.")
+        self.model = model
+        self.param_grid = param_grid
+        self.scoring = scoring
+        self.cv = cv
+        self.refit = refit
+        self.n_jobs = n_jobs
+        self.prefer = prefer
+        self.cache = cache
+
+    def predict(self, X, t=None):
+        """Predict an uplift for X by the best model.
+
+        +------------------+---------------------------------------------------------------------------------+
+        | **Parameters**   | | **X: numpy ndarray with shape = [n_samples, n_features]**                     |
+        |                  | |   Matrix of features.                                                         |
+        |                  | | **t: numpy array with shape = [n_samples,] or None**                          |
+        |                  | |   Array of treatments.                                                        |
+        +------------------+---------------------------------------------------------------------------------+
+        | **Returns**      | | **y: numpy array with shape = [n_samples,]**                                  |
+        |                  | |   Array of uplift.                                                            |
+        +------------------+---------------------------------------------------------------------------------+
+        """
+
+        if not hasattr(self, 'best_model_'):
+            raise ValueError('The search should be fitted with refit=True before predicting.')
+        return self.best_model_.predict(X)
+
+    def _get_data_key(self, X, y, t):
+        return self.cache.get_key(X, y, t) if self.cache is not None else None
+
+    def _evaluate(self, X, y, t, candidates, indices=None, data_key=None):
+        """Scores with shape = [n_candidates, n_splits] and mean fit times of the candidates on the samples `indices`."""
+        cv = UpliftStratifiedKFold(self.cv) if isinstance(self.cv, int) else self.cv
+        scoring = get_average_effect if self.scoring is None else self.scoring
+        if indices is None:
+            splits = _get_splits(cv, X, y, t, self.cache, data_key)
+        else:
+            splits = [
+                (indices[train_index], indices[test_index])
+                for train_index, test_index in _get_splits(
+                    cv, X[indices], y[indices], t[indices], self.cache, (data_key, indices)
+                )
+            ]
+        models = [_build_model(self.model, params) for params in candidates]
+        results = Parallel(n_jobs=self.n_jobs, prefer=self.prefer)(
+            delayed(_fit_and_score)(X, y, t, model, train_index, test_index, scoring, self.cache, data_key)
+            for model in models
+            for train_index, test_index in splits
+        )
+        scores, fit_times, _ = (np.array(values).reshape(len(candidates), len(splits)) for values in zip(*results))
+        return scores, fit_times.mean(axis=1)
+
+    def _refit(self, X, y, t, data_key=None):
+        if self.refit:
+            model = _build_model(self.model, self.best_params_)
+            self.best_model_ = _memoize(self.cache, ('refit', data_key, model), model.fit, X, y, t)
+
+
+def _build_model(model, params):
+    """A new model of the same class with the given parameters, `<argument>__<parameter>` set the inner models."""
+    args = copy.deepcopy(model.get_params(deep=False))
+    inner = {}
+    for key, value in params.items():
+        name, _, inner_key = key.partition('__')
+        if inner_key:
+            inner.setdefault(name, {})[inner_key] = value
+        elif name not in args:
+            raise ValueError('Invalid parameter {} of the model {}.'.format(name, type(model).__name__))
+        else:
+            args[name] = value
+    for name, inner_params in inner.items():
+        if name not in args:
+            raise ValueError('Invalid parameter {} of the model {}.'.format(name, type(model).__name__))
+        if hasattr(args[name], 'set_params'):
+            args[name] = args[name].set_params(**inner_params)
+        else:
+            args[name] = _build_model(args[name], inner_params)
+    return type(model)(**args)
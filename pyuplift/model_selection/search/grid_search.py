@@ -0,0 +1,81 @@
+import numpy as np
+from scipy.stats import rankdata
+from sklearn.model_selection import ParameterGrid
+from .base import BaseSearchCV
+
+
+class UpliftGridSearchCV(BaseSearchCV):
+    """The class which searches the best parameters of an uplift model over a grid by cross-validation.
+
+    Every candidate is a new model of the same class with the parameters from the grid,
+    the parameters of the inner models are set by the names like `model__C`.
+    All the candidates are evaluated on the same folds, the pairs of a candidate and a fold are fitted in parallel.
+
+    +----------------+-----------------------------------------------------------------------------------+
+    | **Parameters** | | **model : object**                                                              |
+    |                | |   The uplift model derived from `pyuplift.BaseModel`.                           |
+    |                | | **param_grid : dict or list of dicts**                                          |
+    |                | |   The lists of the values of the parameters, e.g. {'model__C': [0.1, 1, 10]}.   |
+    |                | | **scoring : callable or None, optional (default=None)**                         |
+    |                | |   The metric `scoring(y_test, t_test, y_pred)`, None means `get_average_effect`.|
+    |                | | **cv : int or object, optional (default=5)**                                    |
+    |                | |   The number of folds of `UpliftStratifiedKFold` or a splitter with the method  |
+    |                | |   `split(X, y, t)`.                                                             |
+    |                | | **refit : bool, optional (default=True)**                                       |
+    |                | |   Whether to fit the best model on the whole training set.                      |
+    |                | | **n_jobs : int or None, optional (default=None)**                               |
+    |                | |   The number of jobs to run in parallel. None means 1, -1 means all processors. |
+    |                | | **prefer : string, optional (default='processes')**                             |
+    |                | |   Run the jobs in a pool of 'threads' or 'processes'.                           |
+    |                | | **cache : ModelSelectionCache or None, optional (default=None)**                |
+    |                | |   The cache of the folds and of the fitted models.                              |
+    +----------------+-----------------------------------------------------------------------------------+
+
+    *******
+    Methods
+    *******
+    +-----------------------------------------------------+------------------------------------------------------+
+    | :ref:`fit(self, X, y, t) <grid_fit>`                | Evaluate every candidate and fit the best one.       |
+    +-----------------------------------------------------+------------------------------------------------------+
+    | :ref:`predict(self, X, t=None) <grid_predict>`      | Predict an uplift for X by the best model.           |
+    +-----------------------------------------------------+------------------------------------------------------+
+    """
+
+    def fit(self, X, y, t):
+        """Evaluate every candidate and fit the best one on the whole training set (X, y, t).
+
+        After fitting the search has the attributes `cv_results_` (the dict of `params`, `mean_test_score`,
+        `std_test_score`, `split<k>_test_score`, `mean_fit_time` and `rank_test_score`), `best_index_`,
+        `best_params_`, `best_score_` and `best_model_` if `refit` is True.
+
+        +------------------+---------------------------------------------------------------------------------+
+        | **Parameters**   | | **X: numpy ndarray with shape = [n_samples, n_features]**                     |
+        |                  | |   Matrix of features.                                                         |
+        |                  | | **y: numpy array with shape = [n_samples,]**                                  |
+        |                  | |   Array of target of feature.                                                 |
+        |                  | | **t: numpy array with shape = [n_samples,]**                                  |
+        |                  | |   Array of treatments.                                                        |
+        +------------------+---------------------------------------------------------------------------------+
+        | **Returns**      | **self : object**                                                               |
+        +------------------+---------------------------------------------------------------------------------+
+        """
+
+        candidates = list(ParameterGrid(self.param_grid))
+        data_key = self._get_data_key(X, y, t)
+        scores, fit_times = self._evaluate(X, y, t, candidates, data_key=data_key)
+        mean_scores = scores.mean(axis=1)
+
+        self.cv_results_ = {
+            'params': candidates,
+            'mean_test_score': mean_scores,
+            'std_test_score': scores.std(axis=1),
+            'mean_fit_time': fit_times,
+            'rank_test_score': rankdata(-mean_scores, method='min').astype(np.intp),
+        }
+        for split in range(scores.shape[1]):
+            self.cv_results_['split{}_test_score'.format(split)] = scores[:, split]
+        self.best_index_ = int(np.argmax(mean_scores))
+        self.best_params_ = candidates[self.best_index_]
+        self.best_score_ = float(mean_scores[self.best_index_])
+        self._refit(X, y, t, data_key)
+        return self
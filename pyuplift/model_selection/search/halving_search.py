@@ -0,0 +1,144 @@
+import math
+import numpy as np
+from sklearn.model_selection import ParameterGrid
+from ..splitters.train_test_split import _get_train_index
+from ..cache import _memoize
+from .base import BaseSearchCV
+
+
+class UpliftHalvingSearchCV(BaseSearchCV):
+    """The class which searches the best parameters of an uplift model over a grid by successive halving.
+
+    The first iteration evaluates all the candidates on a small stratified subsample of the training set,
+    every next iteration keeps the best `1 / factor` of the candidates and evaluates them on `factor` times
+    more samples. The last iteration uses the whole training set if `min_resources` is None.
+    The candidates are built and evaluated like in `UpliftGridSearchCV`.
+
+    +----------------+-----------------------------------------------------------------------------------+
+    | **Parameters** | | **model : object**                                                              |
+    |                | |   The uplift model derived from `pyuplift.BaseModel`.                           |
+    |                | | **param_grid : dict or list of dicts**                                          |
+    |                | |   The lists of the values of the parameters, e.g. {'model__C': [0.1, 1, 10]}.   |
+    |                | | **factor : int, optional (default=3)**                                          |
+    |                | |   The ratio of the candidates dropped and of the samples added every iteration. |
+    |                | | **min_resources : int or None, optional (default=None)**                        |
+    |                | |   The number of samples of the first iteration.                                 |
+    |                | | **scoring : callable or None, optional (default=None)**                         |
+    |                | |   The metric `scoring(y_test, t_test, y_pred)`, None means `get_average_effect`.|
+    |                | | **cv : int or object, optional (default=5)**                                    |
+    |                | |   The number of folds of `UpliftStratifiedKFold` or a splitter with the method  |
+    |                | |   `split(X, y, t)`.                                                             |
+    |                | | **refit : bool, optional (default=True)**                                       |
+    |                | |   Whether to fit the best model on the whole training set.                      |
+    |                | | **n_jobs : int or None, optional (default=None)**                               |
+    |                | |   The number of jobs to run in parallel. None means 1, -1 means all processors. |
+    |                | | **prefer : string, optional (default='processes')**                             |
+    |                | |   Run the jobs in a pool of 'threads' or 'processes'.                           |
+    |                | | **random_state : int or None, optional (default=None)**                         |
+    |                | |   The seed used to draw the subsamples.                                         |
+    |                | | **cache : ModelSelectionCache or None, optional (default=None)**                |
+    |                | |   The cache of the subsamples, of the folds and of the fitted models.           |
+    +----------------+-----------------------------------------------------------------------------------+
+
+    *******
+    Methods
+    *******
+    +-----------------------------------------------------+------------------------------------------------------+
+    | :ref:`fit(self, X, y, t) <halving_fit>`             | Evaluate the candidates and fit the best one.        |
+    +-----------------------------------------------------+------------------------------------------------------+
+    | :ref:`predict(self, X, t=None) <halving_predict>`   | Predict an uplift for X by the best model.           |
+    +-----------------------------------------------------+------------------------------------------------------+
+    """
+
+    def __init__(
+        self,
+        model,
+        param_grid,
+        factor=3,
+        min_resources=None,
+        scoring=None,
+        cv=5,
+        refit=True,
+        n_jobs=None,
+        prefer='processes',
+        random_state=None,
+        cache=None
+    ):
+        super().__init__(model, param_grid, scoring, cv, refit, n_jobs, prefer, cache)
+        if factor < 2:
+            raise ValueError('Factor should be integer number greater than 1.')
+        if min_resources is not None and min_resources < 1:
+            raise ValueError('The minimum number of samples should be positive integer number.')
+        self.factor = factor
+        self.min_resources = min_resources
+        self.random_state = random_state
+
+    def fit(self, X, y, t):
+        """Evaluate the candidates by successive halving and fit the best one on the whole training set (X, y, t).
+
+        After fitting the search has the attributes `cv_results_` (the dict of `iteration`, `n_resources`,
+        `params`, `mean_test_score`, `std_test_score` and `mean_fit_time` of every evaluation),
+        `n_candidates_` and `n_resources_` of every iteration, `best_index_`, `best_params_`, `best_score_`
+        and `best_model_` if `refit` is True.
+
+        +------------------+---------------------------------------------------------------------------------+
+        | **Parameters**   | | **X: numpy ndarray with shape = [n_samples, n_features]**                     |
+        |                  | |   Matrix of features.                                                         |
+        |                  | | **y: numpy array with shape = [n_samples,]**                                  |
+        |                  | |   Array of target of feature.                                                 |
+        |                  | | **t: numpy array with shape = [n_samples,]**                                  |
+        |                  | |   Array of treatments.                                                        |
+        +------------------+---------------------------------------------------------------------------------+
+        | **Returns**      | **self : object**                                                               |
+        +------------------+---------------------------------------------------------------------------------+
+        """
+
+        candidates = list(ParameterGrid(self.param_grid))
+        size = len(y)
+        n_iterations = 1
+        while math.ceil(len(candidates) / self.factor ** (n_iterations - 1)) > 1:
+            n_iterations += 1
+        seeds = np.random.RandomState(self.random_state).randint(np.iinfo(np.int32).max, size=n_iterations)
+        data_key = self._get_data_key(X, y, t)
+        # Subsamples of random seeds never repeat
+        cache = self.cache if self.random_state is not None else None
+
+        self.cv_results_ = {key: [] for key in ['iteration', 'n_resources', 'params', 'mean_test_score', 'std_test_score', 'mean_fit_time']}
+        self.n_candidates_, self.n_resources_ = [], []
+        for iteration in range(n_iterations):
+            if self.min_resources is None:
+                # The schedule is derived from the last iteration, so the last one gets the whole training set
+                n_resources = max(1, size // self.factor ** (n_iterations - 1 - iteration))
+            else:
+                n_resources = min(size, self.min_resources * self.factor ** iteration)
+            indices = None
+            if n_resources < size:
+                # The subsample has exactly `n_resources` samples
+                indices = _memoize(
+                    cache, ('train_index', data_key, n_resources, seeds[iteration], True),
+                    _get_train_index, y, t, n_resources, seeds[iteration], stratify=True
+                )
+                indices = np.sort(indices)
+            scores, fit_times = self._evaluate(X, y, t, candidates, indices, data_key)
+            mean_scores = scores.mean(axis=1)
+
+            self.n_candidates_.append(len(candidates))
+            self.n_resources_.append(n_resources)
+            self.cv_results_['iteration'] += [iteration] * len(candidates)
+            self.cv_results_['n_resources'] += [n_resources] * len(candidates)
+            self.cv_results_['params'] += candidates
+            self.cv_results_['mean_test_score'] += list(mean_scores)
+            self.cv_results_['std_test_score'] += list(scores.std(axis=1))
+            self.cv_results_['mean_fit_time'] += list(fit_times)
+
+            # The best candidates go to the next iteration, ties keep the order of the grid
+            best = np.argsort(-mean_scores, kind='stable')[:math.ceil(len(candidates) / self.factor)]
+            if iteration == n_iterations - 1:
+                self.best_index_ = len(self.cv_results_['params']) - len(candidates) + int(best[0])
+            candidates = [candidates[index] for index in best]
+
+        self.cv_results_ = {key: np.array(values) if key != 'params' else values for key, values in self.cv_results_.items()}
+        self.best_params_ = self.cv_results_['params'][self.best_index_]
+        self.best_score_ = float(self.cv_results_['mean_test_score'][self.best_index_])
+        self._refit(X, y, t, data_key)
+        return self
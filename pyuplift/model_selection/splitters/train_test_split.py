@@ -1,9 +1,14 @@
-import random
+import numpy as np
+from pyuplift.utils.strata import allocate_strata, get_strata
 
 
-def train_test_split(X, y, t, train_share=0.7, random_state=None):
+def train_test_split(X, y, t, train_share=0.7, random_state=None, stratify=False, return_indices=False):
     """Split X, y, t into random train and test subsets.
 
+    The split is a permutation of a local random generator. With `stratify` every cell of the treatment
+    and of the outcome (`y != 0`) is split in the same proportion, the rounding remainders go to the cells
+    with the largest fractional parts.
+
     +------------------+-----------------------------------------------------------------------------------------+
     | **Parameters**   | | **X: numpy ndarray with shape = [n_samples, n_features]**                             |
     |                  | |   Matrix of features.                                                                 |
@@ -13,8 +18,12 @@ def train_test_split(X, y, t, train_share=0.7, random_state=None):
     |                  | |   Array of treatments.                                                                |
     |                  | | **train_share: float, optional (default=0.7)**                                        |
     |                  | |   train_share represents the proportion of the dataset to include in the train split. |
-    |                  | | **random_state: int, optional (default=None)**                                        |
+    |                  | | **random_state: int, numpy.random.Generator or None, optional (default=None)**        |
     |                  | |   random_state is the seed used by the random number generator.                       |
+    |                  | | **stratify: bool, optional (default=False)**                                          |
+    |                  | |   Whether to keep the shares of the treatment and outcome cells in both subsets.      |
+    |                  | | **return_indices: bool, optional (default=False)**                                    |
+    |                  | |   Whether to return the indices of the subsets instead of their copies.               |
     +------------------+-----------------------------------------------------------------------------------------+
     | **Return**       | | **X_train: numpy ndarray**                                                            |
     |                  | |   Train matrix of features.                                                           |
@@ -28,17 +37,21 @@ def train_test_split(X, y, t, train_share=0.7, random_state=None):
     |                  | |   Train array of treatments.                                                          |
     |                  | | **t_test: numpy array**                                                               |
     |                  | |   Test array of treatments.                                                           |
+    |                  | | **(train_index, test_index): tuple of numpy arrays**                                  |
+    |                  | |   Indices of the train and of the test subsets if `return_indices` is True.         |
     +------------------+-----------------------------------------------------------------------------------------+
     """
 
     if not (0 < train_share <= 1):
         raise ValueError('Train share should be float number between 0 and 1.')
 
-    random.seed(random_state)
     size = len(y)
-    train_part_size = int(train_share * size)
-    train_index = random.sample([i for i in range(size)], train_part_size)
-    test_index = [i for i in range(size) if i not in train_index]
+    train_index = _get_train_index(y, t, int(train_share * size), random_state, stratify)
+    is_test = np.ones(size, dtype=bool)
+    is_test[train_index] = False
+    test_index = np.flatnonzero(is_test)
+    if return_indices:
+        return train_index, test_index
 
     X_train = X[train_index, :]
     X_test = X[test_index, :]
@@ -49,3 +62,26 @@ def train_test_split(X, y, t, train_share=0.7, random_state=None):
     t_train = t[train_index]
     t_test = t[test_index]
     return X_train, X_test, y_train, y_test, t_train, t_test
+
+
+def _get_train_index(y, t, train_part_size, random_state=None, stratify=False):
+    """Random indices of a train subset of exactly `train_part_size` samples."""
+    rng = np.random.default_rng(random_state)
+    if stratify:
+        return __get_stratified_train_index(np.asarray(y), np.asarray(t), train_part_size, rng)
+    return rng.permutation(len(y))[:train_part_size]
+
+
+def __get_stratified_train_index(y, t, train_part_size, rng):
+    """Random train indices with the same share of every cell of the treatment and of the outcome."""
+    cells = get_strata(y, t)
+    counts = np.bincount(cells)
+    sizes = allocate_strata(counts, train_part_size)
+
+    # Samples grouped by cell in a random order, the first samples of every cell go to the train subset
+    permutation = rng.permutation(cells.shape[0])
+    order = permutation[np.argsort(cells[permutation], kind='stable')]
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    positions = np.arange(cells.shape[0]) - np.repeat(starts, counts)
+    return rng.permutation(order[positions < np.repeat(sizes, counts)])
+
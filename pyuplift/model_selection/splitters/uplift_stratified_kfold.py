@@ -0,0 +1,76 @@
+import numpy as np
+from pyuplift.utils.strata import get_strata
+
+
+class UpliftStratifiedKFold:
+    """The class which splits the samples into k folds with the same shares of the treatment and outcome cells.
+
+    Every sample is in the test fold exactly once. The samples are grouped by the cell of the treatment
+    and of the outcome (`y != 0`) and dealt to the folds in turn, so the sizes of a cell in different folds
+    and the sizes of the folds differ at most by one.
+
+    +----------------+-----------------------------------------------------------------------------------+
+    | **Parameters** | | **n_splits : int, optional (default=5)**                                        |
+    |                | |   The number of folds, at least 2.                                              |
+    |                | | **shuffle : bool, optional (default=False)**                                    |
+    |                | |   Whether to shuffle the samples of every cell before dealing them to folds.    |
+    |                | | **random_state : int or None, optional (default=None)**                         |
+    |                | |   The seed used by the random number generator if `shuffle` is True.            |
+    +----------------+-----------------------------------------------------------------------------------+
+
+    *******
+    Methods
+    *******
+    +---------------------------------------------------------+-------------------------------------------------+
+    | :ref:`split(self, X, y, t) <kfold_split>`               | Generate the train and test indices.            |
+    +---------------------------------------------------------+-------------------------------------------------+
+    | :ref:`get_n_splits(self) <kfold_get_n_splits>`          | The number of folds.                            |
+    +---------------------------------------------------------+-------------------------------------------------+
+    """
+
+    def __init__(self, n_splits=5, shuffle=False, random_state=None):
+        if n_splits < 2:
+            raise ValueError('The number of splits should be integer number greater than 1.')
+        self.n_splits = n_splits
+        self.shuffle = shuffle
+        self.random_state = random_state
+
+    def split(self, X, y, t):
+        """Generate the indices of the train and test sets.
+
+        +------------------+---------------------------------------------------------------------------------+
+        | **Parameters**   | | **X: numpy ndarray with shape = [n_samples, n_features]**                     |
+        |                  | |   Matrix of features.                                                         |
+        |                  | | **y: numpy array with shape = [n_samples,]**                                  |
+        |                  | |   Array of target of feature.                                                 |
+        |                  | | **t: numpy array with shape = [n_samples,]**                                  |
+        |                  | |   Array of treatments.                                                        |
+        +------------------+---------------------------------------------------------------------------------+
+        | **Yields**       | | **(train_index, test_index): tuple of numpy arrays**                          |
+        |                  | |   Indices of the train and of the test samples of every fold.                 |
+        +------------------+---------------------------------------------------------------------------------+
+        """
+
+        size = len(y)
+        if self.n_splits > size:
+            raise ValueError('The number of splits should not be greater than the number of samples.')
+        cells = get_strata(y, t)
+        if self.shuffle:
+            permutation = np.random.default_rng(self.random_state).permutation(size)
+            order = permutation[np.argsort(cells[permutation], kind='stable')]
+        else:
+            order = np.argsort(cells, kind='stable')
+        folds = np.empty(size, dtype=np.intp)
+        folds[order] = np.arange(size) % self.n_splits
+        for fold in range(self.n_splits):
+            is_test = folds == fold
+            yield np.flatnonzero(~is_test), np.flatnonzero(is_test)
+
+    def get_n_splits(self):
+        """The number of folds.
+
+        +------------------+---------------------------------------------------------------------------------+
+        | **Returns**      | **n_splits : int**                                                              |
+        +------------------+---------------------------------------------------------------------------------+
+        """
+        return self.n_splits
@@ -1,4 +1,6 @@
+import numpy as np
 from pyuplift import BaseModel
+from pyuplift.utils.sparse import to_indexable
 
 
 class TransformationBaseModel(BaseModel):
@@ -7,6 +9,71 @@ class TransformationBaseModel(BaseModel):
     Note: This class should not be used directly. Use derived classes instead.
     """
 
+    # Codes of the response groups returned by `encode_response_groups`
+    TR, CN, TN, CR = 0, 1, 2, 3
+    GROUPS = (TR, CN, TN, CR)
+
+    @staticmethod
+    def encode_response_groups(y, t):
+        """Encode every pair (y, t) into one of the TR, CN, TN and CR groups.
+
+        The groups are computed for the whole arrays at once and are coded as
+        TR=0, CN=1, TN=2 and CR=3 (see the class constants).
+
+        Parameters
+        ----------
+        y : numpy array of shape = [n_samples]
+            The target values.
+        t : numpy array of shape = [n_samples]
+            The treatments.
+        Returns
+        -------
+        groups : numpy array of shape = [n_samples] and dtype int8
+            The codes of the response groups.
+        counts : numpy array of shape = [4]
+            The number of samples in each group, indexed by the group code.
+        """
+        treated = np.asarray(t) != 0
+        responded = np.asarray(y) != 0
+        # TR -> 0, CN -> 1, TN -> 2, CR -> 3
+        groups = np.not_equal(treated, responded).astype(np.int8)
+        groups <<= 1
+        groups += ~treated
+        counts = np.bincount(groups, minlength=4)
+        return groups, counts
+
+    def _update_group_counts(self, counts, reset=False):
+        """Add `counts` of a new block of data to the group counts seen so far."""
+        if reset or not hasattr(self, 'group_counts'):
+            self.group_counts = counts
+        else:
+            self.group_counts = self.group_counts + counts
+        return self.group_counts
+
+    def _predict_by_chunks(self, X, chunk_size=None, out=None):
+        """Score X block by block with a single `predict_proba` call per block.
+
+        Derived classes define `_get_uplift(proba)` which turns the probability
+        matrix of a block into the uplift values of this block.
+        """
+        X = to_indexable(X)
+
+        size = X.shape[0]
+        if out is None:
+            out = np.empty(size)
+        elif out.shape != (size,):
+            raise ValueError('Output buffer should have shape ({},).'.format(size))
+
+        if chunk_size is None:
+            chunk_size = max(size, 1)
+        elif chunk_size < 1:
+            raise ValueError('Chunk size should be positive integer number.')
+
+        for start in range(0, size, chunk_size):
+            stop = start + chunk_size
+            out[start:stop] = self._get_uplift(self.model.predict_proba(X[start:stop]))
+        return out
+
     def is_tr(self, y, t):
         """Is pair (y,t) is TR?
         Treatment responders (TR) are customers who were treated and responded
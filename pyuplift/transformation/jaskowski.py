@@ -16,11 +16,13 @@ class Jaskowski(TransformationBaseModel):
     *******
     Methods
     *******
-    +-----------------------------------------------+----------------------------------------------------+
-    | :ref:`fit(self, X, y, t) <jask_fit>`          | Build the model from the training set (X, y, t).   |
-    +-----------------------------------------------+----------------------------------------------------+
-    | :ref:`predict(self, X, t=None) <jask_predict>`| Predict an uplift for X.                           |
-    +-----------------------------------------------+----------------------------------------------------+
+    +------------------------------------------------------+--------------------------------------------------+
+    | :ref:`fit(self, X, y, t) <jask_fit>`                 | Build the model from the training set (X, y, t). |
+    +------------------------------------------------------+--------------------------------------------------+
+    | :ref:`partial_fit(self, X, y, t) <jask_partial_fit>` | Update the model with a block of data (X, y, t). |
+    +------------------------------------------------------+--------------------------------------------------+
+    | :ref:`predict(self, X, t=None) <jask_predict>`       | Predict an uplift for X.                         |
+    +------------------------------------------------------+--------------------------------------------------+
     """
 
     def __init__(self, model=LogisticRegression(n_jobs=-1)):
@@ -46,11 +48,35 @@ class Jaskowski(TransformationBaseModel):
         +------------------+---------------------------------------------------------------------------------+
         """
 
-        y_encoded = self.__encode_data(y, t)
-        self.model.fit(X, y_encoded)
+        groups, counts = self.encode_response_groups(y, t)
+        self._update_group_counts(counts, reset=True)
+        self.model.fit(X, self.__encode_data(groups))
         return self
 
-    def predict(self, X, t=None):
+    def partial_fit(self, X, y, t):
+        """Update the model with a block of the training set (X, y, t).
+
+        The model should contain the `partial_fit` method (e.g. sklearn.linear_model.SGDClassifier).
+
+        +------------------+---------------------------------------------------------------------------------+
+        | **Parameters**   | | **X: numpy ndarray with shape = [n_samples, n_features]**                     |
+        |                  | |   Matrix of features.                                                         |
+        |                  | | **y: numpy array with shape = [n_samples,]**                                  |
+        |                  | |   Array of target of feature.                                                 |
+        |                  | | **t: numpy array with shape = [n_samples,]**                                  |
+        |                  | |   Array of treatments.                                                        |
+        +------------------+---------------------------------------------------------------------------------+
+        | **Returns**      | **self : object**                                                               |
+        +------------------+---------------------------------------------------------------------------------+
+        """
+
+        self._check_partial_fit(self.model)
+        groups, counts = self.encode_response_groups(y, t)
+        self._update_group_counts(counts)
+        self.model.partial_fit(X, self.__encode_data(groups), classes=(0, 1))
+        return self
+
+    def predict(self, X, t=None, chunk_size=None, out=None):
         """Predict an uplift for X.
 
         +------------------+---------------------------------------------------------------------------------+
@@ -58,20 +84,21 @@ class Jaskowski(TransformationBaseModel):
         |                  | |   Matrix of features.                                                         |
         |                  | | **t: numpy array with shape = [n_samples,] or None**                          |
         |                  | |   Array of treatments.                                                        |
+        |                  | | **chunk_size: int or None, optional (default=None)**                          |
+        |                  | |   Number of rows scored at once. By default all rows are scored at once.      |
+        |                  | | **out: numpy array with shape = [n_samples,] or None, optional**              |
+        |                  | |   Buffer where the predicted values will be stored.                           |
         +------------------+---------------------------------------------------------------------------------+
         | **Returns**      | | **self : object**                                                             |
         |                  | |   The predicted values.                                                       |
         +------------------+---------------------------------------------------------------------------------+
         """
 
-        p = self.model.predict_proba(X)[:, 1]
-        return 2 * p - 1
-
-    def __encode_data(self, y, t):
-        y_values = []
-        for i in range(y.shape[0]):
-            if self.is_tr(y[i], t[i]) or self.is_cn(y[i], t[i]):
-                y_values.append(1)
-            else:
-                y_values.append(0)
-        return np.array(y_values)
+        return self._predict_by_chunks(X, chunk_size, out)
+
+    def _get_uplift(self, proba):
+        return 2 * proba[:, 1] - 1
+
+    def __encode_data(self, groups):
+        # TR or CN -> 1, TN or CR -> 0
+        return (groups <= self.CN).astype(np.int8)
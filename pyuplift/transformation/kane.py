@@ -1,4 +1,3 @@
-import numpy as np
 from sklearn.linear_model import LogisticRegression
 
 from .base import TransformationBaseModel
@@ -18,11 +17,13 @@ class Kane(TransformationBaseModel):
     *******
     Methods
     *******
-    +-----------------------------------------------+----------------------------------------------------+
-    | :ref:`fit(self, X, y, t) <lai_fit>`           | Build the model from the training set (X, y, t).   |
-    +-----------------------------------------------+----------------------------------------------------+
-    | :ref:`predict(self, X, t=None) <lai_predict>` | Predict an uplift for X.                           |
-    +-----------------------------------------------+----------------------------------------------------+
+    +------------------------------------------------------+--------------------------------------------------+
+    | :ref:`fit(self, X, y, t) <lai_fit>`                  | Build the model from the training set (X, y, t). |
+    +------------------------------------------------------+--------------------------------------------------+
+    | :ref:`partial_fit(self, X, y, t) <kane_partial_fit>` | Update the model with a block of data (X, y, t). |
+    +------------------------------------------------------+--------------------------------------------------+
+    | :ref:`predict(self, X, t=None) <lai_predict>`        | Predict an uplift for X.                         |
+    +------------------------------------------------------+--------------------------------------------------+
     """
 
     def __init__(self, model=LogisticRegression(n_jobs=-1), use_weights=False):
@@ -49,13 +50,39 @@ class Kane(TransformationBaseModel):
         +------------------+---------------------------------------------------------------------------------+
         """
 
-        y_encoded = self.__encode_data(y, t)
+        y_encoded, counts = self.encode_response_groups(y, t)
         self.model.fit(X, y_encoded)
+        self._update_group_counts(counts, reset=True)
         if self.use_weights:
-            self.__init_weights(t)
+            self.__init_weights(counts)
         return self
 
-    def predict(self, X, t=None):
+    def partial_fit(self, X, y, t):
+        """Update the model with a block of the training set (X, y, t).
+
+        The model should contain the `partial_fit` method (e.g. sklearn.linear_model.SGDClassifier).
+
+        +------------------+---------------------------------------------------------------------------------+
+        | **Parameters**   | | **X: numpy ndarray with shape = [n_samples, n_features]**                     |
+        |                  | |   Matrix of features.                                                         |
+        |                  | | **y: numpy array with shape = [n_samples,]**                                  |
+        |                  | |   Array of target of feature.                                                 |
+        |                  | | **t: numpy array with shape = [n_samples,]**                                  |
+        |                  | |   Array of treatments.                                                        |
+        +------------------+---------------------------------------------------------------------------------+
+        | **Returns**      | **self : object**                                                               |
+        +------------------+---------------------------------------------------------------------------------+
+        """
+
+        self._check_partial_fit(self.model)
+        y_encoded, counts = self.encode_response_groups(y, t)
+        self.model.partial_fit(X, y_encoded, classes=self.GROUPS)
+        counts = self._update_group_counts(counts)
+        if self.use_weights:
+            self.__init_weights(counts)
+        return self
+
+    def predict(self, X, t=None, chunk_size=None, out=None):
         """Predict an uplift for X.
 
         +------------------+---------------------------------------------------------------------------------+
@@ -63,41 +90,26 @@ class Kane(TransformationBaseModel):
         |                  | |   Matrix of features.                                                         |
         |                  | | **t: numpy array with shape = [n_samples,] or None**                          |
         |                  | |   Array of treatments.                                                        |
+        |                  | | **chunk_size: int or None, optional (default=None)**                          |
+        |                  | |   Number of rows scored at once. By default all rows are scored at once.      |
+        |                  | | **out: numpy array with shape = [n_samples,] or None, optional**              |
+        |                  | |   Buffer where the predicted values will be stored.                           |
         +------------------+---------------------------------------------------------------------------------+
         | **Returns**      | | **self : object**                                                             |
         |                  | |   The predicted values.                                                       |
         +------------------+---------------------------------------------------------------------------------+
         """
 
-        p_tr = self.model.predict_proba(X)[:, 0]
-        p_cn = self.model.predict_proba(X)[:, 1]
-        p_tn = self.model.predict_proba(X)[:, 2]
-        p_cr = self.model.predict_proba(X)[:, 3]
+        return self._predict_by_chunks(X, chunk_size, out)
+
+    def _get_uplift(self, proba):
+        p_tr, p_cn, p_tn, p_cr = proba.T
         if self.use_weights:
             return (p_tr / self.treatment_count + p_cn / self.control_count) - \
                    (p_tn / self.treatment_count + p_cr / self.control_count)
         else:
             return (p_tr + p_cn) - (p_tn + p_cr)
 
-    def __encode_data(self, y, t):
-        y_values = []
-        for i in range(y.shape[0]):
-            if self.is_tr(y[i], t[i]):
-                y_values.append(0)
-            elif self.is_cn(y[i], t[i]):
-                y_values.append(1)
-            elif self.is_tn(y[i], t[i]):
-                y_values.append(2)
-            elif self.is_cr(y[i], t[i]):
-                y_values.append(3)
-        return np.array(y_values)
-
-    def __init_weights(self, t):
-        control_count, treatment_count = 0, 0
-        for el in t:
-            if el == 0.0:
-                control_count += 1
-            else:
-                treatment_count += 1
-        self.control_count = control_count
-        self.treatment_count = treatment_count
+    def __init_weights(self, counts):
+        self.control_count = counts[self.CN] + counts[self.CR]
+        self.treatment_count = counts[self.TR] + counts[self.TN]
@@ -18,11 +18,13 @@ class Lai(TransformationBaseModel):
     *******
     Methods
     *******
-    +-----------------------------------------------+----------------------------------------------------+
-    | :ref:`fit(self, X, y, t) <lai_fit>`           | Build a Lai model from the training set (X, y, t). |
-    +-----------------------------------------------+----------------------------------------------------+
-    | :ref:`predict(self, X, t=None) <lai_predict>` | Predict an uplift for X.                           |
-    +-----------------------------------------------+----------------------------------------------------+
+    +-----------------------------------------------------+----------------------------------------------------+
+    | :ref:`fit(self, X, y, t) <lai_fit>`                 | Build a Lai model from the training set (X, y, t). |
+    +-----------------------------------------------------+----------------------------------------------------+
+    | :ref:`partial_fit(self, X, y, t) <lai_partial_fit>` | Update the model with a block of data (X, y, t).   |
+    +-----------------------------------------------------+----------------------------------------------------+
+    | :ref:`predict(self, X, t=None) <lai_predict>`       | Predict an uplift for X.                           |
+    +-----------------------------------------------------+----------------------------------------------------+
     """
 
     def __init__(self, model=LogisticRegression(n_jobs=-1), use_weights=False):
@@ -49,13 +51,39 @@ class Lai(TransformationBaseModel):
         +------------------+---------------------------------------------------------------------------------+
         """
 
-        y_encoded = self.__encode_data(y, t)
+        groups, counts = self.encode_response_groups(y, t)
+        self._update_group_counts(counts, reset=True)
         if self.use_weights:
-            self.__init_weights(y, t)
-        self.model.fit(X, y_encoded)
+            self.__init_weights(counts)
+        self.model.fit(X, self.__encode_data(groups))
         return self
 
-    def predict(self, X, t=None):
+    def partial_fit(self, X, y, t):
+        """Update the model with a block of the training set (X, y, t).
+
+        The model should contain the `partial_fit` method (e.g. sklearn.linear_model.SGDClassifier).
+
+        +------------------+---------------------------------------------------------------------------------+
+        | **Parameters**   | | **X: numpy ndarray with shape = [n_samples, n_features]**                     |
+        |                  | |   Matrix of features.                                                         |
+        |                  | | **y: numpy array with shape = [n_samples,]**                                  |
+        |                  | |   Array of target of feature.                                                 |
+        |                  | | **t: numpy array with shape = [n_samples,]**                                  |
+        |                  | |   Array of treatments.                                                        |
+        +------------------+---------------------------------------------------------------------------------+
+        | **Returns**      | **self : object**                                                               |
+        +------------------+---------------------------------------------------------------------------------+
+        """
+
+        self._check_partial_fit(self.model)
+        groups, counts = self.encode_response_groups(y, t)
+        counts = self._update_group_counts(counts)
+        if self.use_weights:
+            self.__init_weights(counts)
+        self.model.partial_fit(X, self.__encode_data(groups), classes=(0, 1))
+        return self
+
+    def predict(self, X, t=None, chunk_size=None, out=None):
         """Predict an uplift for X.
 
         +------------------+---------------------------------------------------------------------------------+
@@ -63,35 +91,32 @@ class Lai(TransformationBaseModel):
         |                  | |   Matrix of features.                                                         |
         |                  | | **t: numpy array with shape = [n_samples,] or None**                          |
         |                  | |   Array of treatments.                                                        |
+        |                  | | **chunk_size: int or None, optional (default=None)**                          |
+        |                  | |   Number of rows scored at once. By default all rows are scored at once.      |
+        |                  | | **out: numpy array with shape = [n_samples,] or None, optional**              |
+        |                  | |   Buffer where the predicted values will be stored.                           |
         +------------------+---------------------------------------------------------------------------------+
         | **Returns**      | | **self : object**                                                             |
         |                  | |   The predicted values.                                                       |
         +------------------+---------------------------------------------------------------------------------+
         """
 
-        p_tr_cn = self.model.predict_proba(X)[:, 1]
+        return self._predict_by_chunks(X, chunk_size, out)
+
+    def _get_uplift(self, proba):
+        p_tr_cn = proba[:, 1]
         if self.use_weights:
-            p_tn_cr = self.model.predict_proba(X)[:, 0]
+            p_tn_cr = proba[:, 0]
             return p_tr_cn * self.p_tr_or_cn - p_tn_cr * self.p_tn_or_cr
         else:
             return 2 * p_tr_cn - 1
 
-    def __encode_data(self, y, t):
-        y_values = []
-        for i in range(y.shape[0]):
-            if self.is_tr(y[i], t[i]) or self.is_cn(y[i], t[i]):
-                y_values.append(1)
-            elif self.is_tn(y[i], t[i]) or self.is_cr(y[i], t[i]):
-                y_values.append(0)
-        return np.array(y_values)
-
-    def __init_weights(self, y, t):
-        pos_count, neg_count = 0, 0
-        for i in range(y.shape[0]):
-            if self.is_tr(y[i], t[i]) or self.is_cn(y[i], t[i]):
-                pos_count += 1
-            elif self.is_tn(y[i], t[i]) or self.is_cr(y[i], t[i]):
-                neg_count += 1
+    def __encode_data(self, groups):
+        # TR or CN -> 1, TN or CR -> 0
+        return (groups <= self.CN).astype(np.int8)
 
+    def __init_weights(self, counts):
+        pos_count = counts[self.TR] + counts[self.CN]
+        neg_count = counts[self.TN] + counts[self.CR]
         self.p_tr_or_cn = pos_count / (pos_count + neg_count)
         self.p_tn_or_cr = neg_count / (pos_count + neg_count)
@@ -1,4 +1,6 @@
+import copy
 from sklearn.linear_model import LogisticRegression
+from pyuplift.utils.sparse import to_indexable
 
 from .base import TransformationBaseModel
 from .lai import Lai
@@ -11,27 +13,36 @@ class Pessimistic(TransformationBaseModel):
     +----------------+-----------------------------------------------------------------------------------+
     | **Parameters** | | **model : object, optional (default=sklearn.linear_model.LogisticRegression)**  |
     |                | |   The classification model which will be used for predict uplift.               |
+    |                | | **shared_fit : boolean, optional (default=False)**                              |
+    |                | |   Fit one 4-class model and derive both the weighted Lai and the reflective     |
+    |                | |   uplifts from its probabilities instead of fitting two models?                 |
     +----------------+-----------------------------------------------------------------------------------+
 
 
     *******
     Methods
     *******
-    +-----------------------------------------------+----------------------------------------------------+
-    | :ref:`fit(self, X, y, t) <pes_fit>`           | Build the model from the training set (X, y, t).   |
-    +-----------------------------------------------+----------------------------------------------------+
-    | :ref:`predict(self, X, t=None) <pes_predict>` | Predict an uplift for X.                           |
-    +-----------------------------------------------+----------------------------------------------------+
+    +-----------------------------------------------------+--------------------------------------------------+
+    | :ref:`fit(self, X, y, t) <pes_fit>`                 | Build the model from the training set (X, y, t). |
+    +-----------------------------------------------------+--------------------------------------------------+
+    | :ref:`partial_fit(self, X, y, t) <pes_partial_fit>` | Update the model with a block of data (X, y, t). |
+    +-----------------------------------------------------+--------------------------------------------------+
+    | :ref:`predict(self, X, t=None) <pes_predict>`       | Predict an uplift for X.                         |
+    +-----------------------------------------------------+--------------------------------------------------+
     """
 
-    def __init__(self, model=LogisticRegression(n_jobs=-1)):
+    def __init__(self, model=LogisticRegression(n_jobs=-1), shared_fit=False):
         try:
             model.__getattribute__('fit')
             model.__getattribute__('predict')
         except AttributeError:
             raise ValueError('Model should contains two methods: fit and predict.')
-        self.w_lai_model = Lai(model, use_weights=True)
-        self.reflective_model = Reflective(model)
+        self.model = model
+        self.shared_fit = shared_fit
+        if not shared_fit:
+            # Each approach needs its own copy of the model, otherwise the second fit overwrites the first one
+            self.w_lai_model = Lai(copy.deepcopy(model), use_weights=True)
+            self.reflective_model = Reflective(model)
 
     def fit(self, X, y, t):
         """Build the model from the training set (X, y, t).
@@ -48,11 +59,43 @@ class Pessimistic(TransformationBaseModel):
         +------------------+---------------------------------------------------------------------------------+
         """
 
-        self.w_lai_model.fit(X, y, t)
-        self.reflective_model.fit(X, y, t)
+        if self.shared_fit:
+            y_encoded, counts = self.encode_response_groups(y, t)
+            self.model.fit(X, y_encoded)
+            self.__init_weights(self._update_group_counts(counts, reset=True))
+        else:
+            self.w_lai_model.fit(X, y, t)
+            self.reflective_model.fit(X, y, t)
         return self
 
-    def predict(self, X, t=None):
+    def partial_fit(self, X, y, t):
+        """Update the model with a block of the training set (X, y, t).
+
+        The model should contain the `partial_fit` method (e.g. sklearn.linear_model.SGDClassifier).
+
+        +------------------+---------------------------------------------------------------------------------+
+        | **Parameters**   | | **X: numpy ndarray with shape = [n_samples, n_features]**                     |
+        |                  | |   Matrix of features.                                                         |
+        |                  | | **y: numpy array with shape = [n_samples,]**                                  |
+        |                  | |   Array of target of feature.                                                 |
+        |                  | | **t: numpy array with shape = [n_samples,]**                                  |
+        |                  | |   Array of treatments.                                                        |
+        +------------------+---------------------------------------------------------------------------------+
+        | **Returns**      | **self : object**                                                               |
+        +------------------+---------------------------------------------------------------------------------+
+        """
+
+        if self.shared_fit:
+            self._check_partial_fit(self.model)
+            y_encoded, counts = self.encode_response_groups(y, t)
+            self.model.partial_fit(X, y_encoded, classes=self.GROUPS)
+            self.__init_weights(self._update_group_counts(counts))
+        else:
+            self.w_lai_model.partial_fit(X, y, t)
+            self.reflective_model.partial_fit(X, y, t)
+        return self
+
+    def predict(self, X, t=None, chunk_size=None, out=None):
         """Predict an uplift for X.
 
         +------------------+---------------------------------------------------------------------------------+
@@ -60,12 +103,47 @@ class Pessimistic(TransformationBaseModel):
         |                  | |   Matrix of features.                                                         |
         |                  | | **t: numpy array with shape = [n_samples,] or None**                          |
         |                  | |   Array of treatments.                                                        |
+        |                  | | **chunk_size: int or None, optional (default=None)**                          |
+        |                  | |   Number of rows scored at once. By default all rows are scored at once.      |
+        |                  | | **out: numpy array with shape = [n_samples,] or None, optional**              |
+        |                  | |   Buffer where the predicted values will be stored.                           |
         +------------------+---------------------------------------------------------------------------------+
         | **Returns**      | | **self : object**                                                             |
         |                  | |   The predicted values.                                                       |
         +------------------+---------------------------------------------------------------------------------+
         """
 
-        w_lai_uplift = self.w_lai_model.predict(X)
-        reflective_uplift = self.reflective_model.predict(X)
+        if self.shared_fit:
+            return self._predict_by_chunks(X, chunk_size, out)
+
+        uplift = self.w_lai_model.predict(X, chunk_size=chunk_size, out=out)
+        X = to_indexable(X)
+        # The reflective uplift is added block by block, so only a block-sized temporary array is allocated
+        size = X.shape[0]
+        step = max(size, 1) if chunk_size is None else chunk_size
+        for start in range(0, size, step):
+            block = uplift[start:start + step]
+            block += self.reflective_model.predict(X[start:start + step])
+            block /= 2
+        return uplift
+
+    def _get_uplift(self, proba):
+        p_tr, p_cn, p_tn, p_cr = proba.T
+        w_lai_uplift = (p_tr + p_cn) * self.p_tr_or_cn - (p_tn + p_cr) * self.p_tn_or_cr
+        reflective_uplift = (self.p_tlr * p_tr + self.p_cln * p_cn) - (self.p_tln * p_tn + self.p_clr * p_cr)
         return (w_lai_uplift + reflective_uplift) / 2
+
+    def __init_weights(self, counts):
+        # Weights of the Lai's approach
+        pos_count = counts[self.TR] + counts[self.CN]
+        neg_count = counts[self.TN] + counts[self.CR]
+        self.p_tr_or_cn = pos_count / (pos_count + neg_count)
+        self.p_tn_or_cr = neg_count / (pos_count + neg_count)
+
+        # Weights of the reflective approach
+        r_count = counts[self.TR] + counts[self.CR]
+        n_count = counts[self.TN] + counts[self.CN]
+        self.p_tlr = counts[self.TR] / r_count
+        self.p_clr = counts[self.CR] / r_count
+        self.p_cln = counts[self.CN] / n_count
+        self.p_tln = counts[self.TN] / n_count
@@ -1,4 +1,3 @@
-import numpy as np
 from sklearn.linear_model import LogisticRegression
 
 from .base import TransformationBaseModel
@@ -16,11 +15,13 @@ class Reflective(TransformationBaseModel):
     *******
     Methods
     *******
-    +-----------------------------------------------+----------------------------------------------------+
-    | :ref:`fit(self, X, y, t) <ref_fit>`           | Build the model from the training set (X, y, t).   |
-    +-----------------------------------------------+----------------------------------------------------+
-    | :ref:`predict(self, X, t=None) <ref_predict>` | Predict an uplift for X.                           |
-    +-----------------------------------------------+----------------------------------------------------+
+    +-----------------------------------------------------+--------------------------------------------------+
+    | :ref:`fit(self, X, y, t) <ref_fit>`                 | Build the model from the training set (X, y, t). |
+    +-----------------------------------------------------+--------------------------------------------------+
+    | :ref:`partial_fit(self, X, y, t) <ref_partial_fit>` | Update the model with a block of data (X, y, t). |
+    +-----------------------------------------------------+--------------------------------------------------+
+    | :ref:`predict(self, X, t=None) <ref_predict>`       | Predict an uplift for X.                         |
+    +-----------------------------------------------------+--------------------------------------------------+
     """
 
     def __init__(self, model=LogisticRegression(n_jobs=-1)):
@@ -46,12 +47,35 @@ class Reflective(TransformationBaseModel):
         +------------------+---------------------------------------------------------------------------------+
         """
 
-        y_encoded = self.__encode_data(y, t)
+        y_encoded, counts = self.encode_response_groups(y, t)
         self.model.fit(X, y_encoded)
-        self.__init_weights(y, t)
+        self.__init_weights(self._update_group_counts(counts, reset=True))
         return self
 
-    def predict(self, X, t=None):
+    def partial_fit(self, X, y, t):
+        """Update the model with a block of the training set (X, y, t).
+
+        The model should contain the `partial_fit` method (e.g. sklearn.linear_model.SGDClassifier).
+
+        +------------------+---------------------------------------------------------------------------------+
+        | **Parameters**   | | **X: numpy ndarray with shape = [n_samples, n_features]**                     |
+        |                  | |   Matrix of features.                                                         |
+        |                  | | **y: numpy array with shape = [n_samples,]**                                  |
+        |                  | |   Array of target of feature.                                                 |
+        |                  | | **t: numpy array with shape = [n_samples,]**                                  |
+        |                  | |   Array of treatments.                                                        |
+        +------------------+---------------------------------------------------------------------------------+
+        | **Returns**      | **self : object**                                                               |
+        +------------------+---------------------------------------------------------------------------------+
+        """
+
+        self._check_partial_fit(self.model)
+        y_encoded, counts = self.encode_response_groups(y, t)
+        self.model.partial_fit(X, y_encoded, classes=self.GROUPS)
+        self.__init_weights(self._update_group_counts(counts))
+        return self
+
+    def predict(self, X, t=None, chunk_size=None, out=None):
         """Predict an uplift for X.
 
         +------------------+---------------------------------------------------------------------------------+
@@ -59,57 +83,29 @@ class Reflective(TransformationBaseModel):
         |                  | |   Matrix of features.                                                         |
         |                  | | **t: numpy array with shape = [n_samples,] or None**                          |
         |                  | |   Array of treatments.                                                        |
+        |                  | | **chunk_size: int or None, optional (default=None)**                          |
+        |                  | |   Number of rows scored at once. By default all rows are scored at once.      |
+        |                  | | **out: numpy array with shape = [n_samples,] or None, optional**              |
+        |                  | |   Buffer where the predicted values will be stored.                           |
         +------------------+---------------------------------------------------------------------------------+
         | **Returns**      | | **self : object**                                                             |
         |                  | |   The predicted values.                                                       |
         +------------------+---------------------------------------------------------------------------------+
         """
 
-        p_tr = self.model.predict_proba(X)[:, 0]
-        p_cn = self.model.predict_proba(X)[:, 1]
-        p_tn = self.model.predict_proba(X)[:, 2]
-        p_cr = self.model.predict_proba(X)[:, 3]
+        return self._predict_by_chunks(X, chunk_size, out)
 
+    def _get_uplift(self, proba):
+        p_tr, p_cn, p_tn, p_cr = proba.T
         p_pos = self.p_tlr * p_tr + self.p_cln * p_cn
         p_neg = self.p_tln * p_tn + self.p_clr * p_cr
         return p_pos - p_neg
 
-    def __encode_data(self, y, t):
-        y_values = []
-        for i in range(y.shape[0]):
-            if self.is_tr(y[i], t[i]):
-                y_values.append(0)
-            elif self.is_cn(y[i], t[i]):
-                y_values.append(1)
-            elif self.is_tn(y[i], t[i]):
-                y_values.append(2)
-            elif self.is_cr(y[i], t[i]):
-                y_values.append(3)
-        return np.array(y_values)
-
-    def __init_weights(self, y, t):
-        t_r, c_r, t_n, c_n = 0, 0, 0, 0
-        r_count, n_count = 0, 0
-        size = y.shape[0]
-        for i in range(size):
-            if y[i] != 0:
-                r_count += 1
-                if t[i] != 0:
-                    # T|R
-                    t_r += 1
-                else:
-                    # C|R
-                    c_r += 1
-            else:
-                n_count += 1
-                if t[i] != 0:
-                    # T|N
-                    t_n += 1
-                else:
-                    # C|N
-                    c_n += 1
-
-        self.p_tlr = t_r / r_count
-        self.p_clr = c_r / r_count
-        self.p_cln = c_n / n_count
-        self.p_tln = t_n / n_count
+    def __init_weights(self, counts):
+        # P(T|R), P(C|R), P(C|N) and P(T|N)
+        r_count = counts[self.TR] + counts[self.CR]
+        n_count = counts[self.TN] + counts[self.CN]
+        self.p_tlr = counts[self.TR] / r_count
+        self.p_clr = counts[self.CR] / r_count
+        self.p_cln = counts[self.CN] / n_count
+        self.p_tln = counts[self.TN] / n_count
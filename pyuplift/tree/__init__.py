@@ -0,0 +1,4 @@
+from .binning import Binner
+from .tree import UpliftTreeClassifier
+from .forest import UpliftRandomForestClassifier
+from .boosting import UpliftGradientBoosting
@@ -0,0 +1,88 @@
+import numpy as np
+
+
+class Binner:
+    """The class which maps continuous features to integer bins.
+
+    The bin edges of every feature are the midpoints between its distinct values if there are
+    at most `max_bins` of them, otherwise the quantiles of the feature.
+    A value `x` falls into the bin `b` if `edges[b - 1] < x <= edges[b]`, missing values fall into the last bin.
+
+    +----------------+-----------------------------------------------------------------------------------+
+    | **Parameters** | | **max_bins : int, optional (default=255)**                                      |
+    |                | |   The maximum number of bins of a feature, between 2 and 256.                   |
+    |                | | **subsample : int or None, optional (default=200000)**                          |
+    |                | |   The number of rows used to compute the quantiles. None means all rows.        |
+    |                | | **random_state : int or None, optional (default=None)**                         |
+    |                | |   The seed used to choose the subsample.                                        |
+    +----------------+-----------------------------------------------------------------------------------+
+
+    *******
+    Methods
+    *******
+    +-------------------------------------------------+-------------------------------------------------+
+    | :ref:`fit(self, X) <binner_fit>`                | Compute the bin edges of every feature of X.    |
+    +-------------------------------------------------+-------------------------------------------------+
+    | :ref:`transform(self, X) <binner_transform>`    | Map the features of X to bins.                  |
+    +-------------------------------------------------+-------------------------------------------------+
+    """
+
+    def __init__(self, max_bins=255, subsample=200000, random_state=None):
+        if not (2 <= max_bins <= 256):
+            raise ValueError('The maximum number of bins should be integer number between 2 and 256.')
+        self.max_bins = max_bins
+        self.subsample = subsample
+        self.random_state = random_state
+
+    def fit(self, X):
+        """Compute the bin edges of every feature of X.
+
+        +------------------+---------------------------------------------------------------------------------+
+        | **Parameters**   | | **X: numpy ndarray with shape = [n_samples, n_features]**                     |
+        |                  | |   Matrix of features.                                                         |
+        +------------------+---------------------------------------------------------------------------------+
+        | **Returns**      | **self : object**                                                               |
+        +------------------+---------------------------------------------------------------------------------+
+        """
+
+        X = np.asarray(X)
+        if self.subsample is not None and X.shape[0] > self.subsample:
+            rng = np.random.default_rng(self.random_state)
+            X = X[np.sort(rng.choice(X.shape[0], self.subsample, replace=False))]
+
+        self.bin_edges_ = [self.__get_edges(X[:, i]) for i in range(X.shape[1])]
+        self.n_bins_ = np.array([edges.shape[0] + 1 for edges in self.bin_edges_])
+        return self
+
+    def transform(self, X):
+        """Map the features of X to bins.
+
+        +------------------+---------------------------------------------------------------------------------+
+        | **Parameters**   | | **X: numpy ndarray with shape = [n_samples, n_features]**                     |
+        |                  | |   Matrix of features.                                                         |
+        +------------------+---------------------------------------------------------------------------------+
+        | **Returns**      | | **X_binned: numpy ndarray with shape = [n_samples, n_features]**              |
+        |                  | |   Fortran-ordered matrix of bins with dtype uint8.                            |
+        +------------------+---------------------------------------------------------------------------------+
+        """
+
+        X = np.asarray(X)
+        if X.shape[1] != len(self.bin_edges_):
+            raise ValueError('X has {} features, but the binner was fitted with {} features.'.format(
+                X.shape[1], len(self.bin_edges_)))
+
+        X_binned = np.empty(X.shape, dtype=np.uint8, order='F')
+        for i, edges in enumerate(self.bin_edges_):
+            X_binned[:, i] = np.searchsorted(edges, X[:, i], side='left')
+        return X_binned
+
+    def fit_transform(self, X):
+        return self.fit(X).transform(X)
+
+    def __get_edges(self, col):
+        col = col[~np.isnan(col)].astype(np.float64)
+        values = np.unique(col)
+        if values.shape[0] <= self.max_bins:
+            return (values[:-1] + values[1:]) / 2
+        quantiles = np.linspace(0, 1, self.max_bins + 1)[1:-1]
+        return np.unique(np.quantile(col, quantiles))
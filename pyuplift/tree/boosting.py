@@ -0,0 +1,333 @@
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from joblib import effective_n_jobs
+from pyuplift import BaseModel
+from pyuplift.metrics import get_average_effect
+from .binning import Binner
+from .tree import _apply, _check_array
+
+# Smaller nodes are not worth dispatching to the threads
+MIN_PARALLEL_SAMPLES = 10000
+
+
+class UpliftGradientBoosting(BaseModel):
+    """The class which implements the gradient boosting of the transformed outcome [1].
+
+    The trees minimize the squared error between the prediction and the transformed outcome
+    `z = y * (t - p) / (p * (1 - p))`, where `p` is the propensity, so the prediction estimates the uplift.
+    The features are binned once and the split search of a node scans histograms of gradient sums
+    and treatment/control counts per bin. The histograms of the features are accumulated in `n_jobs` threads.
+
+    +----------------+-----------------------------------------------------------------------------------+
+    | **Parameters** | | **learning_rate : float, optional (default=0.1)**                               |
+    |                | |   The shrinkage of the trees.                                                   |
+    |                | | **max_iter : int, optional (default=100)**                                      |
+    |                | |   The maximum number of trees.                                                  |
+    |                | | **max_depth : int, optional (default=3)**                                       |
+    |                | |   The maximum depth of a tree.                                                  |
+    |                | | **min_samples_leaf : int, optional (default=20)**                               |
+    |                | |   The minimum number of samples in a leaf.                                      |
+    |                | | **min_samples_treatment : int, optional (default=10)**                          |
+    |                | |   The minimum number of treatment and of control samples in a leaf.             |
+    |                | | **l2_regularization : float, optional (default=0.0)**                           |
+    |                | |   The L2 regularization of the leaf values.                                     |
+    |                | | **max_bins : int, optional (default=255)**                                      |
+    |                | |   The maximum number of bins of a feature, between 2 and 256.                   |
+    |                | | **early_stopping : bool, optional (default=False)**                             |
+    |                | |   Stop the training when the validation score does not improve.                |
+    |                | | **validation_fraction : float, optional (default=0.1)**                         |
+    |                | |   The share of the training set held out for the early stopping.                |
+    |                | | **n_iter_no_change : int, optional (default=10)**                               |
+    |                | |   The number of trees without improvement of the validation score to stop.      |
+    |                | | **tol : float, optional (default=0.0)**                                         |
+    |                | |   The minimum improvement of the validation score.                              |
+    |                | | **scoring : callable or None, optional (default=None)**                         |
+    |                | |   The validation score `scoring(y, t, uplift)`, greater is better.              |
+    |                | |   None means `pyuplift.metrics.get_average_effect`.                             |
+    |                | | **n_jobs : int or None, optional (default=None)**                               |
+    |                | |   The number of threads to accumulate the histograms.                           |
+    |                | |   None means 1, -1 means using all processors.                                  |
+    |                | | **random_state : int or None, optional (default=None)**                         |
+    |                | |   The seed used to bin the features and to hold out the validation set.        |
+    +----------------+-----------------------------------------------------------------------------------+
+
+    *******
+    Methods
+    *******
+    +------------------------------------------------------------------+----------------------------------------------------+
+    | :ref:`fit(self, X, y, t, propensity=None) <boosting_fit>`        | Build a boosting from the training set (X, y, t).  |
+    +------------------------------------------------------------------+----------------------------------------------------+
+    | :ref:`predict(self, X, t=None) <boosting_predict>`               | Predict an uplift for X.                           |
+    +------------------------------------------------------------------+----------------------------------------------------+
+    """
+
+    def __init__(
+        self,
+        learning_rate=0.1,
+        max_iter=100,
+        max_depth=3,
+        min_samples_leaf=20,
+        min_samples_treatment=10,
+        l2_regularization=0.0,
+        max_bins=255,
+        early_stopping=False,
+        validation_fraction=0.1,
+        n_iter_no_change=10,
+        tol=0.0,
+        scoring=None,
+        n_jobs=None,
+        random_state=None
+    ):
+        if learning_rate <= 0:
+            raise ValueError('Learning rate should be positive number.')
+        if max_iter < 1:
+            raise ValueError('The maximum number of trees should be positive integer number.')
+        if max_depth < 1:
+            raise ValueError('The maximum depth should be positive integer number.')
+        if min_samples_leaf < 1:
+            raise ValueError('The minimum number of samples in a leaf should be positive integer number.')
+        if l2_regularization < 0:
+            raise ValueError('L2 regularization should be non-negative number.')
+        if not (2 <= max_bins <= 256):
+            raise ValueError('The maximum number of bins should be integer number between 2 and 256.')
+        if not (0 < validation_fraction < 1):
+            raise ValueError('Validation fraction should be float number between 0 and 1.')
+        if n_iter_no_change < 1:
+            raise ValueError('The number of iterations without change should be positive integer number.')
+        self.learning_rate = learning_rate
+        self.max_iter = max_iter
+        self.max_depth = max_depth
+        self.min_samples_leaf = min_samples_leaf
+        self.min_samples_treatment = min_samples_treatment
+        self.l2_regularization = l2_regularization
+        self.max_bins = max_bins
+        self.early_stopping = early_stopping
+        self.validation_fraction = validation_fraction
+        self.n_iter_no_change = n_iter_no_change
+        self.tol = tol
+        self.scoring = scoring
+        self.n_jobs = n_jobs
+        self.random_state = random_state
+
+    def fit(self, X, y, t, propensity=None):
+        """Build a boosting from the training set (X, y, t).
+
+        +------------------+---------------------------------------------------------------------------------+
+        | **Parameters**   | | **X: numpy ndarray with shape = [n_samples, n_features]**                     |
+        |                  | |   Matrix of features.                                                         |
+        |                  | | **y: numpy array with shape = [n_samples,]**                                  |
+        |                  | |   Array of target of feature.                                                 |
+        |                  | | **t: numpy array with shape = [n_samples,]**                                  |
+        |                  | |   Array of treatments.                                                        |
+        |                  | | **propensity: numpy array with shape = [n_samples,] or None, optional**       |
+        |                  | |   Probabilities of the treatment for each sample. By default the share of     |
+        |                  | |   the treated samples is used for all samples (randomized experiments).       |
+        +------------------+---------------------------------------------------------------------------------+
+        | **Returns**      | **self : object**                                                               |
+        +------------------+---------------------------------------------------------------------------------+
+        """
+
+        X = _check_array(X)
+        y, t = np.asarray(y), np.asarray(t)
+        treated = t != 0
+        z = self.__get_transformed_outcome(y, treated, propensity)
+        rng = np.random.RandomState(self.random_state)
+
+        train = np.arange(y.shape[0])
+        if self.early_stopping:
+            n_validation = int(self.validation_fraction * y.shape[0])
+            if n_validation < 1 or n_validation == y.shape[0]:
+                raise ValueError('The training set is too small to hold out the validation set.')
+            permutation = rng.permutation(y.shape[0])
+            validation, train = np.sort(permutation[:n_validation]), np.sort(permutation[n_validation:])
+            X_validation, y_validation, t_validation = X[validation], y[validation], t[validation]
+            uplift_validation = np.empty(n_validation)
+            scoring = get_average_effect if self.scoring is None else self.scoring
+            X, z, treated = X[train], z[train], treated[train]
+
+        self.binner_ = Binner(self.max_bins, random_state=rng.randint(np.iinfo(np.int32).max)).fit(X)
+        X_binned = self.binner_.transform(X)
+        n_bins = max(edges.shape[0] for edges in self.binner_.bin_edges_) + 1
+
+        self.baseline_ = z.mean()
+        raw_prediction = np.full(z.shape[0], self.baseline_)
+        self.estimators_, self.validation_scores_ = [], []
+        if self.early_stopping:
+            uplift_validation[:] = self.baseline_
+            best_score, best_iter = -np.inf, 0
+
+        n_threads = effective_n_jobs(self.n_jobs)
+        executor = ThreadPoolExecutor(n_threads) if n_threads > 1 else None
+        try:
+            # The histogram of the root is built once, the next trees update its gradient sums by the leaf values
+            root_histogram = _build_histogram(
+                X_binned, raw_prediction - z, treated, np.arange(z.shape[0]), n_bins, executor
+            )
+            for i in range(self.max_iter):
+                tree, leaves = self.__grow_tree(X_binned, raw_prediction - z, treated, n_bins, executor, root_histogram)
+                for node, indices, histogram in leaves:
+                    np.add.at(raw_prediction, indices, tree.value[node])
+                    root_histogram[..., 0] += tree.value[node] * (histogram[..., 1] + histogram[..., 2])
+                self.estimators_.append(tree)
+
+                if self.early_stopping:
+                    uplift_validation += tree.predict(X_validation)
+                    score = scoring(y_validation, t_validation, uplift_validation)
+                    self.validation_scores_.append(score)
+                    if score > best_score + self.tol:
+                        best_score, best_iter = score, i
+                    elif i - best_iter >= self.n_iter_no_change:
+                        break
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        if self.early_stopping:
+            self.estimators_ = self.estimators_[:best_iter + 1]
+        self.n_iter_ = len(self.estimators_)
+        return self
+
+    def predict(self, X, t=None):
+        """Predict an uplift for X.
+
+        +------------------+---------------------------------------------------------------------------------+
+        | **Parameters**   | | **X: numpy ndarray with shape = [n_samples, n_features]**                     |
+        |                  | |   Matrix of features.                                                         |
+        |                  | | **t: numpy array with shape = [n_samples,] or None**                          |
+        |                  | |   Array of treatments.                                                        |
+        +------------------+---------------------------------------------------------------------------------+
+        | **Returns**      | | **self : object**                                                             |
+        |                  | |   The predicted values.                                                       |
+        +------------------+---------------------------------------------------------------------------------+
+        """
+
+        X = _check_array(X)
+        uplift = np.full(X.shape[0], self.baseline_)
+        for tree in self.estimators_:
+            uplift += tree.predict(X)
+        return uplift
+
+    def __get_transformed_outcome(self, y, treated, propensity=None):
+        if propensity is None:
+            p = treated.mean()
+            if not (0 < p < 1):
+                raise ValueError('The training set should contain treatment and control samples.')
+        else:
+            p = np.asarray(propensity)
+            if p.shape != y.shape:
+                raise ValueError('Propensity should have the same shape as the target.')
+            if not np.all((p > 0) & (p < 1)):
+                raise ValueError('Propensity should be between 0 and 1 (exclusive).')
+        return y * (treated - p) / (p * (1 - p))
+
+    def __grow_tree(self, X_binned, gradients, treated, n_bins, executor, root_histogram):
+        bin_edges = self.binner_.bin_edges_
+        feature, threshold, left, right, value, leaves = [], [], [], [], [], []
+
+        def add_node(histogram):
+            gradient_sum, n_control, n_treated = histogram[0].sum(axis=0)
+            feature.append(-1)
+            threshold.append(np.nan)
+            left.append(-1)
+            right.append(-1)
+            value.append(-self.learning_rate * gradient_sum / (n_control + n_treated + self.l2_regularization))
+            return len(feature) - 1
+
+        indices = np.arange(X_binned.shape[0])
+        stack = [(add_node(root_histogram), indices, root_histogram, 0)]
+        while stack:
+            node, indices, histogram, depth = stack.pop()
+            best_feature, best_bin, gain = None, None, -np.inf
+            if depth < self.max_depth and indices.shape[0] >= 2 * self.min_samples_leaf:
+                best_feature, best_bin, gain = _find_best_split(
+                    histogram, self.l2_regularization, self.min_samples_leaf, self.min_samples_treatment
+                )
+            if not gain > 0:
+                leaves.append((node, indices, histogram))
+                continue
+
+            # np.compress is several times faster than the boolean indexing
+            go_left = X_binned[:, best_feature].take(indices) <= best_bin
+            children = [np.compress(go_left, indices), np.compress(~go_left, indices)]
+            small = 0 if children[0].shape[0] <= children[1].shape[0] else 1
+            histograms = [None, None]
+            histograms[small] = _build_histogram(X_binned, gradients, treated, children[small], n_bins, executor)
+            histograms[1 - small] = histogram - histograms[small]
+
+            feature[node] = best_feature
+            threshold[node] = bin_edges[best_feature][best_bin]
+            left[node] = add_node(histograms[0])
+            right[node] = add_node(histograms[1])
+            stack.append((right[node], children[1], histograms[1], depth + 1))
+            stack.append((left[node], children[0], histograms[0], depth + 1))
+
+        return _GradientTree(feature, threshold, left, right, value), leaves
+
+
+class _GradientTree:
+    """The regression tree of the boosting, grown by `UpliftGradientBoosting`."""
+
+    def __init__(self, feature, threshold, children_left, children_right, value):
+        self.feature = np.array(feature, dtype=np.intp)
+        self.threshold = np.array(threshold, dtype=np.float64)
+        self.children_left = np.array(children_left, dtype=np.intp)
+        self.children_right = np.array(children_right, dtype=np.intp)
+        self.value = np.array(value, dtype=np.float64)
+
+    def predict(self, X):
+        return self.value[_apply(X, self.feature, self.threshold, self.children_left, self.children_right)]
+
+
+def _build_histogram(X_binned, gradients, treated, indices, n_bins, executor=None):
+    """Histograms of the gradient sums and the control/treatment counts with shape = [n_features, n_bins, 3].
+
+    The features are processed by the threads of `executor` if the node has at least `MIN_PARALLEL_SAMPLES` rows.
+    Numpy releases the GIL while gathering a column, so the gain of the threads depends on the share of this step.
+    """
+    node_gradients = gradients.take(indices)
+    node_treated = treated.take(indices).astype(np.intp)
+
+    def build(feature):
+        return _build_feature_histogram(X_binned, feature, indices, node_gradients, node_treated, n_bins)
+
+    features = range(X_binned.shape[1])
+    if executor is None or indices.shape[0] < MIN_PARALLEL_SAMPLES:
+        return np.stack([build(feature) for feature in features])
+    return np.stack(list(executor.map(build, features)))
+
+
+def _build_feature_histogram(X_binned, feature, indices, gradients, treated, n_bins):
+    keys = X_binned[:, feature].take(indices).astype(np.intp)
+    histogram = np.empty((n_bins, 3))
+    histogram[:, 0] = np.bincount(keys, weights=gradients, minlength=n_bins)
+    # Control and treatment counts from one pass: key = 2 * bin + treated
+    keys <<= 1
+    keys |= treated
+    histogram[:, 1:] = np.bincount(keys, minlength=2 * n_bins).reshape(n_bins, 2)
+    return histogram
+
+
+def _find_best_split(histogram, l2_regularization, min_samples_leaf, min_samples_treatment):
+    """Find the split which decreases the squared error the most, rows with bins <= `bin` go to the left child."""
+    left = np.cumsum(histogram, axis=1)[:, :-1]
+    total = histogram[0].sum(axis=0)
+    right = total - left
+    if left.size == 0:
+        return 0, 0, -np.inf
+
+    n_left = left[..., 1] + left[..., 2]
+    n_right = right[..., 1] + right[..., 2]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        gain = (
+            left[..., 0] ** 2 / (n_left + l2_regularization) +
+            right[..., 0] ** 2 / (n_right + l2_regularization) -
+            total[0] ** 2 / (total[1] + total[2] + l2_regularization)
+        )
+
+    valid = (n_left >= min_samples_leaf) & (n_right >= min_samples_leaf)
+    for counts in (left, right):
+        valid &= (counts[..., 1] >= min_samples_treatment) & (counts[..., 2] >= min_samples_treatment)
+    gain[~valid] = -np.inf
+
+    feature, bin = np.unravel_index(np.argmax(gain), gain.shape)
+    return int(feature), int(bin), gain[feature, bin]
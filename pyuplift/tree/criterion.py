@@ -0,0 +1,133 @@
+import numpy as np
+from scipy.special import xlogy
+from pyuplift.transformation.base import TransformationBaseModel
+
+# Columns of a node histogram are the response groups of `TransformationBaseModel.encode_response_groups`
+TR, CN, TN, CR = TransformationBaseModel.GROUPS
+N_CELLS = len(TransformationBaseModel.GROUPS)
+EPS = 1e-6
+
+
+def get_cells(y, t):
+    """The response group of every sample, see `TransformationBaseModel.encode_response_groups`."""
+    return TransformationBaseModel.encode_response_groups(y, t)[0]
+
+
+def get_divergence(p, q, criterion):
+    """Divergence between Bernoulli distributions with response rates `p` (treatment) and `q` (control).
+
+    +-----------------+------------------------------------------------------------------+
+    | **Parameters**  | | **p: numpy array**                                             |
+    |                 | |   Response rates of the treatment group.                       |
+    |                 | | **q: numpy array**                                             |
+    |                 | |   Response rates of the control group.                         |
+    |                 | | **criterion: string**                                          |
+    |                 | |   'kl' (Kullback-Leibler), 'ed' (squared Euclidean distance)   |
+    |                 | |   or 'chi' (chi-squared).                                      |
+    +-----------------+------------------------------------------------------------------+
+    | **Returns**     | | **divergence: numpy array**                                    |
+    +-----------------+------------------------------------------------------------------+
+    """
+
+    if criterion == 'ed':
+        return 2 * (p - q) ** 2
+    q = np.clip(q, EPS, 1 - EPS)
+    if criterion == 'kl':
+        return xlogy(p, p) - xlogy(p, q) + xlogy(1 - p, 1 - p) - xlogy(1 - p, 1 - q)
+    if criterion == 'chi':
+        return (p - q) ** 2 / (q * (1 - q))
+    raise ValueError("Criterion should be 'kl', 'ed' or 'chi'.")
+
+
+def build_histogram(X_binned, cells, indices, n_bins):
+    """Count the treatment/control x response cells of `indices` rows per feature bin.
+
+    +-----------------+------------------------------------------------------------------+
+    | **Parameters**  | | **X_binned: numpy ndarray, shape = [n_samples, n_features]**     |
+    |                 | |   Matrix of bins, preferably in Fortran order.                 |
+    |                 | | **cells: numpy array with shape = [n_samples,]**               |
+    |                 | |   Response group of every row, see `get_cells`.                |
+    |                 | | **indices: numpy array**                                       |
+    |                 | |   Rows of the node, may contain repetitions.                   |
+    |                 | | **n_bins: int**                                                |
+    |                 | |   The number of bins of the widest feature.                    |
+    +-----------------+------------------------------------------------------------------+
+    | **Returns**     | | **histogram: numpy ndarray with shape =**                      |
+    |                 | |   **[n_features, n_bins, 4]**                                  |
+    +-----------------+------------------------------------------------------------------+
+    """
+
+    node_cells = cells[indices].astype(np.intp)
+    histogram = np.empty((X_binned.shape[1], n_bins, N_CELLS), dtype=np.int64)
+    for i in range(X_binned.shape[1]):
+        keys = X_binned[indices, i].astype(np.intp) * N_CELLS + node_cells
+        histogram[i] = np.bincount(keys, minlength=n_bins * N_CELLS).reshape(n_bins, N_CELLS)
+    return histogram
+
+
+def get_response_rates(counts):
+    """Response rates of the treatment and control groups from cell counts along the last axis."""
+    n_t = counts[..., TN] + counts[..., TR]
+    n_c = counts[..., CN] + counts[..., CR]
+    p = np.divide(counts[..., TR], n_t, out=np.zeros(n_t.shape), where=n_t > 0)
+    q = np.divide(counts[..., CR], n_c, out=np.zeros(n_c.shape), where=n_c > 0)
+    return p, q
+
+
+def find_best_split(histogram, criterion, min_samples_leaf, min_samples_treatment, features=None):
+    """Find the best split of a node from its histogram.
+
+    The gain of the split is the divergence after the split (weighted by the share of samples in every child)
+    minus the divergence of the node.
+    Every threshold of every feature is scored at once from the cumulative sums of the histogram.
+
+    +-----------------+------------------------------------------------------------------+
+    | **Parameters**  | | **histogram: numpy ndarray with shape =**                      |
+    |                 | |   **[n_features, n_bins, 4]**                                  |
+    |                 | |   Counts of the node returned by `build_histogram`.            |
+    |                 | | **criterion: string**                                          |
+    |                 | |   'kl', 'ed' or 'chi'.                                         |
+    |                 | | **min_samples_leaf: int**                                      |
+    |                 | |   The minimum number of samples in every child.                |
+    |                 | | **min_samples_treatment: int**                                 |
+    |                 | |   The minimum number of treatment and control samples          |
+    |                 | |   in every child.                                              |
+    |                 | | **features: numpy array or None**                              |
+    |                 | |   Features which are allowed for the split. None means all.    |
+    +-----------------+------------------------------------------------------------------+
+    | **Returns**     | | **(feature, bin, gain): tuple**                                |
+    |                 | |   Rows with bins <= `bin` go to the left child.                |
+    |                 | |   The gain is -inf if there is no valid split.                 |
+    +-----------------+------------------------------------------------------------------+
+    """
+
+    if features is not None:
+        histogram = histogram[features]
+    left = np.cumsum(histogram, axis=1)[:, :-1]
+    total = histogram[0].sum(axis=0)
+    right = total - left
+
+    n_left, n_right = left.sum(axis=2), right.sum(axis=2)
+    n = n_left + n_right
+    p_left, q_left = get_response_rates(left)
+    p_right, q_right = get_response_rates(right)
+    p, q = get_response_rates(total)
+    gain = (
+        n_left / n * get_divergence(p_left, q_left, criterion) +
+        n_right / n * get_divergence(p_right, q_right, criterion) -
+        get_divergence(p, q, criterion)
+    )
+
+    valid = (n_left >= min_samples_leaf) & (n_right >= min_samples_leaf)
+    for counts in (left, right):
+        valid &= counts[..., TN] + counts[..., TR] >= min_samples_treatment
+        valid &= counts[..., CN] + counts[..., CR] >= min_samples_treatment
+    gain[~valid] = -np.inf
+    if gain.size == 0:
+        return 0, 0, -np.inf
+
+    feature, bin = np.unravel_index(np.argmax(gain), gain.shape)
+    best_gain = gain[feature, bin]
+    if features is not None:
+        feature = features[feature]
+    return int(feature), int(bin), best_gain
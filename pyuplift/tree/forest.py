@@ -0,0 +1,199 @@
+import os
+import shutil
+import tempfile
+import numpy as np
+from joblib import Parallel, delayed, effective_n_jobs
+from pyuplift import BaseModel
+from .binning import Binner
+from .criterion import get_cells
+from .tree import UpliftTreeClassifier, _check_array
+
+
+class UpliftRandomForestClassifier(BaseModel):
+    """The class which implements the uplift random forest [1].
+
+    Every tree is an :code:`UpliftTreeClassifier` grown on a bootstrap sample with random subsets of features.
+    The features are binned once and written to a read-only memory-mapped file,
+    the worker processes open this file instead of receiving a copy of the data.
+
+    +----------------+-----------------------------------------------------------------------------------+
+    | **Parameters** | | **n_estimators : int, optional (default=10)**                                   |
+    |                | |   The number of trees in the forest.                                            |
+    |                | | **criterion : string, optional (default='kl')**                                 |
+    |                | |   The split criterion: 'kl', 'ed' or 'chi'.                                     |
+    |                | | **max_depth : int or None, optional (default=5)**                               |
+    |                | |   The maximum depth of a tree. None means unlimited depth.                      |
+    |                | | **min_samples_leaf : int, optional (default=100)**                              |
+    |                | |   The minimum number of samples in a leaf.                                      |
+    |                | | **min_samples_treatment : int, optional (default=10)**                          |
+    |                | |   The minimum number of treatment and of control samples in a leaf.             |
+    |                | | **min_gain : float, optional (default=0.0)**                                    |
+    |                | |   A node is split only if the gain of the split is greater than this value.     |
+    |                | | **max_features : int, float, string or None, optional (default='sqrt')**        |
+    |                | |   The number of features to consider for every split.                           |
+    |                | | **max_bins : int, optional (default=255)**                                      |
+    |                | |   The maximum number of bins of a feature, between 2 and 256.                   |
+    |                | | **bootstrap : bool, optional (default=True)**                                   |
+    |                | |   Grow every tree on a bootstrap sample instead of the whole training set.      |
+    |                | | **n_jobs : int or None, optional (default=None)**                               |
+    |                | |   The number of jobs to grow the trees and to predict in parallel.              |
+    |                | |   None means 1, -1 means using all processors.                                  |
+    |                | | **prefer : string, optional (default='processes')**                             |
+    |                | |   Run the jobs in a pool of 'threads' or 'processes'.                           |
+    |                | | **random_state : int or None, optional (default=None)**                         |
+    |                | |   The seed of the bootstrap samples and of the features of the splits.          |
+    |                | | **temp_folder : string or None, optional (default=None)**                       |
+    |                | |   The folder for the memory-mapped binned features. None means the system one. |
+    +----------------+-----------------------------------------------------------------------------------+
+
+    *******
+    Methods
+    *******
+    +-------------------------------------------------------------------+-------------------------------------------------+
+    | :ref:`fit(self, X, y, t) <forest_fit>`                            | Build a forest from the training set (X, y, t). |
+    +-------------------------------------------------------------------+-------------------------------------------------+
+    | :ref:`predict(self, X, t=None, chunk_size=None) <forest_predict>` | Predict an uplift for X.                        |
+    +-------------------------------------------------------------------+-------------------------------------------------+
+    """
+
+    def __init__(
+        self,
+        n_estimators=10,
+        criterion='kl',
+        max_depth=5,
+        min_samples_leaf=100,
+        min_samples_treatment=10,
+        min_gain=0.0,
+        max_features='sqrt',
+        max_bins=255,
+        bootstrap=True,
+        n_jobs=None,
+        prefer='processes',
+        random_state=None,
+        temp_folder=None
+    ):
+        if n_estimators < 1:
+            raise ValueError('The number of trees should be positive integer number.')
+        if prefer not in ('threads', 'processes'):
+            raise ValueError("Prefer should be 'threads' or 'processes'.")
+        # Validates the parameters of the trees
+        UpliftTreeClassifier(criterion, max_depth, min_samples_leaf, min_samples_treatment, min_gain, max_features, max_bins)
+        self.n_estimators = n_estimators
+        self.criterion = criterion
+        self.max_depth = max_depth
+        self.min_samples_leaf = min_samples_leaf
+        self.min_samples_treatment = min_samples_treatment
+        self.min_gain = min_gain
+        self.max_features = max_features
+        self.max_bins = max_bins
+        self.bootstrap = bootstrap
+        self.n_jobs = n_jobs
+        self.prefer = prefer
+        self.random_state = random_state
+        self.temp_folder = temp_folder
+
+    def fit(self, X, y, t):
+        """Build a forest from the training set (X, y, t).
+
+        +------------------+---------------------------------------------------------------------------------+
+        | **Parameters**   | | **X: numpy ndarray with shape = [n_samples, n_features]**                     |
+        |                  | |   Matrix of features.                                                         |
+        |                  | | **y: numpy array with shape = [n_samples,]**                                  |
+        |                  | |   Array of target of feature.                                                 |
+        |                  | | **t: numpy array with shape = [n_samples,]**                                  |
+        |                  | |   Array of treatments.                                                        |
+        +------------------+---------------------------------------------------------------------------------+
+        | **Returns**      | **self : object**                                                               |
+        +------------------+---------------------------------------------------------------------------------+
+        """
+
+        X = _check_array(X)
+        rng = np.random.RandomState(self.random_state)
+        self.binner_ = Binner(self.max_bins, random_state=rng.randint(np.iinfo(np.int32).max)).fit(X)
+        seeds = rng.randint(np.iinfo(np.int32).max, size=self.n_estimators)
+        cells = get_cells(y, t)
+
+        folder = tempfile.mkdtemp(prefix='pyuplift_forest_', dir=self.temp_folder)
+        try:
+            X_binned = self.__dump_binned(X, os.path.join(folder, 'X_binned.npy'))
+            self.estimators_ = Parallel(n_jobs=self.n_jobs, prefer=self.prefer)(
+                delayed(_grow_tree)(self.__make_tree(seed), X_binned, cells, self.binner_.bin_edges_, self.bootstrap)
+                for seed in seeds
+            )
+            del X_binned
+        finally:
+            shutil.rmtree(folder, ignore_errors=True)
+        return self
+
+    def predict(self, X, t=None, chunk_size=None):
+        """Predict an uplift for X.
+
+        The uplift is the average uplift of the trees.
+        The rows are scored by blocks of `chunk_size` rows in parallel.
+
+        +------------------+---------------------------------------------------------------------------------+
+        | **Parameters**   | | **X: numpy ndarray with shape = [n_samples, n_features]**                     |
+        |                  | |   Matrix of features.                                                         |
+        |                  | | **t: numpy array with shape = [n_samples,] or None**                          |
+        |                  | |   Array of treatments.                                                        |
+        |                  | | **chunk_size: int or None, optional (default=None)**                          |
+        |                  | |   Number of rows in a block. None means one block per job.                    |
+        +------------------+---------------------------------------------------------------------------------+
+        | **Returns**      | | **self : object**                                                             |
+        |                  | |   The predicted values.                                                       |
+        +------------------+---------------------------------------------------------------------------------+
+        """
+
+        X = _check_array(X)
+        n_samples = X.shape[0]
+        if chunk_size is None:
+            chunk_size = max(1, -(-n_samples // effective_n_jobs(self.n_jobs)))
+        elif chunk_size < 1:
+            raise ValueError('Chunk size should be positive integer number.')
+
+        blocks = Parallel(n_jobs=self.n_jobs, prefer=self.prefer)(
+            delayed(_predict_rows)(self.estimators_, X, start, start + chunk_size)
+            for start in range(0, n_samples, chunk_size)
+        )
+        if not blocks:
+            return np.empty(0)
+        return np.concatenate(blocks)
+
+    def __make_tree(self, seed):
+        return UpliftTreeClassifier(
+            criterion=self.criterion,
+            max_depth=self.max_depth,
+            min_samples_leaf=self.min_samples_leaf,
+            min_samples_treatment=self.min_samples_treatment,
+            min_gain=self.min_gain,
+            max_features=self.max_features,
+            max_bins=self.max_bins,
+            random_state=seed
+        )
+
+    def __dump_binned(self, X, path):
+        X_binned = np.lib.format.open_memmap(path, mode='w+', dtype=np.uint8, shape=X.shape, fortran_order=True)
+        chunk_size = 100000
+        for start in range(0, X.shape[0], chunk_size):
+            X_binned[start:start + chunk_size] = self.binner_.transform(X[start:start + chunk_size])
+        X_binned.flush()
+        del X_binned
+        return np.load(path, mmap_mode='r')
+
+
+def _grow_tree(tree, X_binned, cells, bin_edges, bootstrap):
+    n_samples = X_binned.shape[0]
+    if bootstrap:
+        rng = np.random.RandomState(tree.random_state)
+        indices = np.sort(rng.randint(0, n_samples, n_samples))
+    else:
+        indices = np.arange(n_samples)
+    return tree._grow(X_binned, cells, bin_edges, indices)
+
+
+def _predict_rows(estimators, X, start, stop):
+    X = X[start:stop]
+    uplift = np.zeros(X.shape[0])
+    for tree in estimators:
+        uplift += tree.predict(X)
+    return uplift / len(estimators)
@@ -0,0 +1,223 @@
+import numpy as np
+import scipy.sparse as sp
+from pyuplift import BaseModel
+from .binning import Binner
+from .criterion import build_histogram, find_best_split, get_cells, get_response_rates
+
+
+class UpliftTreeClassifier(BaseModel):
+    """The class which implements the uplift decision tree [1].
+
+    The features are mapped to at most `max_bins` bins before the training,
+    so the split search of a node scans histograms of treatment/control x response counts per bin.
+    The histogram of the larger child is computed as the histogram of the node minus the histogram of the smaller one.
+    The target is binary: every non-zero `y` is a response, every non-zero `t` is a treatment.
+
+    +----------------+-----------------------------------------------------------------------------------+
+    | **Parameters** | | **criterion : string, optional (default='kl')**                                 |
+    |                | |   The split criterion: 'kl' (Kullback-Leibler divergence),                      |
+    |                | |   'ed' (squared Euclidean distance) or 'chi' (chi-squared divergence).          |
+    |                | | **max_depth : int or None, optional (default=5)**                               |
+    |                | |   The maximum depth of the tree. None means unlimited depth.                    |
+    |                | | **min_samples_leaf : int, optional (default=100)**                              |
+    |                | |   The minimum number of samples in a leaf.                                      |
+    |                | | **min_samples_treatment : int, optional (default=10)**                          |
+    |                | |   The minimum number of treatment and of control samples in a leaf.             |
+    |                | | **min_gain : float, optional (default=0.0)**                                    |
+    |                | |   A node is split only if the gain of the split is greater than this value.     |
+    |                | | **max_features : int, float, string or None, optional (default=None)**          |
+    |                | |   The number of features to consider for every split: int, share of features,  |
+    |                | |   'sqrt', 'log2' or None (all features).                                        |
+    |                | | **max_bins : int, optional (default=255)**                                      |
+    |                | |   The maximum number of bins of a feature, between 2 and 256.                   |
+    |                | | **random_state : int or None, optional (default=None)**                         |
+    |                | |   The seed used to bin the features and to choose the features of a split.     |
+    +----------------+-----------------------------------------------------------------------------------+
+
+    *******
+    Methods
+    *******
+    +-------------------------------------------------+-------------------------------------------------+
+    | :ref:`fit(self, X, y, t) <tree_fit>`            | Build a tree from the training set (X, y, t).   |
+    +-------------------------------------------------+-------------------------------------------------+
+    | :ref:`predict(self, X, t=None) <tree_predict>`  | Predict an uplift for X.                        |
+    +-------------------------------------------------+-------------------------------------------------+
+    | :ref:`apply(self, X) <tree_apply>`              | Return the index of the leaf of every sample.   |
+    +-------------------------------------------------+-------------------------------------------------+
+    """
+
+    def __init__(
+        self,
+        criterion='kl',
+        max_depth=5,
+        min_samples_leaf=100,
+        min_samples_treatment=10,
+        min_gain=0.0,
+        max_features=None,
+        max_bins=255,
+        random_state=None
+    ):
+        if criterion not in ('kl', 'ed', 'chi'):
+            raise ValueError("Criterion should be 'kl', 'ed' or 'chi'.")
+        if max_depth is not None and max_depth < 0:
+            raise ValueError('The maximum depth should be non-negative integer number or None.')
+        if min_samples_leaf < 1:
+            raise ValueError('The minimum number of samples in a leaf should be positive integer number.')
+        if min_samples_treatment < 0:
+            raise ValueError('The minimum number of treatment samples should be non-negative integer number.')
+        if not (2 <= max_bins <= 256):
+            raise ValueError('The maximum number of bins should be integer number between 2 and 256.')
+        self.criterion = criterion
+        self.max_depth = max_depth
+        self.min_samples_leaf = min_samples_leaf
+        self.min_samples_treatment = min_samples_treatment
+        self.min_gain = min_gain
+        self.max_features = max_features
+        self.max_bins = max_bins
+        self.random_state = random_state
+
+    def fit(self, X, y, t):
+        """Build a tree from the training set (X, y, t).
+
+        +------------------+---------------------------------------------------------------------------------+
+        | **Parameters**   | | **X: numpy ndarray with shape = [n_samples, n_features]**                     |
+        |                  | |   Matrix of features.                                                         |
+        |                  | | **y: numpy array with shape = [n_samples,]**                                  |
+        |                  | |   Array of target of feature.                                                 |
+        |                  | | **t: numpy array with shape = [n_samples,]**                                  |
+        |                  | |   Array of treatments.                                                        |
+        +------------------+---------------------------------------------------------------------------------+
+        | **Returns**      | **self : object**                                                               |
+        +------------------+---------------------------------------------------------------------------------+
+        """
+
+        X = _check_array(X)
+        self.binner_ = Binner(self.max_bins, random_state=self.random_state).fit(X)
+        X_binned = self.binner_.transform(X)
+        self._grow(X_binned, get_cells(y, t), self.binner_.bin_edges_, np.arange(X.shape[0]))
+        return self
+
+    def predict(self, X, t=None):
+        """Predict an uplift for X.
+
+        The uplift of a leaf is the response rate of its treatment samples minus the response rate of its control samples.
+
+        +------------------+---------------------------------------------------------------------------------+
+        | **Parameters**   | | **X: numpy ndarray with shape = [n_samples, n_features]**                     |
+        |                  | |   Matrix of features.                                                         |
+        |                  | | **t: numpy array with shape = [n_samples,] or None**                          |
+        |                  | |   Array of treatments.                                                        |
+        +------------------+---------------------------------------------------------------------------------+
+        | **Returns**      | | **self : object**                                                             |
+        |                  | |   The predicted values.                                                       |
+        +------------------+---------------------------------------------------------------------------------+
+        """
+
+        return self.value_[self.apply(X)]
+
+    def apply(self, X):
+        """Return the index of the leaf of every sample.
+
+        All samples descend the tree together, one level per step.
+
+        +------------------+---------------------------------------------------------------------------------+
+        | **Parameters**   | | **X: numpy ndarray with shape = [n_samples, n_features]**                     |
+        |                  | |   Matrix of features.                                                         |
+        +------------------+---------------------------------------------------------------------------------+
+        | **Returns**      | | **leaves: numpy array with shape = [n_samples,]**                             |
+        |                  | |   Indices of the leaves.                                                      |
+        +------------------+---------------------------------------------------------------------------------+
+        """
+
+        return _apply(_check_array(X), self.feature_, self.threshold_, self.children_left_, self.children_right_)
+
+    def _grow(self, X_binned, cells, bin_edges, indices):
+        """Grow the tree on the rows `indices` of the binned matrix.
+
+        `cells` is returned by `get_cells`, `bin_edges` are the bin edges of every feature.
+        The rows may be repeated, e.g. in a bootstrap sample.
+        """
+
+        rng = np.random.default_rng(self.random_state)
+        n_features = X_binned.shape[1]
+        n_bins = max(edges.shape[0] for edges in bin_edges) + 1
+        max_features = self._get_max_features(n_features)
+        max_depth = np.inf if self.max_depth is None else self.max_depth
+
+        feature, threshold, left, right, counts = [], [], [], [], []
+
+        def add_node(histogram):
+            feature.append(-1)
+            threshold.append(np.nan)
+            left.append(-1)
+            right.append(-1)
+            counts.append(histogram[0].sum(axis=0))
+            return len(feature) - 1
+
+        histogram = build_histogram(X_binned, cells, indices, n_bins)
+        stack = [(add_node(histogram), indices, histogram, 0)]
+        while stack:
+            node, indices, histogram, depth = stack.pop()
+            if depth >= max_depth or indices.shape[0] < 2 * self.min_samples_leaf:
+                continue
+
+            features = None
+            if max_features < n_features:
+                features = np.sort(rng.choice(n_features, max_features, replace=False))
+            best_feature, best_bin, gain = find_best_split(
+                histogram, self.criterion, self.min_samples_leaf, self.min_samples_treatment, features
+            )
+            if not gain > self.min_gain:
+                continue
+
+            go_left = X_binned[indices, best_feature] <= best_bin
+            children = [indices[go_left], indices[~go_left]]
+            small = 0 if children[0].shape[0] <= children[1].shape[0] else 1
+            histograms = [None, None]
+            histograms[small] = build_histogram(X_binned, cells, children[small], n_bins)
+            histograms[1 - small] = histogram - histograms[small]
+
+            feature[node] = best_feature
+            threshold[node] = bin_edges[best_feature][best_bin]
+            left[node] = add_node(histograms[0])
+            right[node] = add_node(histograms[1])
+            stack.append((right[node], children[1], histograms[1], depth + 1))
+            stack.append((left[node], children[0], histograms[0], depth + 1))
+
+        self.feature_ = np.array(feature, dtype=np.intp)
+        self.threshold_ = np.array(threshold, dtype=np.float64)
+        self.children_left_ = np.array(left, dtype=np.intp)
+        self.children_right_ = np.array(right, dtype=np.intp)
+        self.node_counts_ = np.array(counts, dtype=np.int64)
+        p, q = get_response_rates(self.node_counts_)
+        self.value_ = p - q
+        return self
+
+    def _get_max_features(self, n_features):
+        if self.max_features is None:
+            return n_features
+        if self.max_features == 'sqrt':
+            return max(1, int(np.sqrt(n_features)))
+        if self.max_features == 'log2':
+            return max(1, int(np.log2(n_features)))
+        if isinstance(self.max_features, float):
+            return max(1, int(self.max_features * n_features))
+        return min(self.max_features, n_features)
+
+
+def _check_array(X):
+    if sp.issparse(X):
+        return X.toarray()
+    return np.asarray(X)
+
+
+def _apply(X, feature, threshold, children_left, children_right):
+    nodes = np.zeros(X.shape[0], dtype=np.intp)
+    rows = np.arange(X.shape[0])
+    while rows.shape[0] > 0:
+        node_feature = feature[nodes[rows]]
+        rows, node_feature = rows[node_feature >= 0], node_feature[node_feature >= 0]
+        current = nodes[rows]
+        go_left = X[rows, node_feature] <= threshold[current]
+        nodes[rows] = np.where(go_left, children_left[current], children_right[current])
+    return nodes
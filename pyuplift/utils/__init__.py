@@ -1,2 +1,5 @@
 from .downloader import download_file
 from .retriever import retrieve_from_gz
+from .streaming import iter_array_chunks, iter_csv_chunks, partial_fit_by_chunks
+from .npy import NpyWriter
+from .gz_stream import iter_gz_csv_chunks
@@ -1,31 +1,225 @@
 import os
+import re
+import sys
+import time
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import requests
 
 
-def download_file(url: str, output_path: str):
+def download_file(
+    url: str,
+    output_path: str,
+    sha256=None,
+    n_segments=1,
+    chunk_size=2 ** 20,
+    resume=True,
+    verbose=True,
+    timeout=60
+):
     """Download file from `url` to `output_path`.
 
-    +-----------------+--------------------------------------+
-    | **Parameters**  | | **url: string**                    |
-    |                 | |   Data's URL.                      |
-    |                 | | **output_path: string**            |
-    |                 | |   Path where file will be saved.   |
-    +-----------------+--------------------------------------+
-    | **Returns**     | **None**                             |
-    +-----------------+--------------------------------------+
+    The response is streamed to disk by blocks of `chunk_size` bytes. The data is written to
+    `<output_path>.part` files which are renamed when the download is complete, so an interrupted download
+    never leaves a truncated file at `output_path`. If `resume` is True, the next call continues
+    the interrupted download with an HTTP Range request.
+    The part files are renamed only if they have the size reported by the server, a short download
+    raises an exception and keeps them for the next call.
+    If the server accepts Range requests, the file can be split into `n_segments` parts downloaded in parallel.
+
+    +-----------------+--------------------------------------------------------------------------------+
+    | **Parameters**  | | **url: string**                                                              |
+    |                 | |   Data's URL.                                                                |
+    |                 | | **output_path: string**                                                      |
+    |                 | |   Path where file will be saved.                                             |
+    |                 | | **sha256: string or None, optional (default=None)**                          |
+    |                 | |   The expected SHA-256 checksum of the file. None means no verification.     |
+    |                 | | **n_segments: int, optional (default=1)**                                    |
+    |                 | |   The number of parts of the file downloaded in parallel.                    |
+    |                 | | **chunk_size: int, optional (default=1048576)**                              |
+    |                 | |   Number of bytes read from the response at once.                            |
+    |                 | | **resume: bool, optional (default=True)**                                    |
+    |                 | |   Whether to continue the interrupted download from the `.part` files.       |
+    |                 | | **verbose: bool, optional (default=True)**                                   |
+    |                 | |   Whether to print the progress and the throughput.                          |
+    |                 | | **timeout: float, optional (default=60)**                                    |
+    |                 | |   Seconds to wait for the server.                                            |
+    +-----------------+--------------------------------------------------------------------------------+
+    | **Returns**     | **None**                                                                       |
+    +-----------------+--------------------------------------------------------------------------------+
     """
 
-    if os.path.isfile(output_path):
-        os.remove(output_path)
+    if n_segments < 1:
+        raise ValueError('The number of segments should be positive integer number.')
+    if chunk_size < 1:
+        raise ValueError('Chunk size should be positive integer number.')
 
     print("Downloading file to '{}'...".format(output_path))
-    response = requests.get(url)
-    # Check if the response is ok (200)
-    status_code = int(response.status_code)
-    if status_code == 200:
-        with open(output_path, 'wb') as file:
-            # A chunk of 128 bytes
-            for chunk in response:
+    part_path = output_path + '.part'
+    size = __get_size(url, timeout) if n_segments > 1 else None
+    if size is None or size < n_segments:
+        # A single stream, the file is continued from the size of the part file
+        progress = _Progress(None, verbose)
+        size = _download_range(url, part_path, 0, None, chunk_size, resume, timeout, progress)
+    else:
+        bounds = [size * i // n_segments for i in range(n_segments + 1)]
+        part_paths = ['{}{}'.format(part_path, i) for i in range(n_segments)]
+        progress = _Progress(size, verbose)
+        with ThreadPoolExecutor(n_segments) as executor:
+            futures = [
+                executor.submit(_download_range, url, path, start, end, chunk_size, resume, timeout, progress)
+                for path, start, end in zip(part_paths, bounds[:-1], bounds[1:])
+            ]
+            for future in futures:
+                future.result()
+        with open(part_path, 'wb') as output:
+            for path in part_paths:
+                with open(path, 'rb') as file:
+                    while True:
+                        block = file.read(chunk_size)
+                        if not block:
+                            break
+                        output.write(block)
+        for path in part_paths:
+            os.remove(path)
+    progress.close()
+
+    # The part file is kept for the next call unless it has the size of the remote file
+    if size is not None:
+        _check_size(url, part_path, size)
+    if sha256 is not None:
+        checksum = __get_sha256(part_path, chunk_size)
+        if checksum != sha256.lower():
+            os.remove(part_path)
+            raise ValueError('Checksum of the file from {} is {}, expected {}.'.format(url, checksum, sha256))
+    os.replace(part_path, output_path)
+
+
+def __get_sha256(path, chunk_size):
+    """SHA-256 checksum of the file as a hex string."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        while True:
+            block = file.read(chunk_size)
+            if not block:
+                break
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _download_range(url, path, start, end, chunk_size, resume, timeout, progress):
+    """Write bytes [start, end) of the file to `path`, the bytes which are already in `path` are skipped.
+
+    Returns the size of the whole file or None if the server does not report it.
+    """
+    offset = os.path.getsize(path) if resume and os.path.isfile(path) else 0
+    if end is not None and start + offset >= end:
+        _check_size(url, path, end - start)
+        progress.skip(offset)
+        return None
+    headers = {}
+    if start + offset > 0 or end is not None:
+        headers['Range'] = 'bytes={}-{}'.format(start + offset, '' if end is None else end - 1)
+
+    with requests.get(url, headers=headers, stream=True, timeout=timeout) as response:
+        status_code = int(response.status_code)
+        if status_code == 404:
+            raise Exception('Wrong URL (' + url + ').')
+        total = __get_total(response)
+        if status_code == 416 and end is None and offset > 0:
+            # The part file is complete only if it has the size of the remote file
+            if total is None:
+                raise Exception('The server does not report the size of the file (' + url + ').')
+            _check_size(url, path, total)
+            progress.skip(offset)
+            return total
+        response.raise_for_status()
+        if status_code != 206:
+            if start > 0 or end is not None:
+                raise Exception('The server does not accept Range requests (' + url + ').')
+            # The whole file is sent again
+            offset = 0
+        if progress.total is None:
+            progress.total = total
+        progress.skip(offset)
+        with open(path, 'ab' if offset > 0 else 'wb') as file:
+            for chunk in response.iter_content(chunk_size):
                 file.write(chunk)
-    elif status_code == 404:
+                progress.add(len(chunk))
+
+    # A connection closed early ends the response without an error
+    if end is None:
+        end = total
+    if end is not None:
+        _check_size(url, path, end - start)
+    return total
+
+
+def __get_total(response):
+    """The size of the whole file from the Content-Range or the Content-Length header, None if it is unknown."""
+    match = re.match(r'bytes [^/]+/(\d+)', response.headers.get('Content-Range', ''))
+    if match:
+        return int(match.group(1))
+    if int(response.status_code) == 200 and 'Content-Length' in response.headers \
+            and response.headers.get('Content-Encoding', 'identity') == 'identity':
+        return int(response.headers['Content-Length'])
+    return None
+
+
+def _check_size(url, path, size):
+    """Raise if the file at `path` does not have `size` bytes, the file is kept to resume the download."""
+    actual = os.path.getsize(path)
+    if actual != size:
+        raise Exception('The downloaded file {} has {} bytes, expected {} ({}).'.format(path, actual, size, url))
+
+
+def __get_size(url, timeout):
+    """The size of the file if the server accepts Range requests, otherwise None."""
+    response = requests.head(url, allow_redirects=True, timeout=timeout)
+    if int(response.status_code) == 404:
         raise Exception('Wrong URL (' + url + ').')
+    if response.headers.get('Accept-Ranges', '').lower() != 'bytes' or 'Content-Length' not in response.headers:
+        return None
+    return int(response.headers['Content-Length'])
+
+
+class _Progress:
+    """The number of downloaded bytes shared by the threads, printed at most once a second."""
+
+    def __init__(self, total, verbose):
+        self.total = total
+        self.verbose = verbose
+        self.done = 0
+        self.skipped = 0
+        self.start_time = self.print_time = time.perf_counter()
+        self.lock = threading.Lock()
+
+    def add(self, n_bytes):
+        with self.lock:
+            self.done += n_bytes
+            now = time.perf_counter()
+            if self.verbose and now - self.print_time >= 1:
+                self.print_time = now
+                self.__print(now)
+
+    def skip(self, n_bytes):
+        # The bytes of the part files do not count in the throughput
+        with self.lock:
+            self.done += n_bytes
+            self.skipped += n_bytes
+
+    def close(self):
+        if self.verbose:
+            self.__print(time.perf_counter())
+            sys.stdout.write('\n')
+
+    def __print(self, now):
+        speed = (self.done - self.skipped) / max(now - self.start_time, 1e-9) / 2 ** 20
+        done = self.done / 2 ** 20
+        if self.total:
+            line = '\r{:.1f} / {:.1f} MB ({:.0%}), {:.1f} MB/s'.format(done, self.total / 2 ** 20, self.done / self.total, speed)
+        else:
+            line = '\r{:.1f} MB, {:.1f} MB/s'.format(done, speed)
+        sys.stdout.write(line)
+        sys.stdout.flush()
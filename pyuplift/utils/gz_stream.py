@@ -0,0 +1,92 @@
+import io
+import gzip
+import queue
+import threading
+import pandas as pd
+
+
+def iter_gz_csv_chunks(archive_path, chunk_size=100000, buffer_size=2 ** 20, max_buffers=16, **read_csv_params):
+    """Read the gz-archived CSV file from `archive_path` by data frames of `chunk_size` rows without unpacking it.
+
+    The archive is decompressed by a background thread into a queue of at most `max_buffers` blocks
+    of `buffer_size` bytes, the parser reads the blocks from the queue in the calling thread.
+    So decompression and parsing overlap and the memory is bounded by the queue and one data frame.
+
+    +-----------------+------------------------------------------------------------------+
+    | **Parameters**  | | **archive_path: string**                                       |
+    |                 | |   The archive path.                                            |
+    |                 | | **chunk_size: int, optional (default=100000)**                 |
+    |                 | |   Number of rows in a data frame.                              |
+    |                 | | **buffer_size: int, optional (default=1048576)**               |
+    |                 | |   Number of decompressed bytes in a block of the queue.        |
+    |                 | | **max_buffers: int, optional (default=16)**                    |
+    |                 | |   The maximum number of blocks in the queue.                   |
+    |                 | | **read_csv_params: keyword arguments**                         |
+    |                 | |   Parameters of `pandas.read_csv`, e.g. `dtype` or `usecols`.  |
+    +-----------------+------------------------------------------------------------------+
+    | **Yields**      | | **df: pandas.DataFrame**                                       |
+    |                 | |   The block of data.                                           |
+    +-----------------+------------------------------------------------------------------+
+    """
+
+    if chunk_size < 1:
+        raise ValueError('Chunk size should be positive integer number.')
+    if buffer_size < 1 or max_buffers < 1:
+        raise ValueError('Buffer size and number of buffers should be positive integer numbers.')
+
+    blocks = queue.Queue(maxsize=max_buffers)
+    stop = threading.Event()
+    thread = threading.Thread(target=_decompress, args=(archive_path, blocks, buffer_size, stop), daemon=True)
+    thread.start()
+    try:
+        reader = io.BufferedReader(_QueueReader(blocks), buffer_size=buffer_size)
+        for df in pd.read_csv(reader, chunksize=chunk_size, **read_csv_params):
+            yield df
+    finally:
+        # The parser may stop early, then the thread is released from a full queue
+        stop.set()
+        while thread.is_alive():
+            try:
+                blocks.get_nowait()
+            except queue.Empty:
+                thread.join(0.01)
+
+
+def _decompress(archive_path, blocks, buffer_size, stop):
+    """Put the decompressed blocks of the archive into the queue, then None or the raised exception."""
+    try:
+        with gzip.open(archive_path, 'rb') as archive:
+            while not stop.is_set():
+                block = archive.read(buffer_size)
+                if not block:
+                    break
+                blocks.put(block)
+        blocks.put(None)
+    except Exception as exception:
+        blocks.put(exception)
+
+
+class _QueueReader(io.RawIOBase):
+    """A binary file which reads the blocks from the queue."""
+
+    def __init__(self, blocks):
+        self.__blocks = blocks
+        self.__block = memoryview(b'')
+        self.__finished = False
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        while not self.__block and not self.__finished:
+            block = self.__blocks.get()
+            if isinstance(block, Exception):
+                raise block
+            if block is None:
+                self.__finished = True
+            else:
+                self.__block = memoryview(block)
+        size = min(len(buffer), len(self.__block))
+        buffer[:size] = self.__block[:size]
+        self.__block = self.__block[size:]
+        return size
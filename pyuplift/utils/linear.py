@@ -0,0 +1,22 @@
+import numpy as np
+from sklearn.base import is_classifier
+from sklearn.linear_model import SGDRegressor
+try:
+    from sklearn.linear_model._base import LinearModel
+except ImportError:  # scikit-learn < 0.22
+    from sklearn.linear_model.base import LinearModel
+
+
+def get_linear_coefficients(model):
+    """Get the coefficients of a fitted linear regression model.
+
+    Returns the 1-d array `coef_` if `model.predict(X)` equals `X @ coef_ + intercept_`
+    (e.g. LinearRegression, Ridge, Lasso or SGDRegressor fitted on a 1-d target),
+    otherwise returns None.
+    """
+    if not isinstance(model, (LinearModel, SGDRegressor)) or is_classifier(model):
+        return None
+    coef = getattr(model, 'coef_', None)
+    if not isinstance(coef, np.ndarray) or coef.ndim != 1:
+        return None
+    return coef
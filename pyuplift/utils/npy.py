@@ -0,0 +1,93 @@
+import os
+import numpy as np
+
+# The size of the header of the written files, it leaves room for the shape of any number of rows
+HEADER_SIZE = 128
+
+
+class NpyWriter:
+    """The class which writes rows to a `.npy` file block by block.
+
+    The number of rows is unknown until the file is closed, so the header is written with a fixed size
+    and rewritten with the final shape on closing. The file is written to `path + '.part'` and renamed
+    to `path` on closing, so an interrupted writing never leaves a file which looks complete.
+    The written file can be loaded by `numpy.load(path, mmap_mode='r')` without copying.
+
+    +----------------+-----------------------------------------------------------------------------------+
+    | **Parameters** | | **path : string**                                                               |
+    |                | |   The path of the file.                                                         |
+    |                | | **dtype : numpy dtype**                                                         |
+    |                | |   The type of the values.                                                       |
+    |                | | **n_columns : int or None, optional (default=None)**                            |
+    |                | |   The number of columns of a matrix. None means a one-dimensional array.        |
+    +----------------+-----------------------------------------------------------------------------------+
+
+    *******
+    Methods
+    *******
+    +-----------------------------------------------------+------------------------------------------------------+
+    | :ref:`write(self, block) <npy_write>`               | Append the rows of the block.                        |
+    +-----------------------------------------------------+------------------------------------------------------+
+    | :ref:`close(self) <npy_close>`                      | Write the final header and rename the file.          |
+    +-----------------------------------------------------+------------------------------------------------------+
+    | :ref:`abort(self) <npy_abort>`                      | Close and remove the partial file.                   |
+    +-----------------------------------------------------+------------------------------------------------------+
+    """
+
+    def __init__(self, path, dtype, n_columns=None):
+        self.path = path
+        self.dtype = np.dtype(dtype)
+        self.n_columns = n_columns
+        self.n_rows = 0
+        self.__file = open(path + '.part', 'wb')
+        self.__write_header()
+
+    def write(self, block):
+        """Append the rows of the block.
+
+        +------------------+---------------------------------------------------------------------------------+
+        | **Parameters**   | | **block: numpy array**                                                        |
+        |                  | |   The rows with `n_columns` columns, the values are converted to `dtype`.     |
+        +------------------+---------------------------------------------------------------------------------+
+        """
+        block = np.ascontiguousarray(block, dtype=self.dtype)
+        expected_ndim = 1 if self.n_columns is None else 2
+        if block.ndim != expected_ndim or (self.n_columns is not None and block.shape[1] != self.n_columns):
+            raise ValueError('The shape of the block does not match the shape of the file.')
+        self.__file.write(block.data)
+        self.n_rows += block.shape[0]
+
+    def close(self):
+        """Write the final header and rename the file to `path`."""
+        if self.__file.closed:
+            return
+        self.__file.seek(0)
+        self.__write_header()
+        self.__file.close()
+        os.replace(self.path + '.part', self.path)
+
+    def abort(self):
+        """Close and remove the partial file."""
+        if not self.__file.closed:
+            self.__file.close()
+            os.remove(self.path + '.part')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def __write_header(self):
+        shape = (self.n_rows,) if self.n_columns is None else (self.n_rows, self.n_columns)
+        header = "{{'descr': {!r}, 'fortran_order': False, 'shape': {!r}, }}".format(
+            np.lib.format.dtype_to_descr(self.dtype), shape
+        )
+        # The magic string, the version 1.0 and the length of the header take 10 bytes
+        header = header.ljust(HEADER_SIZE - 11) + '\n'
+        self.__file.write(np.lib.format.magic(1, 0))
+        self.__file.write(np.uint16(len(header)).astype('<u2').tobytes())
+        self.__file.write(header.encode('latin1'))
@@ -0,0 +1,29 @@
+import numpy as np
+import scipy.sparse as sp
+
+
+def hstack(blocks):
+    """Stack matrices horizontally without densifying sparse ones.
+
+    If the first block is a scipy.sparse matrix the result keeps its format (CSR for
+    formats other than CSR and CSC), otherwise the result is a dense numpy array.
+    """
+    first = blocks[0]
+    if sp.issparse(first):
+        format = first.format if first.format in ('csr', 'csc') else 'csr'
+        return sp.hstack(blocks, format=format)
+    return np.hstack(blocks)
+
+
+def multiply(X, column):
+    """Multiply every column of X by `column` (array of shape = [n_samples, 1])."""
+    if sp.issparse(X):
+        return X.multiply(column)
+    return X * column
+
+
+def to_indexable(X):
+    """Convert sparse formats which do not support indexing of rows (e.g. COO) to CSR, other X are kept."""
+    if sp.issparse(X) and X.format not in ('csr', 'csc'):
+        return X.tocsr()
+    return X
@@ -0,0 +1,50 @@
+import numpy as np
+
+# The maximum range of integer treatments which are coded without sorting
+MAX_LOOKUP_SIZE = 2 ** 16
+
+
+def get_strata(y, t, treatments=None):
+    """Integer stratum of every sample: 2 * the code of the treatment + whether the outcome is not zero.
+
+    The codes of the treatments are taken from and added to the dict `treatments`, so the blocks of a dataset
+    which share the dict share the codes. The new treatments of an array are coded in the sorted order.
+    """
+    if treatments is None:
+        treatments = {}
+    t = np.asarray(t)
+    if np.issubdtype(t.dtype, np.integer) and t.shape[0] > 0 and int(t.max()) - int(t.min()) < MAX_LOOKUP_SIZE:
+        # Small integer treatments are coded by a lookup table instead of sorting
+        low = int(t.min())
+        inverse = t.astype(np.intp) - low
+        counts = np.bincount(inverse)
+        values = np.flatnonzero(counts) + low
+        table = np.zeros(counts.shape[0], dtype=np.intp)
+        table[values - low] = [treatments.setdefault(value, len(treatments)) for value in values.tolist()]
+    else:
+        values, inverse = np.unique(t, return_inverse=True)
+        table = np.array([treatments.setdefault(value, len(treatments)) for value in values.tolist()], dtype=np.intp)
+    return 2 * table[inverse.ravel()] + (np.asarray(y) != 0)
+
+
+def allocate_strata(counts, n_samples, at_least_one=False):
+    """The sample size of every stratum, proportional to its size `counts` by the largest remainder method.
+
+    With `at_least_one` every non-empty stratum gets at least one sample, the extra samples are taken from
+    the strata which have the most samples above their quotas.
+    """
+    counts = np.asarray(counts)
+    quotas = counts * n_samples / counts.sum()
+    sizes = np.floor(quotas).astype(np.intp)
+    if at_least_one:
+        n_strata = np.count_nonzero(counts)
+        if n_samples < n_strata:
+            raise ValueError(
+                'The number of samples ({}) should not be less than the number of strata ({}).'.format(n_samples, n_strata)
+            )
+        sizes[(counts > 0) & (sizes == 0)] = 1
+        for _ in range(sizes.sum() - n_samples):
+            sizes[np.argmax(np.where(sizes > 1, sizes - quotas, -np.inf))] -= 1
+    remainder = n_samples - sizes.sum()
+    sizes[np.argsort(sizes - quotas, kind='stable')[:remainder]] += 1
+    return sizes
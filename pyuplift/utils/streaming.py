@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+
+
+def iter_array_chunks(X, y, t, chunk_size=100000):
+    """Split X, y, t into consecutive blocks of `chunk_size` rows.
+
+    Works with memory-mapped arrays (e.g. `numpy.load(path, mmap_mode='r')`),
+    so only the current block is read from disk.
+
+    +-----------------+------------------------------------------------------------------+
+    | **Parameters**  | | **X: numpy ndarray with shape = [n_samples, n_features]**      |
+    |                 | |   Matrix of features.                                          |
+    |                 | | **y: numpy array with shape = [n_samples,]**                   |
+    |                 | |   Array of target of feature.                                  |
+    |                 | | **t: numpy array with shape = [n_samples,]**                   |
+    |                 | |   Array of treatments.                                         |
+    |                 | | **chunk_size: int, optional (default=100000)**                 |
+    |                 | |   Number of rows in a block.                                   |
+    +-----------------+------------------------------------------------------------------+
+    | **Yields**      | | **(X, y, t): tuple of numpy arrays**                           |
+    |                 | |   The block of data.                                           |
+    +-----------------+------------------------------------------------------------------+
+    """
+
+    if chunk_size < 1:
+        raise ValueError('Chunk size should be positive integer number.')
+
+    for start in range(0, y.shape[0], chunk_size):
+        stop = start + chunk_size
+        yield X[start:stop], y[start:stop], t[start:stop]
+
+
+def iter_csv_chunks(
+    path,
+    target_name,
+    treatment_name,
+    feature_names=None,
+    chunk_size=100000,
+    dtype=np.float32
+):
+    """Read the CSV file from `path` by blocks of `chunk_size` rows.
+
+    +-----------------+------------------------------------------------------------------+
+    | **Parameters**  | | **path: string**                                               |
+    |                 | |   The CSV file path.                                           |
+    |                 | | **target_name: string**                                        |
+    |                 | |   Name of the target column.                                   |
+    |                 | | **treatment_name: string**                                     |
+    |                 | |   Name of the treatment column.                                |
+    |                 | | **feature_names: list of strings or None (default=None)**      |
+    |                 | |   Names of the feature columns. By default all other columns.  |
+    |                 | | **chunk_size: int, optional (default=100000)**                 |
+    |                 | |   Number of rows in a block.                                   |
+    |                 | | **dtype: numpy dtype, optional (default=numpy.float32)**       |
+    |                 | |   Type of the features.                                        |
+    +-----------------+------------------------------------------------------------------+
+    | **Yields**      | | **(X, y, t): tuple of numpy arrays**                           |
+    |                 | |   The block of data.                                           |
+    +-----------------+------------------------------------------------------------------+
+    """
+
+    if chunk_size < 1:
+        raise ValueError('Chunk size should be positive integer number.')
+
+    usecols = None
+    if feature_names is not None:
+        usecols = list(feature_names) + [target_name, treatment_name]
+    for df in pd.read_csv(path, usecols=usecols, chunksize=chunk_size):
+        y = df.pop(target_name).values
+        t = df.pop(treatment_name).values
+        if feature_names is not None:
+            df = df[list(feature_names)]
+        yield df.values.astype(dtype, copy=False), y, t
+
+
+def partial_fit_by_chunks(model, chunks):
+    """Train `model` block by block with its `partial_fit` method.
+
+    +-----------------+------------------------------------------------------------------+
+    | **Parameters**  | | **model: object**                                              |
+    |                 | |   The uplift model which contains the `partial_fit` method.    |
+    |                 | | **chunks: iterable of tuples (X, y, t)**                       |
+    |                 | |   Blocks of the training set, e.g. from `iter_csv_chunks`.     |
+    +-----------------+------------------------------------------------------------------+
+    | **Returns**     | **model : object**                                               |
+    +-----------------+------------------------------------------------------------------+
+    """
+
+    for X, y, t in chunks:
+        model.partial_fit(X, y, t)
+    return model
@@ -9,28 +9,33 @@ class Cadit(BaseModel):
     +----------------+-----------------------------------------------------------------------------------+
     | **Parameters** | | **model : object, optional (default=sklearn.linear_model.LinearRegression)**    |
     |                | |   The regression model which will be used for predict uplift.                   |
+    |                | | **dtype : numpy dtype, optional (default=numpy.float64)**                       |
+    |                | |   Type of the transformed target, numpy.float32 halves its memory.              |
     +----------------+-----------------------------------------------------------------------------------+
 
 
     *******
     Methods
     *******
-    +-------------------------------------------------+--------------------------------------------------+
-    | :ref:`fit(self, X, y, t) <cadit_fit>`           | Build a model from the training set (X, y, t).   |
-    +-------------------------------------------------+--------------------------------------------------+
-    | :ref:`predict(self, X, t=None) <cadit_predict>` | Predict an uplift for X.                         |
-    +-------------------------------------------------+--------------------------------------------------+
+    +-------------------------------------------------------+--------------------------------------------------+
+    | :ref:`fit(self, X, y, t) <cadit_fit>`                 | Build a model from the training set (X, y, t).   |
+    +-------------------------------------------------------+--------------------------------------------------+
+    | :ref:`partial_fit(self, X, y, t) <cadit_partial_fit>` | Update the model with a block of data (X, y, t). |
+    +-------------------------------------------------------+--------------------------------------------------+
+    | :ref:`predict(self, X, t=None) <cadit_predict>`       | Predict an uplift for X.                         |
+    +-------------------------------------------------------+--------------------------------------------------+
     """
 
-    def __init__(self, model=LinearRegression()):
+    def __init__(self, model=LinearRegression(), dtype=np.float64):
         try:
             model.__getattribute__('fit')
             model.__getattribute__('predict')
         except AttributeError:
             raise ValueError('Model should contains two methods: fit and predict.')
         self.model = model
+        self.dtype = dtype
 
-    def fit(self, X, y, t):
+    def fit(self, X, y, t, propensity=None):
         """Build a model from the training set (X, y, t).
 
         +------------------+---------------------------------------------------------------------------------+
@@ -40,15 +45,52 @@ class Cadit(BaseModel):
         |                  | |   Array of target of feature.                                                 |
         |                  | | **t: numpy array with shape = [n_samples,]**                                  |
         |                  | |   Array of treatments.                                                        |
+        |                  | | **propensity: numpy array with shape = [n_samples,] or None, optional**       |
+        |                  | |   Probabilities of the treatment for each sample. By default the share of     |
+        |                  | |   the treated samples is used for all samples (randomized experiments).       |
         +------------------+---------------------------------------------------------------------------------+
         | **Returns**      | **self : object**                                                               |
         +------------------+---------------------------------------------------------------------------------+
         """
 
-        z = self.__get_z_values(y, t)
+        self.n_samples = y.shape[0]
+        self.control_count = t[t == 0].shape[0]
+        self.y_sum = y.sum()
+        z = self.__get_z_values(y, t, self.control_count / self.n_samples, self.y_sum / self.n_samples, propensity)
         self.model.fit(X, z)
         return self
 
+    def partial_fit(self, X, y, t, propensity=None):
+        """Update the model with a block of the training set (X, y, t).
+
+        The treatment share and the mean of the target are estimated from all the blocks seen so far.
+        The model should contain the `partial_fit` method (e.g. sklearn.linear_model.SGDRegressor).
+
+        +------------------+---------------------------------------------------------------------------------+
+        | **Parameters**   | | **X: numpy ndarray with shape = [n_samples, n_features]**                     |
+        |                  | |   Matrix of features.                                                         |
+        |                  | | **y: numpy array with shape = [n_samples,]**                                  |
+        |                  | |   Array of target of feature.                                                 |
+        |                  | | **t: numpy array with shape = [n_samples,]**                                  |
+        |                  | |   Array of treatments.                                                        |
+        |                  | | **propensity: numpy array with shape = [n_samples,] or None, optional**       |
+        |                  | |   Probabilities of the treatment for each sample. By default the share of     |
+        |                  | |   the treated samples is used for all samples (randomized experiments).       |
+        +------------------+---------------------------------------------------------------------------------+
+        | **Returns**      | **self : object**                                                               |
+        +------------------+---------------------------------------------------------------------------------+
+        """
+
+        self._check_partial_fit(self.model)
+        if not hasattr(self, 'n_samples'):
+            self.n_samples, self.control_count, self.y_sum = 0, 0, 0
+        self.n_samples += y.shape[0]
+        self.control_count += t[t == 0].shape[0]
+        self.y_sum += y.sum()
+        z = self.__get_z_values(y, t, self.control_count / self.n_samples, self.y_sum / self.n_samples, propensity)
+        self.model.partial_fit(X, z)
+        return self
+
     def predict(self, X, t=None):
         """Predict an uplift for X.
 
@@ -65,15 +107,21 @@ class Cadit(BaseModel):
 
         return self.model.predict(X)
 
-    def __get_z_values(self, y, t):
-        p_t0 = t[t == 0].shape[0] / t.shape[0]
-        p_t1 = 1 - p_t0
-        y_mean = y.mean()
-        z = []
-        for i in range(y.shape[0]):
-            if t[i] == 0:
-                val = (1/p_t1) * (y[i] - y_mean)
-            else:
-                val = - (1/p_t0) * (y[i] - y_mean)
-            z.append(val)
-        return np.array(z)
+    def __get_z_values(self, y, t, p_t0, y_mean, propensity=None):
+        if propensity is None:
+            p_t1 = 1 - p_t0
+        else:
+            p_t1 = np.asarray(propensity)
+            if p_t1.shape != y.shape:
+                raise ValueError('Propensity should have the same shape as the target.')
+            if not np.all((p_t1 > 0) & (p_t1 < 1)):
+                raise ValueError('Propensity should be between 0 and 1 (exclusive).')
+
+        # z = (t - p_t1) / (p_t1 * (1 - p_t1)) * (y - y_mean):
+        # treatment: (y - y_mean) / p_t1, control: -(y - y_mean) / (1 - p_t1)
+        z = np.empty(y.shape[0], dtype=self.dtype)
+        np.subtract(y, y_mean, out=z)
+        control = t == 0
+        np.divide(z, p_t1, out=z, where=~control)
+        np.divide(z, p_t1 - 1, out=z, where=control)
+        return z
@@ -1,6 +1,9 @@
 import numpy as np
+import scipy.sparse as sp
 from sklearn.linear_model import LinearRegression
 from pyuplift import BaseModel
+from pyuplift.utils.sparse import hstack
+from pyuplift.utils.linear import get_linear_coefficients
 
 
 class Dummy(BaseModel):
@@ -15,11 +18,13 @@ class Dummy(BaseModel):
     *******
     Methods
     *******
-    +-------------------------------------------------+-----------------------------------------------------+
-    | :ref:`fit(self, X, y, t) <dummy_fit>`           | Build a dummy model from the training set (X, y, t).|
-    +-------------------------------------------------+-----------------------------------------------------+
-    | :ref:`predict(self, X, t=None) <dummy_predict>` | Predict an uplift for X.                            |
-    +-------------------------------------------------+-----------------------------------------------------+
+    +-------------------------------------------------------+------------------------------------------------------+
+    | :ref:`fit(self, X, y, t) <dummy_fit>`                 | Build a dummy model from the training set (X, y, t). |
+    +-------------------------------------------------------+------------------------------------------------------+
+    | :ref:`partial_fit(self, X, y, t) <dummy_partial_fit>` | Update the model with a block of data (X, y, t).     |
+    +-------------------------------------------------------+------------------------------------------------------+
+    | :ref:`predict(self, X, t=None) <dummy_predict>`       | Predict an uplift for X.                             |
+    +-------------------------------------------------------+------------------------------------------------------+
     """
 
     def __init__(self, model=LinearRegression()):
@@ -45,13 +50,38 @@ class Dummy(BaseModel):
         +------------------+---------------------------------------------------------------------------------+
         """
 
-        x_train = np.append(X, t.reshape((-1, 1)), axis=1)
+        x_train = hstack([X, t.reshape((-1, 1))])
         self.model.fit(x_train, y)
         return self
 
+    def partial_fit(self, X, y, t):
+        """Update the model with a block of the training set (X, y, t).
+
+        The model should contain the `partial_fit` method (e.g. sklearn.linear_model.SGDRegressor).
+
+        +------------------+---------------------------------------------------------------------------------+
+        | **Parameters**   | | **X: numpy ndarray with shape = [n_samples, n_features]**                     |
+        |                  | |   Matrix of features.                                                         |
+        |                  | | **y: numpy array with shape = [n_samples,]**                                  |
+        |                  | |   Array of target of feature.                                                 |
+        |                  | | **t: numpy array with shape = [n_samples,]**                                  |
+        |                  | |   Array of treatments.                                                        |
+        +------------------+---------------------------------------------------------------------------------+
+        | **Returns**      | **self : object**                                                               |
+        +------------------+---------------------------------------------------------------------------------+
+        """
+
+        self._check_partial_fit(self.model)
+        x_train = hstack([X, t.reshape((-1, 1))])
+        self.model.partial_fit(x_train, y)
+        return self
+
     def predict(self, X, t=None):
         """Predict an uplift for X.
 
+        If the model is a linear regression (e.g. sklearn.linear_model.LinearRegression or Ridge),
+        the uplift equals the coefficient of the treatment and it is computed without the model.
+
         +------------------+---------------------------------------------------------------------------------+
         | **Parameters**   | | **X: numpy ndarray with shape = [n_samples, n_features]**                     |
         |                  | |   Matrix of features.                                                         |
@@ -63,11 +93,18 @@ class Dummy(BaseModel):
         +------------------+---------------------------------------------------------------------------------+
         """
 
-        col = np.array(X.shape[0] * [0])
-        x_test = np.append(X, col.reshape((-1, 1)), axis=1)
+        coef = get_linear_coefficients(self.model)
+        if coef is not None and coef.shape[0] == X.shape[1] + 1:
+            return np.full(X.shape[0], coef[-1])
+
+        col = np.zeros((X.shape[0], 1))
+        x_test = hstack([X, col])
         # All treatment values == 0
         s0 = self.model.predict(x_test)
-        x_test[:, -1] = 1
+        if sp.issparse(x_test):
+            x_test = hstack([X, col + 1])
+        else:
+            x_test[:, -1] = 1
         # All treatment values == 1
         s1 = self.model.predict(x_test)
         return s1 - s0
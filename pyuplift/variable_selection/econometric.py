@@ -1,6 +1,8 @@
 import numpy as np
 from sklearn.linear_model import LinearRegression
 from pyuplift import BaseModel
+from pyuplift.utils.sparse import hstack, multiply
+from pyuplift.utils.linear import get_linear_coefficients
 
 
 class Econometric(BaseModel):
@@ -15,11 +17,13 @@ class Econometric(BaseModel):
     *******
     Methods
     *******
-    +-----------------------------------------------+------------------------------------------------------------+
-    | :ref:`fit(self, X, y, t) <eco_fit>`           | Build an econometric model from the training set (X, y, t).|
-    +-----------------------------------------------+------------------------------------------------------------+
-    | :ref:`predict(self, X, t=None) <eco_predict>` | Predict an uplift for X.                                   |
-    +-----------------------------------------------+------------------------------------------------------------+
+    +-----------------------------------------------------+-------------------------------------------------------------+
+    | :ref:`fit(self, X, y, t) <eco_fit>`                 | Build an econometric model from the training set (X, y, t). |
+    +-----------------------------------------------------+-------------------------------------------------------------+
+    | :ref:`partial_fit(self, X, y, t) <eco_partial_fit>` | Update the model with a block of data (X, y, t).            |
+    +-----------------------------------------------------+-------------------------------------------------------------+
+    | :ref:`predict(self, X, t=None) <eco_predict>`       | Predict an uplift for X.                                    |
+    +-----------------------------------------------------+-------------------------------------------------------------+
     """
 
     def __init__(self, model=LinearRegression()):
@@ -49,9 +53,34 @@ class Econometric(BaseModel):
         self.model.fit(x_train, y)
         return self
 
+    def partial_fit(self, X, y, t):
+        """Update the model with a block of the training set (X, y, t).
+
+        The model should contain the `partial_fit` method (e.g. sklearn.linear_model.SGDRegressor).
+
+        +------------------+---------------------------------------------------------------------------------+
+        | **Parameters**   | | **X: numpy ndarray with shape = [n_samples, n_features]**                     |
+        |                  | |   Matrix of features.                                                         |
+        |                  | | **y: numpy array with shape = [n_samples,]**                                  |
+        |                  | |   Array of target of feature.                                                 |
+        |                  | | **t: numpy array with shape = [n_samples,]**                                  |
+        |                  | |   Array of treatments.                                                        |
+        +------------------+---------------------------------------------------------------------------------+
+        | **Returns**      | **self : object**                                                               |
+        +------------------+---------------------------------------------------------------------------------+
+        """
+
+        self._check_partial_fit(self.model)
+        x_train = self.__get_matrix(X, t)
+        self.model.partial_fit(x_train, y)
+        return self
+
     def predict(self, X, t=None):
         """Predict an uplift for X.
 
+        If the model is a linear regression (e.g. sklearn.linear_model.LinearRegression or Ridge),
+        the uplift equals `coef_t + X @ coef_xt` and it is computed with a single matrix-vector product.
+
         +------------------+---------------------------------------------------------------------------------+
         | **Parameters**   | | **X: numpy ndarray with shape = [n_samples, n_features]**                     |
         |                  | |   Matrix of features.                                                         |
@@ -63,15 +92,20 @@ class Econometric(BaseModel):
         +------------------+---------------------------------------------------------------------------------+
         """
 
-        x_test = self.__get_matrix(X, np.array(X.shape[0] * [0]))
+        n_features = X.shape[1]
+        coef = get_linear_coefficients(self.model)
+        if coef is not None and coef.shape[0] == 2 * n_features + 1:
+            # Coefficients of X, T and X*T
+            return coef[n_features] + X @ coef[n_features + 1:]
+
+        x_test = self.__get_matrix(X, np.zeros(X.shape[0]))
         v0 = self.model.predict(x_test)
-        x_test = self.__get_matrix(X, np.array(X.shape[0] * [1]))
+        x_test = self.__get_matrix(X, np.ones(X.shape[0]))
         v1 = self.model.predict(x_test)
         return v1 - v0
 
     def __get_matrix(self, X, t):
         """Create X|T|X*T matrix"""
 
-        x_t = np.append(X, t.reshape((-1, 1)), axis=1)
-        xt = X * t.reshape((-1, 1))
-        return np.append(x_t, xt, axis=1)
+        t = t.reshape((-1, 1))
+        return hstack([X, t, multiply(X, t)])
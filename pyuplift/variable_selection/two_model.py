@@ -1,5 +1,8 @@
+import copy
+from joblib import Parallel, delayed
 from sklearn.linear_model import LinearRegression
 from pyuplift import BaseModel
+from pyuplift.utils.sparse import to_indexable
 
 
 class TwoModel(BaseModel):
@@ -10,19 +13,32 @@ class TwoModel(BaseModel):
     |                | |   The regression model which will be used for predict uplift.                             |
     |                | | **has_treatment_model : object, optional (default=sklearn.linear_model.LinearRegression)**|
     |                | |   The regression model which will be used for predict uplift.                             |
+    |                | | **n_jobs : int or None, optional (default=None)**                                         |
+    |                | |   The number of jobs to fit and predict both models in parallel.                          |
+    |                | |   None means 1, -1 means using all processors.                                            |
+    |                | | **prefer : string, optional (default='threads')**                                         |
+    |                | |   Run the jobs in a pool of 'threads' or 'processes'.                                     |
     +----------------+---------------------------------------------------------------------------------------------+
 
     *******
     Methods
     *******
-    +-----------------------------------------------+--------------------------------------------------------------+
-    | :ref:`fit(self, X, y, t) <two_fit>`           | Build a two model model from the training set (X, y, t).     |
-    +-----------------------------------------------+--------------------------------------------------------------+
-    | :ref:`predict(self, X, t=None) <two_predict>` | Predict an uplift for X.                                     |
-    +-----------------------------------------------+--------------------------------------------------------------+
+    +-----------------------------------------------------+----------------------------------------------------------+
+    | :ref:`fit(self, X, y, t) <two_fit>`                 | Build a two model model from the training set (X, y, t). |
+    +-----------------------------------------------------+----------------------------------------------------------+
+    | :ref:`partial_fit(self, X, y, t) <two_partial_fit>` | Update the model with a block of data (X, y, t).         |
+    +-----------------------------------------------------+----------------------------------------------------------+
+    | :ref:`predict(self, X, t=None) <two_predict>`       | Predict an uplift for X.                                 |
+    +-----------------------------------------------------+----------------------------------------------------------+
     """
 
-    def __init__(self, no_treatment_model=LinearRegression(), has_treatment_model=LinearRegression()):
+    def __init__(
+        self,
+        no_treatment_model=LinearRegression(),
+        has_treatment_model=LinearRegression(),
+        n_jobs=None,
+        prefer='threads'
+    ):
         try:
             no_treatment_model.__getattribute__('fit')
             no_treatment_model.__getattribute__('predict')
@@ -35,8 +51,16 @@ class TwoModel(BaseModel):
         except AttributeError:
             raise ValueError('Has treatment model should contains two methods: fit and predict.')
 
+        if prefer not in ('threads', 'processes'):
+            raise ValueError("Prefer should be 'threads' or 'processes'.")
+
+        if no_treatment_model is has_treatment_model:
+            # Both models are fitted separately, so they can not be the same object
+            has_treatment_model = copy.deepcopy(has_treatment_model)
         self.no_treatment_model = no_treatment_model
         self.has_treatment_model = has_treatment_model
+        self.n_jobs = n_jobs
+        self.prefer = prefer
 
     def fit(self, X, y, t):
         """Build a model model model from the training set (X, y, t).
@@ -53,17 +77,39 @@ class TwoModel(BaseModel):
         +------------------+---------------------------------------------------------------------------------+
         """
 
-        no_treatment_x, no_treatment_y = [], []
-        has_treatment_x, has_treatment_y = [], []
-        for idx, el in enumerate(t):
-            if el:
-                has_treatment_x.append(X[idx])
-                has_treatment_y.append(y[idx])
-            else:
-                no_treatment_x.append(X[idx])
-                no_treatment_y.append(y[idx])
-        self.no_treatment_model.fit(no_treatment_x, no_treatment_y)
-        self.has_treatment_model.fit(has_treatment_x, has_treatment_y)
+        X = to_indexable(X)
+        has_treatment = t != 0
+        self.no_treatment_model, self.has_treatment_model = Parallel(n_jobs=self.n_jobs, prefer=self.prefer)([
+            delayed(_fit_model)(self.no_treatment_model, X[~has_treatment], y[~has_treatment]),
+            delayed(_fit_model)(self.has_treatment_model, X[has_treatment], y[has_treatment]),
+        ])
+        return self
+
+    def partial_fit(self, X, y, t):
+        """Update the model with a block of the training set (X, y, t).
+
+        Both models should contain the `partial_fit` method (e.g. sklearn.linear_model.SGDRegressor).
+
+        +------------------+---------------------------------------------------------------------------------+
+        | **Parameters**   | | **X: numpy ndarray with shape = [n_samples, n_features]**                     |
+        |                  | |   Matrix of features.                                                         |
+        |                  | | **y: numpy array with shape = [n_samples,]**                                  |
+        |                  | |   Array of target of feature.                                                 |
+        |                  | | **t: numpy array with shape = [n_samples,]**                                  |
+        |                  | |   Array of treatments.                                                        |
+        +------------------+---------------------------------------------------------------------------------+
+        | **Returns**      | **self : object**                                                               |
+        +------------------+---------------------------------------------------------------------------------+
+        """
+
+        self._check_partial_fit(self.no_treatment_model, 'No treatment model')
+        self._check_partial_fit(self.has_treatment_model, 'Has treatment model')
+        X = to_indexable(X)
+        has_treatment = t != 0
+        if has_treatment.any():
+            self.has_treatment_model.partial_fit(X[has_treatment], y[has_treatment])
+        if not has_treatment.all():
+            self.no_treatment_model.partial_fit(X[~has_treatment], y[~has_treatment])
         return self
 
     def predict(self, X, t=None):
@@ -80,6 +126,13 @@ class TwoModel(BaseModel):
         +------------------+---------------------------------------------------------------------------------+
         """
 
-        s1 = self.has_treatment_model.predict(X)
-        s0 = self.no_treatment_model.predict(X)
+        s1, s0 = Parallel(n_jobs=self.n_jobs, prefer=self.prefer)([
+            delayed(self.has_treatment_model.predict)(X),
+            delayed(self.no_treatment_model.predict)(X),
+        ])
         return s1 - s0
+
+
+def _fit_model(model, X, y):
+    model.fit(X, y)
+    return model
@@ -24,8 +24,11 @@ setup(
     packages=find_packages(),
     keywords=['uplift modeling', 'machine learning', 'true response modeling', 'incremental value marketing'],
     install_requires=[
+        'numpy>=1.18.0',
         'pandas>=0.23.4',
         'scikit-learn>=0.20.0',
+        'scipy>=1.0.0',
+        'joblib>=0.12',
         'requests>=2.19.1',
     ],
     extras_require={
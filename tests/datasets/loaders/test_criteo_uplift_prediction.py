@@ -1,8 +1,12 @@
 import os
+import gzip
 import shutil
 import pytest
+import numpy as np
+import pandas as pd
 from pyuplift.datasets import load_criteo_uplift_prediction
 from pyuplift.datasets import download_criteo_uplift_prediction
+from pyuplift.datasets.loaders import criteo_uplift_prediction
 
 
 data_home = os.path.join(os.sep.join(__file__.split(os.sep)[:-1]), 'data')
@@ -27,3 +31,76 @@ def test_load_criteo_uplift_prediction():
     df = load_criteo_uplift_prediction(data_home=data_home)
     assert len(df['feature_names']) != 11
     shutil.rmtree(data_home)
+
+
+def make_criteo_csv(path, size=1000, random_state=0):
+    rng = np.random.RandomState(random_state)
+    df = pd.DataFrame({'f{}'.format(i): rng.normal(size=size) for i in range(12)})
+    for name in ['treatment', 'conversion', 'visit', 'exposure']:
+        df[name] = rng.randint(0, 2, size)
+    df.to_csv(path, index=False)
+    return df
+
+
+def test_load_criteo_uplift_prediction__binary_cache(tmp_path, monkeypatch):
+    df = make_criteo_csv(str(tmp_path / 'criteo_uplift_prediction.csv'))
+    monkeypatch.setattr(criteo_uplift_prediction, 'CHUNK_SIZE', 300)
+    dataset = load_criteo_uplift_prediction(data_home=str(tmp_path), download_if_missing=False)
+    assert isinstance(dataset['data'], np.memmap)
+    assert dataset['data'].dtype == np.float32 and dataset['treatment'].dtype == np.int8
+    assert np.array_equal(dataset['data'], df.iloc[:, :12].values.astype(np.float32))
+    assert list(dataset['feature_names']) == list(df.columns[:12])
+    assert np.array_equal(dataset['target'], df['visit'])
+    assert np.array_equal(dataset['target_exposure'], df['exposure'])
+
+    # The cache is loaded without the CSV file
+    os.remove(str(tmp_path / 'criteo_uplift_prediction.csv'))
+    dataset = load_criteo_uplift_prediction(data_home=str(tmp_path), download_if_missing=False, targets=('conversion',))
+    assert np.array_equal(dataset['target'], df['conversion'])
+    assert 'target_visit' not in dataset
+
+
+def test_load_criteo_uplift_prediction__wrong_targets(tmp_path):
+    with pytest.raises(ValueError):
+        load_criteo_uplift_prediction(data_home=str(tmp_path), targets=('clicks',))
+
+
+def test_load_criteo_uplift_prediction__from_archive(tmp_path):
+    csv_path = str(tmp_path / 'data.csv')
+    df = make_criteo_csv(csv_path)
+    with open(csv_path, 'rb') as f_in, gzip.open(str(tmp_path / 'criteo_uplift_prediction.gz'), 'wb') as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    os.remove(csv_path)
+
+    dataset = load_criteo_uplift_prediction(data_home=str(tmp_path), download_if_missing=False)
+    assert np.array_equal(dataset['data'], df.iloc[:, :12].values.astype(np.float32))
+    assert np.array_equal(dataset['treatment'], df['treatment'])
+    # The archive is parsed without unpacking
+    assert not os.path.exists(str(tmp_path / 'criteo_uplift_prediction.csv'))
+
+
+def test_load_criteo_uplift_prediction__sample(tmp_path, monkeypatch):
+    df = make_criteo_csv(str(tmp_path / 'criteo_uplift_prediction.csv'), size=3000)
+    monkeypatch.setattr(criteo_uplift_prediction, 'CHUNK_SIZE', 700)
+    dataset = load_criteo_uplift_prediction(
+        data_home=str(tmp_path), download_if_missing=False, targets=('conversion', 'visit'), n_samples=300, random_state=0
+    )
+    assert dataset['data'].shape == (300, 12) and not isinstance(dataset['data'], np.memmap)
+    # The rows are taken together from every array
+    rows = pd.DataFrame(dataset['data'], columns=dataset['feature_names'])
+    merged = rows.merge(df.astype({name: np.float32 for name in df.columns[:12]}), on=list(df.columns[:12]))
+    assert np.array_equal(merged['conversion'], dataset['target'])
+    assert np.array_equal(merged['visit'], dataset['target_visit'])
+    assert np.array_equal(merged['treatment'], dataset['treatment'])
+
+    for t_value in (0, 1):
+        for y_value in (0, 1):
+            size = ((df['treatment'] == t_value) & (df['conversion'] == y_value)).sum()
+            selected = (dataset['treatment'] == t_value) & (dataset['target'] == y_value)
+            assert abs(selected.sum() - size / 10) < 1
+            assert np.isclose(dataset['sample_weight'][selected].sum(), size)
+
+    dataset = load_criteo_uplift_prediction(data_home=str(tmp_path), fraction=0.5)
+    assert dataset['data'].shape == (1500, 12) and dataset['sample_weight'].shape == (1500,)
+    with pytest.raises(ValueError):
+        load_criteo_uplift_prediction(data_home=str(tmp_path), n_samples=10, fraction=0.5)
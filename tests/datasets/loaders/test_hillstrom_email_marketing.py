@@ -1,6 +1,8 @@
 import os
 import shutil
 import pytest
+import numpy as np
+import pandas as pd
 from pyuplift.datasets import download_hillstrom_email_marketing
 from pyuplift.datasets import load_hillstrom_email_marketing
 
@@ -39,3 +41,32 @@ def test_load_hillstrom_email_marketing__using_raw_data():
 def test_load_hillstrom_email_marketing__do_not_download_if_missing():
     with pytest.raises(FileNotFoundError):
         load_hillstrom_email_marketing(data_home=data_home, download_if_missing=False)
+
+
+def test_load_hillstrom_email_marketing__sample(tmp_path):
+    rng = np.random.RandomState(0)
+    size = 900
+    pd.DataFrame({
+        'recency': rng.randint(1, 13, size),
+        'history_segment': rng.choice(['1) $0 - $100', '2) $100 - $200', '3) $200 - $350'], size),
+        'history': rng.uniform(0, 350, size),
+        'mens': rng.randint(0, 2, size),
+        'womens': rng.randint(0, 2, size),
+        'zip_code': rng.choice(['Surburban', 'Rural', 'Urban'], size),
+        'newbie': rng.randint(0, 2, size),
+        'channel': rng.choice(['Phone', 'Web', 'Multichannel'], size),
+        'segment': np.repeat(['No E-Mail', 'Mens E-Mail', 'Womens E-Mail'], size // 3),
+        'visit': rng.randint(0, 2, size),
+        'conversion': rng.randint(0, 2, size),
+        'spend': np.where(rng.uniform(size=size) < 0.2, rng.uniform(0, 500, size), 0),
+    }).to_csv(str(tmp_path / 'hillstrom_email_marketing.csv'), index=False)
+
+    full = load_hillstrom_email_marketing(data_home=str(tmp_path), download_if_missing=False)
+    dataset = load_hillstrom_email_marketing(data_home=str(tmp_path), download_if_missing=False, fraction=0.2, random_state=0)
+    assert dataset['data'].shape == (180, full['data'].shape[1])
+    assert np.array_equal(np.bincount(dataset['treatment']), [60, 60, 60])
+    assert np.isclose(dataset['sample_weight'].sum(), size)
+    assert np.isclose((dataset['sample_weight'] * (dataset['target'] != 0)).sum(), (full['target'] != 0).sum())
+
+    raw = load_hillstrom_email_marketing(data_home=str(tmp_path), load_raw_data=True, n_samples=90, random_state=0)
+    assert raw['data'].shape[0] == 90 and raw['sample_weight'].shape == (90,)
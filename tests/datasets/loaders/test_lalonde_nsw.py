@@ -1,6 +1,8 @@
 import os
 import shutil
 import pytest
+import numpy as np
+import pandas as pd
 from pyuplift.datasets import download_lalonde_nsw, load_lalonde_nsw
 
 
@@ -37,3 +39,15 @@ def test_load_lalonde_nsw():
     df = load_lalonde_nsw(data_home=data_home)
     assert len(df['feature_names']) == 7
     shutil.rmtree(data_home)
+
+
+def test_load_lalonde_nsw__sample(tmp_path):
+    rng = np.random.RandomState(0)
+    df = pd.DataFrame({name: rng.randint(0, 2, 722) for name in ['treat', 'age', 'educ', 'black', 'hisp', 'married', 'nodegr', 're75']})
+    df['re78'] = np.where(rng.uniform(size=722) < 0.7, rng.uniform(0, 20000, 722), 0)
+    df.to_csv(str(tmp_path / 'lalonde_nsw.csv'), index=False)
+
+    dataset = load_lalonde_nsw(data_home=str(tmp_path), download_if_missing=False, n_samples=100, random_state=0)
+    assert dataset['data'].shape == (100, 7)
+    assert np.isclose(dataset['sample_weight'].sum(), 722)
+    assert np.isclose((dataset['sample_weight'] * dataset['treatment']).sum(), df['treat'].sum())
@@ -0,0 +1,14 @@
+import pytest
+from pyuplift.datasets.loaders import manifest
+
+
+def test_get_sha256__configured(monkeypatch):
+    monkeypatch.setitem(manifest.SHA256, 'http://example.com/data.csv', 'ab' * 32)
+    assert manifest._get_sha256('http://example.com/data.csv') == 'ab' * 32
+
+
+@pytest.mark.parametrize('url', list(manifest.SHA256) + ['http://example.com/other.csv'])
+def test_get_sha256__not_configured(monkeypatch, url):
+    monkeypatch.setitem(manifest.SHA256, url, None)
+    with pytest.warns(UserWarning, match='not verified'):
+        assert manifest._get_sha256(url) is None
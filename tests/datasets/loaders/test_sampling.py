@@ -0,0 +1,101 @@
+import pytest
+import numpy as np
+from pyuplift.datasets.loaders.sampling import _check_sampling_params, _sample_rows
+
+
+def make_labels(size=10000, random_state=0):
+    rng = np.random.RandomState(random_state)
+    t = (rng.uniform(size=size) < 0.8).astype(np.int8)
+    y = (rng.uniform(size=size) < 0.05 + 0.05 * t).astype(np.int8)
+    return t, y
+
+
+def iter_blocks(t, y, chunk_size):
+    return lambda: ((t[i:i + chunk_size], y[i:i + chunk_size]) for i in range(0, t.shape[0], chunk_size))
+
+
+def test_sample_rows__strata():
+    t, y = make_labels()
+    indices, weights = _sample_rows(iter_blocks(t, y, 1000), t.shape[0], n_samples=1000, random_state=1)
+    assert indices.shape == weights.shape == (1000,)
+    assert np.array_equal(indices, np.unique(indices))
+    for t_value in (0, 1):
+        for y_value in (0, 1):
+            in_stratum = (t == t_value) & (y == y_value)
+            selected = in_stratum[indices]
+            assert abs(selected.sum() - in_stratum.sum() / 10) < 1
+            assert np.allclose(weights[selected], in_stratum.sum() / selected.sum())
+    # The weighted counts of the strata are equal to the counts of the dataset
+    assert np.isclose(weights.sum(), t.shape[0])
+    assert np.isclose(weights[t[indices] == 1].sum(), t.sum())
+
+
+def test_sample_rows__blocks():
+    t, y = make_labels()
+    indices, weights = _sample_rows(iter_blocks(t, y, 10000), t.shape[0], fraction=0.3, random_state=3)
+    block_indices, block_weights = _sample_rows(iter_blocks(t, y, 777), t.shape[0], fraction=0.3, random_state=3)
+    assert indices.shape[0] == block_indices.shape[0] == 3000
+    assert np.array_equal(np.bincount(2 * t[indices] + y[indices]), np.bincount(2 * t[block_indices] + y[block_indices]))
+    assert np.array_equal(np.sort(weights), np.sort(block_weights))
+
+
+def test_sample_rows__uniform():
+    t = np.zeros(20, dtype=np.int8)
+    y = np.zeros(20, dtype=np.int8)
+    hits = np.zeros(20)
+    for seed in range(2000):
+        indices, _ = _sample_rows(iter_blocks(t, y, 7), 20, n_samples=5, random_state=seed)
+        hits[indices] += 1
+    assert np.allclose(hits / 2000, 0.25, atol=0.04)
+
+
+def test_sample_rows__random_state():
+    t, y = make_labels(1000)
+    first, _ = _sample_rows(iter_blocks(t, y, 100), 1000, n_samples=100, random_state=7)
+    second, _ = _sample_rows(iter_blocks(t, y, 100), 1000, n_samples=100, random_state=7)
+    assert np.array_equal(first, second)
+
+
+def test_sample_rows__string_treatment():
+    t = np.array(['No E-Mail', 'Mens E-Mail', 'Womens E-Mail'] * 100, dtype=object)
+    y = np.tile([0., 0., 1.5], 100)
+    indices, weights = _sample_rows(lambda: [(t, y)], 300, fraction=0.5, random_state=0)
+    assert indices.shape[0] == 150
+    assert np.array_equal(np.unique(t[indices], return_counts=True)[1], [50, 50, 50])
+    assert np.allclose(weights, 2)
+
+
+def test_sample_rows__all_rows():
+    t, y = make_labels(100)
+    indices, weights = _sample_rows(iter_blocks(t, y, 30), 100, fraction=1, random_state=0)
+    assert np.array_equal(indices, np.arange(100))
+    assert np.allclose(weights, 1)
+
+
+@pytest.mark.parametrize('n_samples, fraction', [(10, 0.1), (0, None), (None, 0), (None, 1.5)])
+def test_check_sampling_params__wrong_params(n_samples, fraction):
+    with pytest.raises(ValueError):
+        _check_sampling_params(n_samples, fraction)
+
+
+def test_sample_rows__too_many_samples():
+    t, y = make_labels(100)
+    with pytest.raises(ValueError):
+        _sample_rows(iter_blocks(t, y, 30), 100, n_samples=101)
+
+
+def test_sample_rows__small_strata():
+    t = np.array([0] * 998 + [1, 1], dtype=np.int8)
+    y = np.array([0] * 997 + [1, 0, 1], dtype=np.int8)
+    indices, weights = _sample_rows(iter_blocks(t, y, 300), 1000, n_samples=10, random_state=0)
+    assert indices.shape[0] == 10
+    assert np.array_equal(np.bincount(2 * t[indices] + y[indices]), [7, 1, 1, 1])
+    assert np.allclose(np.unique(weights), [1, 997 / 7])
+    assert np.isclose(weights.sum(), 1000)
+
+
+def test_sample_rows__fewer_samples_than_strata():
+    t = np.array([0] * 98 + [1, 1], dtype=np.int8)
+    y = np.array([0] * 97 + [1, 0, 1], dtype=np.int8)
+    with pytest.raises(ValueError):
+        _sample_rows(iter_blocks(t, y, 30), 100, n_samples=3)
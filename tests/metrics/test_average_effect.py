@@ -1,3 +1,4 @@
+import numpy as np
 from pyuplift.variable_selection import Dummy
 from pyuplift.model_selection import train_test_split
 from pyuplift.datasets import make_linear_regression
@@ -18,3 +19,51 @@ def test_get_average_effect__zero_test_share():
     test_share = 0
     effect = get_average_effect(y_test, t_test, y_pred, test_share)
     assert effect == 0
+
+
+def get_average_effect_by_sorting(y_test, t_test, y_pred, test_share=0.3):
+    # Stable sort by the descending prediction, NaN last
+    order = np.lexsort((np.arange(y_pred.shape[0]), -np.nan_to_num(y_pred, nan=-np.inf), np.isnan(y_pred)))
+    top = order[:int(test_share * y_pred.shape[0])]
+    treated = t_test[top] == 1
+    s1 = y_test[top][treated].mean() if treated.any() else 0
+    s0 = y_test[top][~treated].mean() if not treated.all() else 0
+    return s1 - s0
+
+
+def test_get_average_effect__equals_sorting():
+    y_pred = model.predict(X_test)
+    for test_share in [0.1, 0.3, 0.5, 1]:
+        expected = get_average_effect_by_sorting(y_test, t_test, y_pred, test_share)
+        assert np.isclose(get_average_effect(y_test, t_test, y_pred, test_share), expected)
+
+
+def test_get_average_effect__ties():
+    y_test = np.array([1, 0, 0, 1, 1, 0])
+    t_test = np.array([1, 0, 1, 0, 1, 0])
+    y_pred = np.array([0.5, 0.5, 0.5, 0.5, 0.9, 0.1])
+    # The top 3 are 4 (0.9) and the first tied samples 0 and 1
+    assert get_average_effect(y_test, t_test, y_pred, 0.5) == 1
+    assert np.isclose(get_average_effect(y_test, t_test, y_pred, 0.5), get_average_effect_by_sorting(y_test, t_test, y_pred, 0.5))
+
+
+def test_get_average_effect__nan_last():
+    y_test = np.array([1, 0, 1, 0])
+    t_test = np.array([1, 0, 1, 0])
+    y_pred = np.array([np.nan, 0.1, 0.2, np.nan])
+    assert get_average_effect(y_test, t_test, y_pred, 0.5) == 1
+    assert get_average_effect(y_test, t_test, y_pred, 0.75) == 1
+
+
+def test_get_average_effect__one_group():
+    y_test = np.array([1., 2., 3., 4.])
+    t_test = np.array([1, 1, 0, 1])
+    y_pred = np.array([0.4, 0.3, 0.2, 0.1])
+    assert get_average_effect(y_test, t_test, y_pred, 0.5) == 1.5
+
+
+def test_get_average_effect__control_treatments():
+    y_test = np.array([1., 2., 3.])
+    t_test = np.array([1, 2, 0])
+    y_pred = np.array([0.3, 0.2, 0.1])
+    assert get_average_effect(y_test, t_test, y_pred, 1) == 1 - 2.5
@@ -0,0 +1,57 @@
+import pytest
+import numpy as np
+from pyuplift.metrics import bootstrap_metric, get_average_effect, auuc, qini_coefficient
+
+
+rng = np.random.RandomState(123)
+y = rng.randint(0, 2, 500)
+t = rng.randint(0, 3, 500)
+uplift = np.round(rng.normal(size=500), 1)
+
+
+def call_metric(metric):
+    # Hides the metric from the weighted scoring, so every resample is indexed
+    return lambda y, t, uplift, **params: metric(y, t, uplift, **params)
+
+
+def test_bootstrap_metric__wrong_n_resamples():
+    with pytest.raises(ValueError):
+        bootstrap_metric(auuc, y, t, uplift, n_resamples=0)
+
+
+def test_bootstrap_metric__wrong_confidence_level():
+    with pytest.raises(ValueError):
+        bootstrap_metric(auuc, y, t, uplift, confidence_level=1)
+
+
+def test_bootstrap_metric__wrong_method():
+    with pytest.raises(ValueError):
+        bootstrap_metric(auuc, y, t, uplift, method='jackknife')
+
+
+@pytest.mark.parametrize('metric', [get_average_effect, auuc, qini_coefficient])
+@pytest.mark.parametrize('method', ['multinomial', 'poisson'])
+def test_bootstrap_metric__weighted_equals_resampled(metric, method):
+    weighted = bootstrap_metric(metric, y, t, uplift, n_resamples=20, method=method, batch_size=6, random_state=0)
+    resampled = bootstrap_metric(call_metric(metric), y, t, uplift, n_resamples=20, method=method, batch_size=6, random_state=0)
+    assert np.allclose(weighted['scores'], resampled['scores'])
+
+
+def test_bootstrap_metric__metric_params():
+    weighted = bootstrap_metric(get_average_effect, y, t, uplift, n_resamples=10, metric_params={'test_share': 0.1}, random_state=0)
+    resampled = bootstrap_metric(call_metric(get_average_effect), y, t, uplift, n_resamples=10, metric_params={'test_share': 0.1}, random_state=0)
+    assert np.allclose(weighted['scores'], resampled['scores'])
+    assert weighted['estimate'] == get_average_effect(y, t, uplift, test_share=0.1)
+
+
+def test_bootstrap_metric__n_jobs():
+    sequential = bootstrap_metric(auuc, y, t, uplift, n_resamples=20, batch_size=5, random_state=0)
+    parallel = bootstrap_metric(auuc, y, t, uplift, n_resamples=20, batch_size=5, n_jobs=2, random_state=0)
+    assert np.array_equal(sequential['scores'], parallel['scores'])
+
+
+def test_bootstrap_metric__interval():
+    result = bootstrap_metric(get_average_effect, y, t, uplift, n_resamples=200, random_state=0)
+    assert result['scores'].shape == (200,)
+    assert result['low'] < result['estimate'] < result['high']
+    assert np.isclose(result['std'], result['scores'].std(ddof=1))
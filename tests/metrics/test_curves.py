@@ -0,0 +1,90 @@
+import pytest
+import numpy as np
+from pyuplift.metrics import uplift_curve, qini_curve, auuc, qini_coefficient
+from pyuplift.metrics.cumulative import get_cumulative_counts
+
+
+rng = np.random.RandomState(123)
+y = rng.randint(0, 2, 1000)
+t = rng.randint(0, 2, 1000)
+uplift = np.round(rng.normal(size=1000), 1)
+
+
+def get_curves_by_loop(y, t, uplift):
+    # Evaluates every distinct prediction as a threshold
+    n, uplift_values, qini_values = [0], [0.], [0.]
+    for threshold in np.unique(uplift)[::-1]:
+        top = uplift >= threshold
+        treated, control = top & (t == 1), top & (t != 1)
+        mean_t = y[treated].mean() if treated.any() else 0
+        mean_c = y[control].mean() if control.any() else 0
+        n.append(top.sum())
+        uplift_values.append((mean_t - mean_c) * top.sum())
+        qini_values.append(y[treated].sum() - (y[control].sum() * treated.sum() / control.sum() if control.any() else 0))
+    return np.array(n), np.array(uplift_values), np.array(qini_values)
+
+
+def test_get_cumulative_counts__ties():
+    n, n_t, n_c, y_t, y_c = get_cumulative_counts(
+        np.array([1, 0, 1, 1]), np.array([1, 0, 0, 1]), np.array([0.5, 0.9, 0.5, np.nan])
+    )
+    assert np.array_equal(n, [0, 1, 3, 4])
+    assert np.array_equal(n_t, [0, 0, 1, 2])
+    assert np.array_equal(n_c, [0, 1, 2, 2])
+    assert np.array_equal(y_t, [0, 0, 1, 2])
+    assert np.array_equal(y_c, [0, 0, 1, 1])
+
+
+def test_uplift_curve__equals_loop():
+    n, curve = uplift_curve(y, t, uplift)
+    expected_n, expected_curve, _ = get_curves_by_loop(y, t, uplift)
+    assert np.array_equal(n, expected_n)
+    assert np.allclose(curve, expected_curve)
+
+
+def test_qini_curve__equals_loop():
+    n, curve = qini_curve(y, t, uplift)
+    expected_n, _, expected_curve = get_curves_by_loop(y, t, uplift)
+    assert np.array_equal(n, expected_n)
+    assert np.allclose(curve, expected_curve)
+
+
+def test_curves__n_points():
+    full_n, full_curve = qini_curve(y, t, uplift)
+    n, curve = qini_curve(y, t, uplift, n_points=10)
+    assert n.shape == (10,)
+    assert n[0] == 0 and n[-1] == 1000
+    assert np.all(np.isin(n, full_n))
+    assert curve[-1] == full_curve[-1]
+
+
+def test_curves__wrong_n_points():
+    with pytest.raises(ValueError):
+        uplift_curve(y, t, uplift, n_points=1)
+
+
+def test_auuc__random_model():
+    n = 200000
+    y_random = rng.randint(0, 2, n)
+    t_random = rng.randint(0, 2, n)
+    effect = y_random[t_random == 1].mean() - y_random[t_random == 0].mean()
+    assert np.isclose(auuc(y_random, t_random, rng.normal(size=n)), effect / 2, atol=1e-3)
+
+
+def test_auuc__perfect_model():
+    y_perfect = np.array([1, 0, 0, 0, 0, 1])
+    t_perfect = np.array([1, 0, 1, 0, 1, 0])
+    assert auuc(y_perfect, t_perfect, np.array([3, 3, 2, 2, 1, 1])) > auuc(y_perfect, t_perfect, np.array([1, 1, 2, 2, 3, 3]))
+
+
+def test_qini_coefficient__random_line():
+    # The Qini curve of tied predictions is the random line
+    assert qini_coefficient(y, t, np.zeros(1000)) == 0
+    n, curve = qini_curve(y, t, uplift)
+    area = np.sum((curve[1:] + curve[:-1]) / 2 * np.diff(n))
+    assert np.isclose(qini_coefficient(y, t, uplift), (area - curve[-1] * 1000 / 2) / 1000 ** 2)
+
+
+def test_metrics__empty():
+    assert auuc(np.array([]), np.array([]), np.array([])) == 0
+    assert qini_coefficient(np.array([]), np.array([]), np.array([])) == 0
@@ -0,0 +1,45 @@
+import pytest
+import numpy as np
+from pyuplift.metrics import evaluate_models, get_average_effect, auuc, qini_coefficient
+
+
+rng = np.random.RandomState(123)
+y = rng.randint(0, 2, 1000)
+t = rng.randint(0, 2, 1000)
+predictions = {
+    'rounded': np.round(rng.normal(size=1000), 1),
+    'continuous': rng.normal(size=1000),
+    'constant': np.zeros(1000),
+}
+predictions['rounded'][:10] = np.nan
+
+
+def test_evaluate_models__equals_metrics():
+    report = evaluate_models(y, t, predictions, test_shares=(0.1, 0.3, 1.))
+    assert list(report.index) == list(predictions)
+    for name, y_pred in predictions.items():
+        for test_share in [0.1, 0.3, 1.]:
+            expected = get_average_effect(y, t, y_pred, test_share)
+            assert np.isclose(report.loc[name, 'average_effect@{}'.format(test_share)], expected)
+        assert np.isclose(report.loc[name, 'auuc'], auuc(y, t, y_pred))
+        assert np.isclose(report.loc[name, 'qini_coefficient'], qini_coefficient(y, t, y_pred))
+
+
+def test_evaluate_models__tables():
+    _, tables = evaluate_models(y, t, predictions, n_groups=10, return_tables=True)
+    for name, y_pred in predictions.items():
+        table = tables[name]
+        assert table.shape[0] == 10
+        assert np.array_equal(table['n_treated'] + table['n_control'], np.full(10, 100))
+        # The first group is the top 10% of the ranked test set
+        assert np.isclose(table['uplift'][0], get_average_effect(y, t, y_pred, 0.1))
+
+
+def test_evaluate_models__parallel():
+    report = evaluate_models(y, t, predictions)
+    assert report.equals(evaluate_models(y, t, predictions, n_jobs=2))
+
+
+def test_evaluate_models__wrong_groups():
+    with pytest.raises(ValueError):
+        evaluate_models(y, t, predictions, n_groups=0)
@@ -0,0 +1,80 @@
+import pytest
+import numpy as np
+from pyuplift.metrics import UpliftHistogram, get_average_effect, qini_curve, qini_coefficient
+
+
+rng = np.random.RandomState(123)
+y = rng.randint(0, 2, 1000)
+t = rng.randint(0, 2, 1000)
+# Predictions on the grid of 0.1 fall into distinct bins of the width 0.05
+uplift = np.clip(np.round(rng.normal(scale=0.3, size=1000), 1), -0.9, 0.9)
+uplift[:10] = np.nan
+bin_edges = np.arange(-1, 1.01, 0.1) - 0.05
+
+
+def test_uplift_histogram__exact_on_bin_edges():
+    histogram = UpliftHistogram(bin_edges).update(y, t, uplift)
+    n, curve = histogram.qini_curve()
+    expected_n, expected_curve = qini_curve(y, t, uplift)
+    assert np.allclose(curve[np.searchsorted(n, expected_n)], expected_curve)
+    assert np.isclose(histogram.qini_coefficient(), qini_coefficient(y, t, uplift))
+
+
+def test_uplift_histogram__average_effect():
+    histogram = UpliftHistogram(bin_edges).update(y, t, uplift)
+    for test_share in [0.1, 0.3, 0.5]:
+        assert histogram.get_boundary_size(test_share) > 0
+        assert -1 <= histogram.get_average_effect(test_share) <= 1
+    assert histogram.get_boundary_size(1.) == 0
+    assert np.isclose(histogram.get_average_effect(1.), get_average_effect(y, t, uplift, 1.))
+
+
+def test_uplift_histogram__average_effect_on_bin_edges():
+    # Every bin has at most one sample, so every cut falls on a bin edge
+    y, t = np.array([1, 0, 1, 1, 0, 0, 1, 0, 1, 1]), np.array([1, 1, 0, 1, 0, 1, 0, 0, 1, 0])
+    uplift = np.array([0.9, -0.7, 0.5, 0.3, 0.1, -0.1, np.nan, -0.3, 0.7, -0.5])
+    histogram = UpliftHistogram(bin_edges).update(y, t, uplift)
+    for test_share in [0.2, 0.3, 0.5, 0.8, 1.]:
+        assert histogram.get_boundary_size(test_share) == 0
+        assert np.isclose(histogram.get_average_effect(test_share), get_average_effect(y, t, uplift, test_share))
+
+
+def test_uplift_histogram__updates_and_merge_equal_one_update():
+    expected = UpliftHistogram(n_bins=50).update(y, t, uplift)
+    blocks = UpliftHistogram(n_bins=50)
+    for start in range(0, 1000, 300):
+        blocks.update(y[start:start + 300], t[start:start + 300], uplift[start:start + 300])
+    merged = UpliftHistogram(n_bins=50).update(y[:500], t[:500], uplift[:500])
+    merged.merge(UpliftHistogram(n_bins=50).update(y[500:], t[500:], uplift[500:]))
+    for histogram in [blocks, merged]:
+        assert np.array_equal(histogram.n_treated, expected.n_treated)
+        assert np.array_equal(histogram.n_control, expected.n_control)
+        assert np.allclose(histogram.y_treated, expected.y_treated)
+        assert np.allclose(histogram.y_control, expected.y_control)
+
+
+def test_uplift_histogram__merge_different_edges():
+    with pytest.raises(ValueError):
+        UpliftHistogram(n_bins=10).merge(UpliftHistogram(n_bins=20))
+
+
+def test_uplift_histogram__wrong_edges():
+    with pytest.raises(ValueError):
+        UpliftHistogram([0, 1, 1])
+    with pytest.raises(ValueError):
+        UpliftHistogram(n_bins=0)
+
+
+def test_uplift_histogram__decile_table():
+    histogram = UpliftHistogram(bin_edges).update(y, t, uplift)
+    table = histogram.get_decile_table()
+    assert table.shape[0] == 10
+    assert np.isclose(table['n_treated'].sum() + table['n_control'].sum(), 1000)
+    assert np.allclose(table['n_treated'] + table['n_control'], 100)
+    assert np.allclose(table['uplift'], table['mean_treated'] - table['mean_control'])
+
+
+def test_uplift_histogram__empty():
+    histogram = UpliftHistogram()
+    assert histogram.get_average_effect() == 0
+    assert histogram.qini_coefficient() == 0
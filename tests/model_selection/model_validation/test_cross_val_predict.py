@@ -0,0 +1,30 @@
+import pytest
+import numpy as np
+from pyuplift.variable_selection import TwoModel
+from pyuplift.datasets import make_linear_regression
+from pyuplift.model_selection import UpliftStratifiedKFold, cross_val_predict_uplift
+
+
+model = TwoModel()
+df = make_linear_regression(1000, random_state=101)
+X, y, t = df.drop(['y', 't'], axis=1).values, df['y'].values, df['t'].values
+
+
+def test_cross_val_predict_uplift__equals_fold_models():
+    cv = UpliftStratifiedKFold(3, shuffle=True, random_state=10)
+    predictions = cross_val_predict_uplift(X, y, t, model, cv)
+    assert predictions.shape == (1000,)
+    for train_index, test_index in cv.split(X, y, t):
+        fold_model = TwoModel().fit(X[train_index], y[train_index], t[train_index])
+        assert np.allclose(predictions[test_index], fold_model.predict(X[test_index]))
+
+
+def test_cross_val_predict_uplift__parallel():
+    expected = cross_val_predict_uplift(X, y, t, model, 3)
+    assert not np.isnan(expected).any()
+    assert np.allclose(cross_val_predict_uplift(X, y, t, model, 3, n_jobs=2), expected)
+
+
+def test_cross_val_predict_uplift__wrong_prefer():
+    with pytest.raises(ValueError):
+        cross_val_predict_uplift(X, y, t, model, 3, prefer='gpu')
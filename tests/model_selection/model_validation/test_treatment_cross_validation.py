@@ -1,5 +1,7 @@
 import pytest
-from pyuplift.variable_selection import Dummy
+import numpy as np
+from sklearn.linear_model import LinearRegression
+from pyuplift.variable_selection import Dummy, TwoModel
 from pyuplift.datasets import make_linear_regression
 from pyuplift.model_selection import treatment_cross_val_score
 
@@ -48,3 +50,31 @@ def test_treatment_cross_val_score__zero_train_share():
     cv, seeds = 3, list(range(3))
     with pytest.raises(ValueError):
         treatment_cross_val_score(X, y, t, model, cv, train_share, seeds)
+
+
+def test_treatment_cross_val_score__parallel():
+    cv, seeds = 3, list(range(3))
+    expected = treatment_cross_val_score(X, y, t, model, cv, train_share, seeds)
+    for prefer in ['threads', 'processes']:
+        scores = treatment_cross_val_score(X, y, t, model, cv, train_share, seeds, n_jobs=2, prefer=prefer)
+        assert np.allclose(scores, expected)
+
+
+def test_treatment_cross_val_score__return_times():
+    cv, seeds = 3, list(range(3))
+    scores, fit_times, score_times = treatment_cross_val_score(X, y, t, model, cv, train_share, seeds, return_times=True)
+    assert len(scores) == len(fit_times) == len(score_times) == cv
+    assert np.all(fit_times >= 0) and np.all(score_times >= 0)
+
+
+def test_treatment_cross_val_score__model_is_not_fitted():
+    cv, seeds = 2, list(range(2))
+    linear = TwoModel(LinearRegression(), LinearRegression())
+    treatment_cross_val_score(X, y, t, linear, cv, train_share, seeds)
+    assert not hasattr(linear.no_treatment_model, 'coef_')
+
+
+def test_treatment_cross_val_score__wrong_prefer():
+    cv, seeds = 3, list(range(3))
+    with pytest.raises(ValueError):
+        treatment_cross_val_score(X, y, t, model, cv, train_share, seeds, prefer='gpu')
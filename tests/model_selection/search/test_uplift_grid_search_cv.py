@@ -0,0 +1,49 @@
+import pytest
+import numpy as np
+from pyuplift.metrics import get_average_effect, qini_coefficient
+from pyuplift.tree import UpliftTreeClassifier
+from pyuplift.transformation import Kane
+from pyuplift.model_selection import UpliftGridSearchCV, UpliftStratifiedKFold
+from ...tree.base import make_uplift_classification
+
+
+X, y, t = make_uplift_classification(4000)
+
+
+def test_uplift_grid_search_cv__best_params():
+    param_grid = {'max_depth': [1, 3], 'min_samples_leaf': [50, 1000]}
+    search = UpliftGridSearchCV(UpliftTreeClassifier(), param_grid, scoring=qini_coefficient, cv=3).fit(X, y, t)
+    assert len(search.cv_results_['params']) == 4
+    assert search.cv_results_['rank_test_score'][search.best_index_] == 1
+    assert search.best_score_ == search.cv_results_['mean_test_score'].max()
+    # The leaves of 1000 samples can not split the root of 4000 samples by x0
+    assert search.best_params_['min_samples_leaf'] == 50
+    assert search.best_model_.max_depth == search.best_params_['max_depth']
+    assert search.predict(X).shape == (4000,)
+
+
+def test_uplift_grid_search_cv__inner_params():
+    model = Kane()
+    search = UpliftGridSearchCV(model, {'model__C': [0.01, 1.]}, cv=2, n_jobs=2).fit(X, y, t)
+    assert [params['model__C'] for params in search.cv_results_['params']] == [0.01, 1.]
+    assert search.best_model_.model.C == search.best_params_['model__C']
+    # The searched model is not changed
+    assert model.model.C == 1. and not hasattr(model.model, 'coef_')
+
+
+def test_uplift_grid_search_cv__equals_cross_validation():
+    cv = UpliftStratifiedKFold(3, shuffle=True, random_state=10)
+    search = UpliftGridSearchCV(UpliftTreeClassifier(), {'max_depth': [2]}, cv=cv, refit=False).fit(X, y, t)
+    splits = list(cv.split(X, y, t))
+    for split, (train_index, test_index) in enumerate(splits):
+        model = UpliftTreeClassifier(max_depth=2).fit(X[train_index], y[train_index], t[train_index])
+        expected = get_average_effect(y[test_index], t[test_index], model.predict(X[test_index]))
+        assert np.isclose(search.cv_results_['split{}_test_score'.format(split)][0], expected)
+    assert not hasattr(search, 'best_model_')
+
+
+def test_uplift_grid_search_cv__wrong_params():
+    with pytest.raises(ValueError):
+        UpliftGridSearchCV(UpliftTreeClassifier(), {'depth': [1, 2]}, cv=2).fit(X, y, t)
+    with pytest.raises(ValueError):
+        UpliftGridSearchCV(UpliftTreeClassifier(), {'max_depth': [1]}, prefer='gpu')
@@ -0,0 +1,70 @@
+import pytest
+import numpy as np
+from pyuplift.tree import UpliftTreeClassifier
+from pyuplift.model_selection import UpliftHalvingSearchCV, UpliftStratifiedKFold
+from ...tree.base import make_uplift_classification
+
+
+X, y, t = make_uplift_classification(9000)
+param_grid = {'max_depth': [1, 2, 3], 'min_samples_leaf': [50, 100, 5000]}
+
+
+def test_uplift_halving_search_cv__iterations():
+    search = UpliftHalvingSearchCV(UpliftTreeClassifier(), param_grid, factor=3, cv=3, random_state=10).fit(X, y, t)
+    assert search.n_candidates_ == [9, 3, 1]
+    assert search.n_resources_ == [1000, 3000, 9000]
+    assert len(search.cv_results_['params']) == 13
+    assert search.cv_results_['iteration'][search.best_index_] == 2
+    assert search.best_params_['min_samples_leaf'] != 5000
+    assert search.best_model_.min_samples_leaf == search.best_params_['min_samples_leaf']
+
+
+def test_uplift_halving_search_cv__last_iteration_uses_all_samples():
+    grid = {'max_depth': [1, 2, 3], 'min_samples_leaf': [5, 10, 20], 'criterion': ['kl', 'ed', 'chi']}
+    search = UpliftHalvingSearchCV(UpliftTreeClassifier(), grid, factor=3, cv=3, refit=False, random_state=10)
+    search.fit(X[:3000], y[:3000], t[:3000])
+    assert search.n_candidates_ == [27, 9, 3, 1]
+    assert search.n_resources_ == [111, 333, 1000, 3000]
+    assert search.n_resources_[-1] == 3000
+
+
+class SizeRecorder(UpliftStratifiedKFold):
+    def __init__(self, n_splits):
+        super().__init__(n_splits)
+        self.sizes = []
+
+    def split(self, X, y, t):
+        self.sizes.append(len(y))
+        return super().split(X, y, t)
+
+
+def test_uplift_halving_search_cv__exact_resources():
+    # int(23 / 43 * 43) == 22, the subsample size should not go through a float share
+    cv = SizeRecorder(2)
+    grid = {'max_depth': [1, 2]}
+    search = UpliftHalvingSearchCV(UpliftTreeClassifier(), grid, factor=3, min_resources=23, cv=cv, refit=False, random_state=0)
+    search.fit(X[:43], y[:43], t[:43])
+    assert search.n_resources_ == [23, 43]
+    assert cv.sizes == [23, 43]
+
+
+def test_uplift_halving_search_cv__keeps_best_candidates():
+    search = UpliftHalvingSearchCV(UpliftTreeClassifier(), param_grid, factor=3, cv=3, random_state=10).fit(X, y, t)
+    results = search.cv_results_
+    first = results['iteration'] == 0
+    best = np.argsort(-results['mean_test_score'][first], kind='stable')[:3]
+    expected = [results['params'][index] for index in best]
+    assert [results['params'][index] for index in np.flatnonzero(results['iteration'] == 1)] == expected
+
+
+def test_uplift_halving_search_cv__random_state():
+    first = UpliftHalvingSearchCV(UpliftTreeClassifier(), param_grid, cv=3, refit=False, random_state=10).fit(X, y, t)
+    second = UpliftHalvingSearchCV(UpliftTreeClassifier(), param_grid, cv=3, refit=False, random_state=10).fit(X, y, t)
+    assert np.array_equal(first.cv_results_['mean_test_score'], second.cv_results_['mean_test_score'])
+
+
+def test_uplift_halving_search_cv__wrong_factor():
+    with pytest.raises(ValueError):
+        UpliftHalvingSearchCV(UpliftTreeClassifier(), param_grid, factor=1)
+    with pytest.raises(ValueError):
+        UpliftHalvingSearchCV(UpliftTreeClassifier(), param_grid, min_resources=0)
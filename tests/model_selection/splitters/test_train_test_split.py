@@ -67,3 +67,31 @@ def test_train_test_split__zero_train_share():
 
     with pytest.raises(ValueError):
         train_test_split(X, y, t, train_share=0)
+
+
+def test_train_test_split__return_indices():
+    size = 1000
+    df = make_linear_regression(size, random_state=101)
+    X, y, t = df.drop(['y', 't'], axis=1).values, df['y'].values, df['t'].values
+    train_index, test_index = train_test_split(X, y, t, random_state=10, return_indices=True)
+    X_train, X_test, y_train, y_test, t_train, t_test = train_test_split(X, y, t, random_state=10)
+
+    assert np.array_equal(np.sort(np.concatenate([train_index, test_index])), np.arange(size))
+    assert np.array_equal(X[train_index], X_train)
+    assert np.array_equal(X[test_index], X_test)
+
+
+def test_train_test_split__stratify():
+    rng = np.random.RandomState(101)
+    size = 1003
+    X = rng.normal(size=(size, 2))
+    y = (rng.uniform(size=size) < 0.05).astype(int)
+    t = rng.randint(0, 2, size)
+    train_index, test_index = train_test_split(X, y, t, train_share=0.7, random_state=10, stratify=True, return_indices=True)
+
+    assert train_index.shape[0] == int(0.7 * size)
+    assert np.unique(train_index).shape[0] == train_index.shape[0]
+    for treatment in [0, 1]:
+        for outcome in [0, 1]:
+            cell = (t == treatment) & (y == outcome)
+            assert abs(cell[train_index].sum() - 0.7 * cell.sum()) < 1
@@ -0,0 +1,43 @@
+import pytest
+import numpy as np
+from pyuplift.model_selection import UpliftStratifiedKFold
+
+
+rng = np.random.RandomState(101)
+size = 1003
+X = rng.normal(size=(size, 2))
+y = (rng.uniform(size=size) < 0.05).astype(int)
+t = rng.randint(0, 2, size)
+
+
+def test_uplift_stratified_kfold__covers_every_sample_once():
+    folds = list(UpliftStratifiedKFold(5).split(X, y, t))
+    assert len(folds) == 5
+    test_indices = np.concatenate([test_index for _, test_index in folds])
+    assert np.array_equal(np.sort(test_indices), np.arange(size))
+    for train_index, test_index in folds:
+        assert np.intersect1d(train_index, test_index).shape[0] == 0
+        assert train_index.shape[0] + test_index.shape[0] == size
+
+
+def test_uplift_stratified_kfold__stratified():
+    for _, test_index in UpliftStratifiedKFold(5, shuffle=True, random_state=10).split(X, y, t):
+        assert abs(test_index.shape[0] - size / 5) < 1
+        for treatment in [0, 1]:
+            for outcome in [0, 1]:
+                cell = (t == treatment) & (y == outcome)
+                assert abs(cell[test_index].sum() - cell.sum() / 5) < 1
+
+
+def test_uplift_stratified_kfold__random_state():
+    first = list(UpliftStratifiedKFold(3, shuffle=True, random_state=10).split(X, y, t))
+    second = list(UpliftStratifiedKFold(3, shuffle=True, random_state=10).split(X, y, t))
+    for (_, test1), (_, test2) in zip(first, second):
+        assert np.array_equal(test1, test2)
+
+
+def test_uplift_stratified_kfold__wrong_n_splits():
+    with pytest.raises(ValueError):
+        UpliftStratifiedKFold(1)
+    with pytest.raises(ValueError):
+        list(UpliftStratifiedKFold(5).split(X[:3], y[:3], t[:3]))
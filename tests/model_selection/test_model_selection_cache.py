@@ -0,0 +1,77 @@
+import os
+import time
+import pytest
+import numpy as np
+from pyuplift.tree import UpliftTreeClassifier
+from pyuplift.model_selection import (
+    ModelSelectionCache, UpliftGridSearchCV, cross_val_predict_uplift, treatment_cross_val_score
+)
+from ..tree.base import make_uplift_classification
+
+
+X, y, t = make_uplift_classification(3000)
+
+
+def test_model_selection_cache__get_and_set(tmp_path):
+    cache = ModelSelectionCache(str(tmp_path))
+    key = cache.get_key('fit', X, 1)
+    assert key == cache.get_key('fit', X.copy(), 1)
+    assert key != cache.get_key('fit', X, 2)
+    assert cache.get(key) is None
+    cache.set(key, {'indices': np.arange(5)})
+    assert np.array_equal(cache.get(key)['indices'], np.arange(5))
+    assert cache.get_size() > 0
+    cache.clear()
+    assert cache.get(key, 'miss') == 'miss'
+
+
+def test_model_selection_cache__least_recently_used_eviction(tmp_path):
+    value = np.zeros(10000)
+    cache = ModelSelectionCache(str(tmp_path), max_bytes=int(2.5 * value.nbytes))
+    keys = [cache.get_key(index) for index in range(3)]
+    cache.set(keys[0], value)
+    cache.set(keys[1], value)
+    # The first value is used after the second one, so the second one is evicted
+    past = time.time() - 10
+    os.utime(os.path.join(str(tmp_path), keys[1] + cache.SUFFIX), (past, past))
+    cache.get(keys[0])
+    cache.set(keys[2], value)
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[2]) is not None
+    assert cache.get_size() <= cache.max_bytes
+
+
+def test_model_selection_cache__wrong_max_bytes(tmp_path):
+    with pytest.raises(ValueError):
+        ModelSelectionCache(str(tmp_path), max_bytes=0)
+
+
+def test_model_selection_cache__cross_validation(tmp_path):
+    cache = ModelSelectionCache(str(tmp_path))
+    model = UpliftTreeClassifier(max_depth=2)
+    expected, fit_times, _ = treatment_cross_val_score(X, y, t, model, 3, seeds=[1, 2, 3], return_times=True, cache=cache)
+    assert np.all(fit_times > 0)
+    scores, fit_times, _ = treatment_cross_val_score(X, y, t, model, 3, seeds=[1, 2, 3], return_times=True, cache=cache)
+    assert np.array_equal(scores, expected)
+    assert np.all(fit_times == 0)
+    # Other parameters of the model are fitted again
+    _, fit_times, _ = treatment_cross_val_score(
+        X, y, t, UpliftTreeClassifier(max_depth=3), 3, seeds=[1, 2, 3], return_times=True, cache=cache
+    )
+    assert np.all(fit_times > 0)
+
+
+def test_model_selection_cache__cross_val_predict_and_search(tmp_path):
+    cache = ModelSelectionCache(str(tmp_path))
+    model = UpliftTreeClassifier()
+    expected = cross_val_predict_uplift(X, y, t, model, 3, cache=cache)
+    assert np.array_equal(cross_val_predict_uplift(X, y, t, model, 3, cache=cache), expected)
+
+    param_grid = {'max_depth': [1, 2]}
+    first = UpliftGridSearchCV(model, param_grid, cv=3, cache=cache).fit(X, y, t)
+    second = UpliftGridSearchCV(model, param_grid, cv=3, cache=cache).fit(X, y, t)
+    assert np.all(first.cv_results_['mean_fit_time'] > 0)
+    assert np.all(second.cv_results_['mean_fit_time'] == 0)
+    assert np.array_equal(first.cv_results_['mean_test_score'], second.cv_results_['mean_test_score'])
+    assert np.array_equal(first.predict(X), second.predict(X))
@@ -1,5 +1,7 @@
 import pytest
+import numpy as np
 from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
 from pyuplift.transformation import Kane
 from .base import *
 
@@ -25,3 +27,37 @@ def test_kane__non_predict_class():
     model = NoPredictClass()
     with pytest.raises(ValueError):
         Kane(model)
+
+
+def test_kane__predict_by_chunks():
+    model = Kane(LogisticRegression(), use_weights=True).fit(X, y, t)
+    out = np.empty(X.shape[0])
+    uplift = model.predict(X, chunk_size=300, out=out)
+    assert uplift is out
+    assert np.allclose(uplift, model.predict(X))
+
+
+def test_kane__predict_wrong_chunk_size():
+    model = Kane(LogisticRegression()).fit(X, y, t)
+    with pytest.raises(ValueError):
+        model.predict(X, chunk_size=0)
+
+
+def test_kane__predict_wrong_out_shape():
+    model = Kane(LogisticRegression()).fit(X, y, t)
+    with pytest.raises(ValueError):
+        model.predict(X, out=np.empty(X.shape[0] + 1))
+
+
+def test_kane__partial_fit_without_partial_fit_method():
+    model = Kane(LogisticRegression())
+    with pytest.raises(ValueError):
+        model.partial_fit(X, y, t)
+
+
+def test_kane__sparse_input():
+    model = Kane(LogisticRegression()).fit(X_sparse, y, t)
+    dense_uplift = model.predict(X_sparse.toarray())
+    for format in ['csr', 'csc', 'coo']:
+        uplift = model.predict(X_sparse.asformat(format), chunk_size=300)
+        assert np.allclose(uplift, dense_uplift)
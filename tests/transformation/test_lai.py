@@ -1,5 +1,7 @@
 import pytest
+import numpy as np
 from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
 from pyuplift.transformation import Lai
 from .base import *
 
@@ -25,3 +27,8 @@ def test_lai__non_predict_class():
     model = NoPredictClass()
     with pytest.raises(ValueError):
         Lai(model)
+
+
+def test_lai__predict_by_chunks():
+    model = Lai(LogisticRegression(), use_weights=True).fit(X, y, t)
+    assert np.allclose(model.predict(X, chunk_size=300), model.predict(X))
@@ -1,5 +1,7 @@
 import pytest
+import numpy as np
 from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
 from pyuplift.transformation import Pessimistic
 from .base import *
 
@@ -25,3 +27,36 @@ def test_pessimistic__non_predict_class():
     model = NoPredictClass()
     with pytest.raises(ValueError):
         Pessimistic(model)
+
+
+def test_pessimistic__models_are_not_shared():
+    model = Pessimistic(LogisticRegression())
+    assert model.w_lai_model.model is not model.reflective_model.model
+
+
+def test_pessimistic__shared_fit():
+    model = Pessimistic(LogisticRegression(), shared_fit=True).fit(X, y, t)
+    uplift = model.predict(X)
+    assert uplift.shape == (X.shape[0],)
+    assert np.allclose(model.predict(X, chunk_size=300), uplift)
+
+
+class SizeRecorder(LogisticRegression):
+    """Logistic regression which records the number of rows of every `predict_proba` call."""
+
+    sizes = []
+
+    def predict_proba(self, X):
+        SizeRecorder.sizes.append(X.shape[0])
+        return super().predict_proba(X)
+
+
+def test_pessimistic__predict_by_chunks():
+    model = Pessimistic(SizeRecorder()).fit(X, y, t)
+    uplift = model.predict(X)
+    SizeRecorder.sizes.clear()
+    out = np.empty(X.shape[0])
+    result = model.predict(X, chunk_size=300, out=out)
+    assert result is out
+    assert np.allclose(out, uplift)
+    assert max(SizeRecorder.sizes) <= 300
@@ -1,5 +1,7 @@
 import pytest
+import numpy as np
 from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
 from pyuplift.transformation import Reflective
 from .base import *
 
@@ -25,3 +27,8 @@ def test_reflective__non_predict_class():
     model = NoPredictClass()
     with pytest.raises(ValueError):
         Reflective(model)
+
+
+def test_reflective__predict_by_chunks():
+    model = Reflective(LogisticRegression()).fit(X, y, t)
+    assert np.allclose(model.predict(X, chunk_size=300), model.predict(X))
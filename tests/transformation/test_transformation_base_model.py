@@ -0,0 +1,34 @@
+import numpy as np
+from pyuplift.transformation.base import TransformationBaseModel
+
+
+model = TransformationBaseModel()
+y = np.array([1, 0, 0, 1, 0.5, 0, 0, 2])
+t = np.array([1, 0, 1, 0, 1, 0, 2, 0])
+
+
+def test_encode_response_groups__groups():
+    groups, _ = model.encode_response_groups(y, t)
+    expected = []
+    for y_i, t_i in zip(y, t):
+        if model.is_tr(y_i, t_i):
+            expected.append(model.TR)
+        elif model.is_cn(y_i, t_i):
+            expected.append(model.CN)
+        elif model.is_tn(y_i, t_i):
+            expected.append(model.TN)
+        elif model.is_cr(y_i, t_i):
+            expected.append(model.CR)
+    assert groups.dtype == np.int8
+    assert np.array_equal(groups, expected)
+
+
+def test_encode_response_groups__counts():
+    _, counts = model.encode_response_groups(y, t)
+    assert np.array_equal(counts, [2, 2, 2, 2])
+
+
+def test_encode_response_groups__empty():
+    groups, counts = model.encode_response_groups(np.array([]), np.array([]))
+    assert groups.shape == (0,)
+    assert np.array_equal(counts, [0, 0, 0, 0])
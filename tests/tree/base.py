@@ -0,0 +1,14 @@
+import numpy as np
+
+
+def make_uplift_classification(n_samples=20000, random_state=0):
+    """Binary response with an uplift of 0.3 for x0 > 0 and no uplift otherwise."""
+    rng = np.random.RandomState(random_state)
+    X = rng.normal(size=(n_samples, 4))
+    t = rng.randint(0, 2, n_samples)
+    p = 0.1 + 0.3 * t * (X[:, 0] > 0)
+    y = (rng.uniform(size=n_samples) < p).astype(int)
+    return X, y, t
+
+
+X, y, t = make_uplift_classification()
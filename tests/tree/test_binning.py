@@ -0,0 +1,39 @@
+import pytest
+import numpy as np
+from pyuplift.tree import Binner
+
+
+def test_binner__wrong_max_bins():
+    with pytest.raises(ValueError):
+        Binner(max_bins=1)
+    with pytest.raises(ValueError):
+        Binner(max_bins=257)
+
+
+def test_binner__distinct_values():
+    X = np.array([[0.], [1.], [1.], [3.]])
+    binner = Binner().fit(X)
+    assert np.allclose(binner.bin_edges_[0], [0.5, 2.])
+    assert np.array_equal(binner.transform(X)[:, 0], [0, 1, 1, 2])
+
+
+def test_binner__max_bins():
+    X = np.random.RandomState(0).normal(size=(10000, 3))
+    X_binned = Binner(max_bins=16).fit_transform(X)
+    assert X_binned.dtype == np.uint8
+    assert X_binned.max() == 15
+    counts = np.bincount(X_binned[:, 0])
+    assert counts.min() > 500
+
+
+def test_binner__threshold_is_edge():
+    X = np.random.RandomState(0).normal(size=(1000, 1))
+    binner = Binner(max_bins=10).fit(X)
+    X_binned = binner.transform(X)
+    for b, edge in enumerate(binner.bin_edges_[0]):
+        assert np.array_equal(X_binned[:, 0] <= b, X[:, 0] <= edge)
+
+
+def test_binner__missing_values():
+    X = np.array([[0.], [np.nan], [1.]])
+    assert np.array_equal(Binner().fit_transform(X)[:, 0], [0, 1, 1])
@@ -0,0 +1,66 @@
+import pytest
+import numpy as np
+from pyuplift.transformation.base import TransformationBaseModel
+from pyuplift.tree.criterion import CN, CR, TN, TR, build_histogram, find_best_split, get_cells, get_divergence, get_response_rates
+from .base import *
+
+
+def test_get_divergence__wrong_criterion():
+    with pytest.raises(ValueError):
+        get_divergence(np.array([0.5]), np.array([0.5]), 'gini')
+
+
+@pytest.mark.parametrize('criterion', ['kl', 'ed', 'chi'])
+def test_get_divergence__equal_distributions(criterion):
+    p = np.array([0., 0.2, 0.7])
+    assert np.allclose(get_divergence(p, p, criterion), 0, atol=1e-5)
+
+
+def test_get_divergence__kl():
+    expected = 0.3 * np.log(0.3 / 0.1) + 0.7 * np.log(0.7 / 0.9)
+    assert np.isclose(get_divergence(np.array(0.3), np.array(0.1), 'kl'), expected)
+
+
+def test_get_cells__shared_groups():
+    assert (TR, CN, TN, CR) == TransformationBaseModel.GROUPS
+    y, t = np.array([1, 0, 0, 1]), np.array([1, 0, 1, 0])
+    assert np.array_equal(get_cells(y, t), TransformationBaseModel.encode_response_groups(y, t)[0])
+
+
+def test_build_histogram__repeated_indices():
+    X_binned = np.array([[0, 1], [1, 1], [1, 0]], dtype=np.uint8)
+    cells = get_cells(np.array([1, 0, 1]), np.array([1, 1, 0]))
+    assert np.array_equal(cells, [TR, TN, CR])
+    histogram = build_histogram(X_binned, cells, np.array([0, 0, 2]), 2)
+    assert histogram.shape == (2, 2, 4)
+    # Rows: (TR, bin 0) twice and (CR, bin 1) for the first feature, (TR, bin 1) twice and (CR, bin 0) for the second one
+    expected = np.zeros((2, 2, 4), dtype=np.int64)
+    expected[0, 0, TR] = expected[1, 1, TR] = 2
+    expected[0, 1, CR] = expected[1, 0, CR] = 1
+    assert np.array_equal(histogram, expected)
+
+
+@pytest.mark.parametrize('criterion', ['kl', 'ed', 'chi'])
+def test_find_best_split__brute_force(criterion):
+    X_binned = np.random.RandomState(1).randint(0, 8, size=(X.shape[0], X.shape[1])).astype(np.uint8)
+    X_binned[:, 2] = np.clip((X[:, 0] + 4) * 1.5, 0, 15).astype(np.uint8)
+    cells = get_cells(y, t)
+    histogram = build_histogram(X_binned, cells, np.arange(X.shape[0]), 16)
+    feature, bin, gain = find_best_split(histogram, criterion, 10, 10)
+    assert feature == 2
+
+    p, q = get_response_rates(np.bincount(cells, minlength=4))
+    parent = get_divergence(p, q, criterion)
+    go_left = X_binned[:, feature] <= bin
+    expected = -parent
+    for mask in [go_left, ~go_left]:
+        p, q = get_response_rates(np.bincount(cells[mask], minlength=4))
+        expected += mask.mean() * get_divergence(p, q, criterion)
+    assert np.isclose(gain, expected)
+
+
+def test_find_best_split__no_valid_split():
+    X_binned = np.zeros((100, 2), dtype=np.uint8)
+    histogram = build_histogram(X_binned, get_cells(y[:100], t[:100]), np.arange(100), 2)
+    _, _, gain = find_best_split(histogram, 'kl', 1, 1)
+    assert gain == -np.inf
@@ -0,0 +1,75 @@
+import pytest
+import numpy as np
+from pyuplift.model_selection import treatment_cross_val_score
+from pyuplift.tree import UpliftGradientBoosting
+from .base import *
+
+
+def test_uplift_gradient_boosting__wrong_learning_rate():
+    with pytest.raises(ValueError):
+        UpliftGradientBoosting(learning_rate=0)
+
+
+def test_uplift_gradient_boosting__wrong_validation_fraction():
+    with pytest.raises(ValueError):
+        UpliftGradientBoosting(validation_fraction=1)
+
+
+def test_uplift_gradient_boosting__one_group():
+    with pytest.raises(ValueError):
+        UpliftGradientBoosting().fit(X, y, np.ones(y.shape[0]))
+
+
+def test_uplift_gradient_boosting__wrong_propensity():
+    with pytest.raises(ValueError):
+        UpliftGradientBoosting().fit(X, y, t, propensity=np.ones(y.shape[0]))
+
+
+def test_uplift_gradient_boosting__finds_uplift():
+    model = UpliftGradientBoosting(max_iter=50, random_state=0).fit(X, y, t)
+    uplift = model.predict(X)
+    assert uplift[X[:, 0] > 0.1].mean() > 0.2
+    assert abs(uplift[X[:, 0] < -0.1].mean()) < 0.05
+
+
+def test_uplift_gradient_boosting__first_tree():
+    model = UpliftGradientBoosting(learning_rate=1, max_iter=1, max_depth=1).fit(X, y, t)
+    p = t.mean()
+    z = y * (t - p) / (p * (1 - p))
+    assert np.isclose(model.baseline_, z.mean())
+    tree = model.estimators_[0]
+    assert tree.feature[0] == 0
+    left = X[:, 0] <= tree.threshold[0]
+    assert np.allclose(model.predict(X)[left], z[left].mean())
+    assert np.allclose(model.predict(X)[~left], z[~left].mean())
+
+
+def test_uplift_gradient_boosting__n_jobs():
+    sequential = UpliftGradientBoosting(max_iter=5, random_state=0).fit(X, y, t).predict(X)
+    parallel = UpliftGradientBoosting(max_iter=5, random_state=0, n_jobs=2).fit(X, y, t).predict(X)
+    assert np.allclose(parallel, sequential)
+
+
+def test_uplift_gradient_boosting__early_stopping():
+    scores = iter([0.1, 0.3, 0.2, 0.3, 0.25, 0.4])
+    model = UpliftGradientBoosting(
+        max_iter=100,
+        early_stopping=True,
+        n_iter_no_change=3,
+        scoring=lambda y, t, uplift: next(scores),
+        random_state=0
+    )
+    model.fit(X, y, t)
+    assert model.validation_scores_ == [0.1, 0.3, 0.2, 0.3, 0.25]
+    assert model.n_iter_ == 2
+
+
+def test_uplift_gradient_boosting__default_scoring():
+    model = UpliftGradientBoosting(max_iter=3, early_stopping=True, random_state=0).fit(X[:3000], y[:3000], t[:3000])
+    assert len(model.validation_scores_) == 3
+
+
+def test_uplift_gradient_boosting__cross_val_score():
+    scores = treatment_cross_val_score(X[:3000], y[:3000], t[:3000], UpliftGradientBoosting(max_iter=10), cv=2)
+    assert scores.shape == (2,)
+
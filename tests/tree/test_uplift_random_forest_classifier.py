@@ -0,0 +1,52 @@
+import os
+import pytest
+import numpy as np
+from pyuplift.tree import UpliftRandomForestClassifier
+from .base import *
+
+
+def test_uplift_random_forest_classifier__wrong_n_estimators():
+    with pytest.raises(ValueError):
+        UpliftRandomForestClassifier(n_estimators=0)
+
+
+def test_uplift_random_forest_classifier__wrong_tree_parameters():
+    with pytest.raises(ValueError):
+        UpliftRandomForestClassifier(criterion='gini')
+
+
+def test_uplift_random_forest_classifier__wrong_prefer():
+    with pytest.raises(ValueError):
+        UpliftRandomForestClassifier(prefer='gpu')
+
+
+def test_uplift_random_forest_classifier__finds_uplift():
+    model = UpliftRandomForestClassifier(n_estimators=5, max_depth=3, random_state=0).fit(X, y, t)
+    assert len(model.estimators_) == 5
+    uplift = model.predict(X)
+    assert uplift[X[:, 0] > 0.1].mean() > 0.2
+    assert abs(uplift[X[:, 0] < -0.1].mean()) < 0.05
+
+
+def test_uplift_random_forest_classifier__average_of_trees():
+    model = UpliftRandomForestClassifier(n_estimators=3, random_state=0).fit(X, y, t)
+    expected = np.mean([tree.predict(X) for tree in model.estimators_], axis=0)
+    assert np.allclose(model.predict(X), expected)
+    assert np.allclose(model.predict(X, chunk_size=999), expected)
+
+
+@pytest.mark.parametrize('prefer', ['threads', 'processes'])
+def test_uplift_random_forest_classifier__n_jobs(prefer):
+    sequential = UpliftRandomForestClassifier(n_estimators=4, random_state=0).fit(X, y, t).predict(X)
+    parallel = UpliftRandomForestClassifier(n_estimators=4, random_state=0, n_jobs=2, prefer=prefer).fit(X, y, t)
+    assert np.array_equal(parallel.predict(X), sequential)
+
+
+def test_uplift_random_forest_classifier__temp_folder(tmpdir):
+    UpliftRandomForestClassifier(n_estimators=2, temp_folder=str(tmpdir)).fit(X, y, t)
+    assert os.listdir(str(tmpdir)) == []
+
+
+def test_uplift_random_forest_classifier__no_bootstrap():
+    model = UpliftRandomForestClassifier(n_estimators=2, max_features=None, bootstrap=False, random_state=0).fit(X, y, t)
+    assert np.array_equal(model.estimators_[0].predict(X), model.estimators_[1].predict(X))
@@ -0,0 +1,55 @@
+import pytest
+import numpy as np
+import scipy.sparse as sp
+from pyuplift.tree import UpliftTreeClassifier
+from .base import *
+
+
+def test_uplift_tree_classifier__wrong_criterion():
+    with pytest.raises(ValueError):
+        UpliftTreeClassifier(criterion='gini')
+
+
+def test_uplift_tree_classifier__wrong_min_samples_leaf():
+    with pytest.raises(ValueError):
+        UpliftTreeClassifier(min_samples_leaf=0)
+
+
+@pytest.mark.parametrize('criterion', ['kl', 'ed', 'chi'])
+def test_uplift_tree_classifier__finds_uplift(criterion):
+    model = UpliftTreeClassifier(criterion=criterion, max_depth=3).fit(X, y, t)
+    assert model.feature_[0] == 0
+    assert abs(model.threshold_[0]) < 0.1
+    uplift = model.predict(X)
+    assert uplift[X[:, 0] > 0.1].mean() > 0.25
+    assert abs(uplift[X[:, 0] < -0.1].mean()) < 0.05
+
+
+def test_uplift_tree_classifier__leaf_values():
+    model = UpliftTreeClassifier(max_depth=2).fit(X, y, t)
+    leaves = model.apply(X)
+    assert np.all(model.feature_[leaves] == -1)
+    for leaf in np.unique(leaves):
+        mask = leaves == leaf
+        expected = y[mask & (t == 1)].mean() - y[mask & (t == 0)].mean()
+        assert np.isclose(model.value_[leaf], expected)
+        assert mask.sum() >= model.min_samples_leaf
+
+
+def test_uplift_tree_classifier__max_depth():
+    model = UpliftTreeClassifier(max_depth=0).fit(X, y, t)
+    assert model.feature_.shape == (1,)
+    assert np.allclose(model.predict(X), y[t == 1].mean() - y[t == 0].mean())
+
+
+def test_uplift_tree_classifier__random_state():
+    first = UpliftTreeClassifier(max_features=1, random_state=42).fit(X, y, t).predict(X)
+    second = UpliftTreeClassifier(max_features=1, random_state=42).fit(X, y, t).predict(X)
+    assert np.array_equal(first, second)
+
+
+def test_uplift_tree_classifier__sparse_input():
+    model = UpliftTreeClassifier().fit(X, y, t)
+    for format in ['csr', 'csc']:
+        X_format = sp.csr_matrix(X).asformat(format)
+        assert np.array_equal(UpliftTreeClassifier().fit(X_format, y, t).predict(X_format), model.predict(X))
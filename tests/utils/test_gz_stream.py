@@ -0,0 +1,48 @@
+import gzip
+import threading
+import numpy as np
+import pandas as pd
+import pytest
+from pyuplift.utils import iter_gz_csv_chunks
+
+
+size = 1000
+df = pd.DataFrame({'a': np.arange(size) * 0.5, 'b': np.arange(size) % 3, 'c': np.arange(size) % 2})
+
+
+def write_archive(path):
+    with gzip.open(path, 'wt') as f:
+        df.to_csv(f, index=False)
+
+
+def test_iter_gz_csv_chunks(tmp_path):
+    path = str(tmp_path / 'data.csv.gz')
+    write_archive(path)
+    chunks = list(iter_gz_csv_chunks(path, chunk_size=300, buffer_size=64, max_buffers=2, dtype={'c': np.int8}))
+    assert [len(chunk) for chunk in chunks] == [300, 300, 300, 100]
+    result = pd.concat(chunks, ignore_index=True)
+    assert result['c'].dtype == np.int8
+    assert np.array_equal(result.values, df.values)
+
+
+def test_iter_gz_csv_chunks__early_stop(tmp_path):
+    path = str(tmp_path / 'data.csv.gz')
+    write_archive(path)
+    threads = threading.active_count()
+    chunks = iter_gz_csv_chunks(path, chunk_size=10, buffer_size=16, max_buffers=1)
+    assert len(next(chunks)) == 10
+    chunks.close()
+    assert threading.active_count() == threads
+
+
+def test_iter_gz_csv_chunks__broken_archive(tmp_path):
+    path = str(tmp_path / 'data.csv.gz')
+    with open(path, 'wb') as f:
+        f.write(b'not a gzip file')
+    with pytest.raises(OSError):
+        list(iter_gz_csv_chunks(path))
+
+
+def test_iter_gz_csv_chunks__wrong_chunk_size(tmp_path):
+    with pytest.raises(ValueError):
+        list(iter_gz_csv_chunks(str(tmp_path / 'data.csv.gz'), chunk_size=0))
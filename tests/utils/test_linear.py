@@ -0,0 +1,37 @@
+import numpy as np
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.linear_model import LinearRegression, LogisticRegression, RidgeClassifier, SGDRegressor
+from pyuplift.utils.linear import get_linear_coefficients
+
+
+X = np.arange(40, dtype=float).reshape((20, 2)) % 7
+y = X[:, 0] - 2 * X[:, 1]
+
+
+def test_get_linear_coefficients__linear_regression():
+    model = LinearRegression().fit(X, y)
+    assert np.allclose(get_linear_coefficients(model), [1, -2])
+
+
+def test_get_linear_coefficients__sgd_regressor():
+    model = SGDRegressor().fit(X, y)
+    assert get_linear_coefficients(model) is not None
+
+
+def test_get_linear_coefficients__not_fitted():
+    assert get_linear_coefficients(LinearRegression()) is None
+
+
+def test_get_linear_coefficients__classifiers():
+    labels = y > 0
+    assert get_linear_coefficients(LogisticRegression().fit(X, labels)) is None
+    assert get_linear_coefficients(RidgeClassifier().fit(X, labels)) is None
+
+
+def test_get_linear_coefficients__non_linear_model():
+    assert get_linear_coefficients(RandomForestRegressor(n_estimators=2).fit(X, y)) is None
+
+
+def test_get_linear_coefficients__multi_output():
+    model = LinearRegression().fit(X, np.vstack([y, y]).T)
+    assert get_linear_coefficients(model) is None
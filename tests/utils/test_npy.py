@@ -0,0 +1,33 @@
+import os
+import numpy as np
+import pytest
+from pyuplift.utils import NpyWriter
+
+
+def test_npy_writer__blocks(tmp_path):
+    path = str(tmp_path / 'data.npy')
+    X = np.arange(30, dtype=float).reshape((10, 3))
+    with NpyWriter(path, np.float32, 3) as writer:
+        assert not os.path.exists(path)
+        writer.write(X[:4])
+        writer.write(X[4:])
+    loaded = np.load(path, mmap_mode='r')
+    assert loaded.dtype == np.float32
+    assert np.array_equal(loaded, X)
+
+
+def test_npy_writer__vector(tmp_path):
+    path = str(tmp_path / 'data.npy')
+    with NpyWriter(path, np.int8) as writer:
+        writer.write(np.array([1, 0, 1]))
+        writer.write(np.array([], dtype=int))
+    assert np.array_equal(np.load(path), [1, 0, 1])
+
+
+def test_npy_writer__wrong_shape(tmp_path):
+    path = str(tmp_path / 'data.npy')
+    with pytest.raises(ValueError):
+        with NpyWriter(path, np.float32, 3) as writer:
+            writer.write(np.zeros((2, 2)))
+    # An interrupted writing leaves no file
+    assert os.listdir(str(tmp_path)) == []
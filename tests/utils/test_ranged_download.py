@@ -0,0 +1,232 @@
+import os
+import re
+import hashlib
+import threading
+import socketserver
+from http.server import BaseHTTPRequestHandler, HTTPServer
+import pytest
+from pyuplift.utils import download_file
+
+DATA = bytes(range(256)) * 4000 + b'tail'
+
+
+class RangeHandler(BaseHTTPRequestHandler):
+    """Serves DATA at /data with Range requests, /nocut without them, the first request to /broken is cut,
+    the Range responses of /short are cut without an error because they have no Content-Length."""
+
+    def log_message(self, *args):
+        pass
+
+    def do_HEAD(self):
+        self.__respond(send_body=False)
+
+    def do_GET(self):
+        self.__respond(send_body=True)
+
+    def __respond(self, send_body):
+        self.server.requests.append((self.command, self.path, self.headers.get('Range')))
+        if self.path not in ('/data', '/nocut', '/broken', '/short'):
+            self.send_error(404)
+            return
+        start, end = 0, len(DATA)
+        match = re.match(r'bytes=(\d+)-(\d*)', self.headers.get('Range') or '')
+        if match and self.path != '/nocut':
+            start = int(match.group(1))
+            end = int(match.group(2)) + 1 if match.group(2) else len(DATA)
+            if start >= len(DATA):
+                self.send_response(416)
+                self.send_header('Content-Range', 'bytes */{}'.format(len(DATA)))
+                self.send_header('Content-Length', '0')
+                self.end_headers()
+                return
+            self.send_response(206)
+            self.send_header('Content-Range', 'bytes {}-{}/{}'.format(start, end - 1, len(DATA)))
+        else:
+            self.send_response(200)
+        if self.path != '/nocut':
+            self.send_header('Accept-Ranges', 'bytes')
+        if self.path != '/short' or not send_body:
+            self.send_header('Content-Length', str(end - start))
+        self.end_headers()
+        if not send_body:
+            return
+        body = DATA[start:end]
+        if self.path == '/broken' and self.server.cut:
+            self.server.cut = False
+            body = body[:len(body) // 3]
+            self.close_connection = True
+        if self.path == '/short':
+            body = body[:len(body) // 2]
+        self.wfile.write(body)
+
+
+class ThreadingServer(socketserver.ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingServer(('127.0.0.1', 0), RangeHandler)
+    httpd.requests = []
+    httpd.cut = True
+    thread = threading.Thread(target=httpd.serve_forever, args=(0.01,), daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def get_url(server, path):
+    return 'http://127.0.0.1:{}{}'.format(server.server_address[1], path)
+
+
+def read(path):
+    with open(path, 'rb') as file:
+        return file.read()
+
+
+def test_download_file__stream(server, tmp_path):
+    output = str(tmp_path / 'data.bin')
+    download_file(get_url(server, '/data'), output, chunk_size=1000, verbose=False)
+    assert read(output) == DATA
+    assert not os.path.exists(output + '.part')
+
+
+def test_download_file__overwrite(server, tmp_path):
+    output = str(tmp_path / 'data.bin')
+    with open(output, 'w') as file:
+        file.write('test')
+    download_file(get_url(server, '/data'), output, verbose=False)
+    assert read(output) == DATA
+
+
+def test_download_file__resume(server, tmp_path):
+    output = str(tmp_path / 'data.bin')
+    with pytest.raises(Exception):
+        download_file(get_url(server, '/broken'), output, chunk_size=1000, verbose=False)
+    assert not os.path.exists(output)
+    part_size = os.path.getsize(output + '.part')
+    assert 0 < part_size < len(DATA)
+
+    download_file(get_url(server, '/broken'), output, verbose=False)
+    assert read(output) == DATA
+    assert server.requests[-1] == ('GET', '/broken', 'bytes={}-'.format(part_size))
+
+
+def test_download_file__resume_complete_part(server, tmp_path):
+    output = str(tmp_path / 'data.bin')
+    with open(output + '.part', 'wb') as file:
+        file.write(DATA)
+    download_file(get_url(server, '/data'), output, verbose=False)
+    assert read(output) == DATA
+
+
+def test_download_file__resume_wrong_part(server, tmp_path):
+    output = str(tmp_path / 'data.bin')
+    with open(output + '.part', 'wb') as file:
+        file.write(DATA + b'garbage')
+    with pytest.raises(Exception, match='expected {}'.format(len(DATA))):
+        download_file(get_url(server, '/data'), output, verbose=False)
+    assert not os.path.exists(output)
+    assert os.path.getsize(output + '.part') == len(DATA) + 7
+
+
+def test_download_file__short_read(server, tmp_path):
+    output = str(tmp_path / 'data.bin')
+    with open(output + '.part', 'wb') as file:
+        file.write(DATA[:100])
+    with pytest.raises(Exception, match='expected {}'.format(len(DATA))):
+        download_file(get_url(server, '/short'), output, verbose=False)
+    assert not os.path.exists(output)
+    part_size = os.path.getsize(output + '.part')
+    assert part_size == 100 + (len(DATA) - 100) // 2
+
+    # The next call continues from the part file
+    with pytest.raises(Exception):
+        download_file(get_url(server, '/short'), output, verbose=False)
+    assert server.requests[-1] == ('GET', '/short', 'bytes={}-'.format(part_size))
+
+
+def test_download_file__segments_short_read(server, tmp_path):
+    output = str(tmp_path / 'data.bin')
+    with pytest.raises(Exception, match='expected'):
+        download_file(get_url(server, '/short'), output, n_segments=2, verbose=False)
+    assert not os.path.exists(output)
+    assert sorted(os.listdir(str(tmp_path))) == ['data.bin.part0', 'data.bin.part1']
+
+
+def test_download_file__no_resume(server, tmp_path):
+    output = str(tmp_path / 'data.bin')
+    with open(output + '.part', 'wb') as file:
+        file.write(b'garbage')
+    download_file(get_url(server, '/data'), output, resume=False, verbose=False)
+    assert read(output) == DATA
+    assert server.requests[-1] == ('GET', '/data', None)
+
+
+def test_download_file__server_without_range(server, tmp_path):
+    output = str(tmp_path / 'data.bin')
+    with open(output + '.part', 'wb') as file:
+        file.write(DATA[:100])
+    download_file(get_url(server, '/nocut'), output, n_segments=4, verbose=False)
+    assert read(output) == DATA
+
+
+@pytest.mark.parametrize('n_segments', [2, 3, 7])
+def test_download_file__segments(server, tmp_path, n_segments):
+    output = str(tmp_path / 'data.bin')
+    download_file(get_url(server, '/data'), output, n_segments=n_segments, chunk_size=4096, verbose=False)
+    assert read(output) == DATA
+    ranges = [r for method, _, r in server.requests if method == 'GET']
+    assert len(ranges) == n_segments
+    assert os.listdir(str(tmp_path)) == ['data.bin']
+
+
+def test_download_file__segments_resume(server, tmp_path):
+    output = str(tmp_path / 'data.bin')
+    half = len(DATA) // 2
+    with open(output + '.part0', 'wb') as file:
+        file.write(DATA[:half])
+    with open(output + '.part1', 'wb') as file:
+        file.write(DATA[half:half + 10])
+    download_file(get_url(server, '/data'), output, n_segments=2, verbose=False)
+    assert read(output) == DATA
+    assert [r for method, _, r in server.requests if method == 'GET'] == ['bytes={}-{}'.format(half + 10, len(DATA) - 1)]
+
+
+def test_download_file__checksum(server, tmp_path):
+    output = str(tmp_path / 'data.bin')
+    download_file(get_url(server, '/data'), output, sha256=hashlib.sha256(DATA).hexdigest().upper(), verbose=False)
+    assert read(output) == DATA
+
+
+def test_download_file__wrong_checksum(server, tmp_path):
+    output = str(tmp_path / 'data.bin')
+    with pytest.raises(ValueError):
+        download_file(get_url(server, '/data'), output, sha256=hashlib.sha256(b'other').hexdigest(), verbose=False)
+    assert os.listdir(str(tmp_path)) == []
+
+
+def test_download_file__progress(server, tmp_path, capsys):
+    output = str(tmp_path / 'data.bin')
+    download_file(get_url(server, '/data'), output)
+    line = capsys.readouterr().out.split('\r')[-1]
+    assert '100%' in line and 'MB/s' in line
+
+
+@pytest.mark.parametrize('n_segments', [1, 2])
+def test_download_file__not_found(server, tmp_path, n_segments):
+    with pytest.raises(Exception, match='Wrong URL'):
+        download_file(get_url(server, '/missing'), str(tmp_path / 'data.bin'), n_segments=n_segments, verbose=False)
+
+
+def test_download_file__wrong_output_path(server, tmp_path):
+    with pytest.raises(FileNotFoundError):
+        download_file(get_url(server, '/data'), str(tmp_path / 'missing' / 'data.bin'), verbose=False)
+
+
+def test_download_file__wrong_params(tmp_path):
+    with pytest.raises(ValueError):
+        download_file('http://127.0.0.1/data', str(tmp_path / 'data.bin'), n_segments=0)
+    with pytest.raises(ValueError):
+        download_file('http://127.0.0.1/data', str(tmp_path / 'data.bin'), chunk_size=0)
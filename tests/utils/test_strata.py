@@ -0,0 +1,49 @@
+import pytest
+import numpy as np
+from pyuplift.utils.strata import allocate_strata, get_strata
+
+
+def test_get_strata():
+    y = np.array([0, 1, 0, 2, 0, 0])
+    t = np.array([5, 5, 3, 3, 9, 3])
+    assert np.array_equal(get_strata(y, t), [2, 3, 0, 1, 4, 0])
+
+
+def test_get_strata__shared_codes():
+    treatments = {}
+    first = get_strata(np.array([0, 1]), np.array(['b', 'a'], dtype=object), treatments)
+    second = get_strata(np.array([1, 0]), np.array(['c', 'b'], dtype=object), treatments)
+    assert np.array_equal(first, [2, 1])
+    assert np.array_equal(second, [5, 2])
+    assert treatments == {'a': 0, 'b': 1, 'c': 2}
+
+
+def test_get_strata__large_integer_range():
+    t = np.array([0, 10 ** 9, 0])
+    assert np.array_equal(get_strata(np.array([1, 0, 0]), t), [1, 2, 0])
+
+
+@pytest.mark.parametrize('counts, n_samples, expected', [
+    ([10, 20, 30, 40], 10, [1, 2, 3, 4]),
+    ([15, 15, 70], 10, [2, 1, 7]),
+    ([0, 5, 5], 3, [0, 2, 1]),
+])
+def test_allocate_strata(counts, n_samples, expected):
+    assert np.array_equal(allocate_strata(counts, n_samples), expected)
+
+
+@pytest.mark.parametrize('counts, n_samples, expected', [
+    ([1, 1000, 1, 0], 4, [1, 2, 1, 0]),
+    ([1, 1, 1, 1000], 4, [1, 1, 1, 1]),
+    ([1, 998, 1], 100, [1, 98, 1]),
+    ([10, 20, 30, 40], 10, [1, 2, 3, 4]),
+])
+def test_allocate_strata__at_least_one(counts, n_samples, expected):
+    sizes = allocate_strata(counts, n_samples, at_least_one=True)
+    assert np.array_equal(sizes, expected)
+
+
+def test_allocate_strata__too_few_samples():
+    with pytest.raises(ValueError):
+        allocate_strata([1, 1000, 1, 0], 2, at_least_one=True)
+    assert allocate_strata([1, 1000, 1, 0], 2).sum() == 2
@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import SGDClassifier
+from pyuplift.transformation import Kane
+from pyuplift.utils import iter_array_chunks, iter_csv_chunks, partial_fit_by_chunks
+
+
+size = 1000
+X = np.arange(size * 3, dtype=float).reshape((size, 3))
+y = np.arange(size) % 2
+t = (np.arange(size) // 2) % 2
+# The logistic loss is called 'log' before scikit-learn 1.1
+LOG_LOSS = 'log_loss' if 'log_loss' in SGDClassifier.loss_functions else 'log'
+
+
+def test_iter_array_chunks():
+    chunks = list(iter_array_chunks(X, y, t, chunk_size=300))
+    assert [c[0].shape[0] for c in chunks] == [300, 300, 300, 100]
+    assert np.array_equal(np.vstack([c[0] for c in chunks]), X)
+    assert np.array_equal(np.concatenate([c[2] for c in chunks]), t)
+
+
+def test_iter_array_chunks__wrong_chunk_size():
+    with pytest.raises(ValueError):
+        list(iter_array_chunks(X, y, t, chunk_size=0))
+
+
+def test_iter_csv_chunks(tmp_path):
+    path = str(tmp_path / 'data.csv')
+    pd.DataFrame({'a': X[:, 0], 'b': X[:, 1], 'c': X[:, 2], 'y': y, 't': t}).to_csv(path, index=False)
+    chunks = list(iter_csv_chunks(path, 'y', 't', feature_names=['c', 'a'], chunk_size=400))
+    assert len(chunks) == 3
+    assert chunks[0][0].dtype == np.float32
+    assert np.array_equal(np.vstack([c[0] for c in chunks]), X[:, [2, 0]])
+    assert np.array_equal(np.concatenate([c[1] for c in chunks]), y)
+
+
+def test_partial_fit_by_chunks():
+    model = Kane(SGDClassifier(loss=LOG_LOSS), use_weights=True)
+    partial_fit_by_chunks(model, iter_array_chunks(X, y, t, chunk_size=300))
+    _, counts = model.encode_response_groups(y, t)
+    assert np.array_equal(model.group_counts, counts)
+    assert model.predict(X).shape == (size,)
@@ -1,3 +1,7 @@
+import scipy.sparse as sp
+from pyuplift.datasets import make_linear_regression
+
+
 class EmptyClass:
     pass
 
@@ -10,3 +14,8 @@ class NoFitClass:
 class NoPredictClass:
     def fit(self):
         pass
+
+
+df = make_linear_regression(1000, random_state=123)
+X, y, t = df.drop(['y', 't'], axis=1).values, df['y'].values, df['t'].values
+X_sparse = sp.csr_matrix(X * (X > 0))
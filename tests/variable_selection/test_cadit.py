@@ -1,5 +1,7 @@
 import pytest
+import numpy as np
 from sklearn.ensemble import RandomForestRegressor
+from sklearn.linear_model import LinearRegression, SGDRegressor
 from pyuplift.variable_selection import Cadit
 from .base import *
 
@@ -25,3 +27,61 @@ def test_dummy__non_predict_class():
     reg_model = NoPredictClass()
     with pytest.raises(ValueError):
         Cadit(reg_model)
+
+
+def test_cadit__partial_fit():
+    model = Cadit(SGDRegressor())
+    model.partial_fit(X[:500], y[:500], t[:500])
+    model.partial_fit(X[500:], y[500:], t[500:])
+    assert model.n_samples == X.shape[0]
+    assert model.control_count == t[t == 0].shape[0]
+    assert np.isclose(model.y_sum, y.sum())
+
+
+def test_cadit__z_values():
+    model = Cadit(LinearRegression())
+    p_t0 = t[t == 0].shape[0] / t.shape[0]
+    expected = np.where(t == 0, -(y - y.mean()) / p_t0, (y - y.mean()) / (1 - p_t0))
+    assert np.allclose(model._Cadit__get_z_values(y, t, p_t0, y.mean()), expected)
+
+
+def test_cadit__float32():
+    model = Cadit(LinearRegression(), dtype=np.float32)
+    z = model._Cadit__get_z_values(y, t, 0.5, y.mean())
+    assert z.dtype == np.float32
+    model.fit(X, y, t)
+    assert np.allclose(model.predict(X), Cadit(LinearRegression()).fit(X, y, t).predict(X), atol=1e-4)
+
+
+def make_confounded_data(size=200000, random_state=0):
+    """The treatment depends on the features, the true uplift is 1 + X0."""
+    rng = np.random.RandomState(random_state)
+    X = rng.normal(size=(size, 2))
+    propensity = 1 / (1 + np.exp(-0.5 * (X[:, 0] + X[:, 1])))
+    t = (rng.uniform(size=size) < propensity).astype(int)
+    y = X[:, 0] + X[:, 1] + t * (1 + X[:, 0]) + rng.normal(size=size)
+    return X, y, t, propensity
+
+
+def test_cadit__randomized_uplift():
+    rng = np.random.RandomState(1)
+    X = rng.normal(size=(100000, 2))
+    t = rng.randint(0, 2, size=X.shape[0])
+    y = X[:, 1] + t * (1 + X[:, 0]) + rng.normal(size=X.shape[0])
+    model = Cadit(LinearRegression()).fit(X, y, t)
+    assert np.allclose(model.model.coef_, [1, 0], atol=0.1)
+    assert np.isclose(model.model.intercept_, 1, atol=0.1)
+
+
+def test_cadit__propensity():
+    X, y, t, propensity = make_confounded_data()
+    model = Cadit(LinearRegression()).fit(X, y, t, propensity)
+    assert np.allclose(model.model.coef_, [1, 0], atol=0.1)
+    assert np.isclose(model.model.intercept_, 1, atol=0.1)
+
+
+def test_cadit__wrong_propensity():
+    with pytest.raises(ValueError):
+        Cadit(LinearRegression()).fit(X, y, t, np.ones(t.shape[0]))
+    with pytest.raises(ValueError):
+        Cadit(LinearRegression()).fit(X, y, t, np.full(t.shape[0] - 1, 0.5))
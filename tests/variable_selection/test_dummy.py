@@ -1,5 +1,7 @@
 import pytest
+import numpy as np
 from sklearn.ensemble import RandomForestRegressor
+from sklearn.linear_model import LinearRegression, Ridge
 from pyuplift.variable_selection import Dummy
 from .base import *
 
@@ -25,3 +27,22 @@ def test_dummy__non_predict_class():
     reg_model = NoPredictClass()
     with pytest.raises(ValueError):
         Dummy(reg_model)
+
+
+def test_dummy__sparse_input():
+    dense_uplift = Dummy(Ridge(solver='sparse_cg', tol=1e-10)).fit(X_sparse.toarray(), y, t).predict(X_sparse.toarray())
+    for format in ['csr', 'csc']:
+        X_format = X_sparse.asformat(format)
+        uplift = Dummy(Ridge(solver='sparse_cg', tol=1e-10)).fit(X_format, y, t).predict(X_format)
+        assert np.allclose(uplift, dense_uplift)
+
+
+def test_dummy__linear_model_fast_predict():
+    model = Dummy(LinearRegression()).fit(X, y, t)
+    ones, zeros = np.ones((X.shape[0], 1)), np.zeros((X.shape[0], 1))
+    expected = model.model.predict(np.hstack([X, ones])) - model.model.predict(np.hstack([X, zeros]))
+
+    def fail(x):
+        raise AssertionError('The base model should not be called.')
+    model.model.predict = fail
+    assert np.allclose(model.predict(X), expected)
@@ -1,5 +1,8 @@
 import pytest
+import numpy as np
+import scipy.sparse as sp
 from sklearn.ensemble import RandomForestRegressor
+from sklearn.linear_model import LinearRegression, Ridge
 from pyuplift.variable_selection import Econometric
 from .base import *
 
@@ -25,3 +28,32 @@ def test_econometric__non_predict_class():
     reg_model = NoPredictClass()
     with pytest.raises(ValueError):
         Econometric(reg_model)
+
+
+def test_econometric__sparse_input():
+    dense_uplift = Econometric(Ridge(solver='sparse_cg', tol=1e-10)).fit(X_sparse.toarray(), y, t).predict(X_sparse.toarray())
+    for format in ['csr', 'csc']:
+        X_format = X_sparse.asformat(format)
+        uplift = Econometric(Ridge(solver='sparse_cg', tol=1e-10)).fit(X_format, y, t).predict(X_format)
+        assert np.allclose(uplift, dense_uplift)
+
+
+def test_econometric__sparse_matrix_is_not_densified():
+    model = Econometric(Ridge(solver='sparse_cg'))
+    captured = []
+    fit = model.model.fit
+    model.model.fit = lambda x, y: captured.append(x) or fit(x, y)
+    model.fit(X_sparse, y, t)
+    assert sp.issparse(captured[0])
+    assert captured[0].shape == (X.shape[0], 2 * X.shape[1] + 1)
+
+
+def test_econometric__linear_model_fast_predict():
+    model = Econometric(LinearRegression()).fit(X, y, t)
+    ones, zeros = np.ones((X.shape[0], 1)), np.zeros((X.shape[0], 1))
+    expected = model.model.predict(np.hstack([X, ones, X])) - model.model.predict(np.hstack([X, zeros, 0 * X]))
+
+    def fail(x):
+        raise AssertionError('The base model should not be called.')
+    model.model.predict = fail
+    assert np.allclose(model.predict(X), expected)
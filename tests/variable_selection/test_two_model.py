@@ -1,5 +1,7 @@
 import pytest
+import numpy as np
 from sklearn.ensemble import RandomForestRegressor
+from sklearn.linear_model import Ridge, SGDRegressor
 from pyuplift.variable_selection import TwoModel
 from .base import *
 
@@ -25,3 +27,45 @@ def test_two_model__non_predict_class():
     reg_model = NoPredictClass()
     with pytest.raises(ValueError):
         TwoModel(reg_model, reg_model)
+
+
+def test_two_model__partial_fit():
+    model = TwoModel(SGDRegressor(), SGDRegressor())
+    for start in range(0, X.shape[0], 300):
+        block = slice(start, start + 300)
+        model.partial_fit(X[block], y[block], t[block])
+    assert model.predict(X).shape == (X.shape[0],)
+
+
+def test_two_model__sparse_input():
+    dense_uplift = TwoModel(Ridge(solver='sparse_cg', tol=1e-10), Ridge(solver='sparse_cg', tol=1e-10)).fit(X_sparse.toarray(), y, t).predict(X_sparse.toarray())
+    for format in ['csr', 'csc', 'coo']:
+        X_format = X_sparse.asformat(format)
+        uplift = TwoModel(Ridge(solver='sparse_cg', tol=1e-10), Ridge(solver='sparse_cg', tol=1e-10)).fit(X_format, y, t).predict(X_format)
+        assert np.allclose(uplift, dense_uplift)
+
+
+def test_two_model__sparse_partial_fit():
+    csr_model = TwoModel(SGDRegressor(random_state=0), SGDRegressor(random_state=0))
+    csr_model.partial_fit(X_sparse.tocsr(), y, t)
+    model = TwoModel(SGDRegressor(random_state=0), SGDRegressor(random_state=0))
+    model.partial_fit(X_sparse.tocoo(), y, t)
+    assert np.allclose(model.predict(X_sparse.tocoo()), csr_model.predict(X_sparse.tocsr()))
+
+
+def test_two_model__same_model_instance():
+    reg_model = Ridge()
+    model = TwoModel(reg_model, reg_model)
+    assert model.no_treatment_model is not model.has_treatment_model
+
+
+def test_two_model__wrong_prefer():
+    with pytest.raises(ValueError):
+        TwoModel(Ridge(), Ridge(), prefer='fibers')
+
+
+def test_two_model__parallel():
+    expected = TwoModel(Ridge(), Ridge()).fit(X, y, t).predict(X)
+    for prefer in ['threads', 'processes']:
+        model = TwoModel(Ridge(), Ridge(), n_jobs=2, prefer=prefer).fit(X, y, t)
+        assert np.allclose(model.predict(X), expected)